@@ -0,0 +1,49 @@
+"""
+Benchmark the Azure glossary matcher on glossaries of increasing size.
+
+Texts of 5 to 30 words drawn from a 20k words vocabulary are matched against glossaries whose terms are taken from
+the same vocabulary, about a third of them made of two words.
+
+Usage:
+    python benchmarks/bench_glossary.py [--terms 300 3000 30000] [--texts 20000]
+"""
+
+import argparse
+import random
+import time
+
+from transctl.core.translators.glossary_matcher import GlossaryMatcher
+
+
+def bench(terms: int, texts: int) -> tuple[float, float]:
+    rng = random.Random(terms)
+    words: list[str] = ["".join(rng.choices("abcdefghijklmnop", k=rng.randint(3, 9))) for _ in range(20_000)]
+    singles: list[str] = rng.sample(words, min(len(words), terms - terms // 3))
+    pairs: list[str] = [" ".join(rng.sample(words, 2)) for _ in range(terms - len(singles))]
+    glossary: dict[str, str] = {term: term.upper() for term in singles + pairs}
+    corpus: list[str] = [" ".join(rng.choices(words, k=rng.randint(5, 30))) + "." for _ in range(texts)]
+
+    start = time.perf_counter()
+    matcher = GlossaryMatcher(glossary)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for text in corpus:
+        matcher.replace(text)
+    return build, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--terms", type=int, nargs="+", default=[300, 3_000, 30_000])
+    parser.add_argument("--texts", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'terms':>8} | {'build (ms)':>10} | {'match (s)':>10}")
+    for terms in args.terms:
+        build, match = bench(terms, args.texts)
+        print(f"{terms:>8,} | {build * 1000:>10.1f} | {match:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark HTML extraction with BeautifulSoup against the html.parser tokenizer used for large sources.
+
+Pages are made of nested sections of headings, paragraphs with inline markup and links, lists and scripts, written
+to a temporary file. Each extractor compiles the file into a template; both must find the same segments. The peak
+includes the template, which only holds the text runs for the tokenizer.
+
+Usage:
+    python benchmarks/bench_html_extract.py [--sizes 1 10 50]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from transctl.core.handlers.handle_html_translation import HtmlTranslationTranslationHandler
+from transctl.core.templates.html_stream import HtmlSlotParser
+from transctl.core.templates.slot_template import SlotTemplate, SpliceTemplate
+
+
+WORDS: list[str] = ["save", "cancel", "open", "file", "settings", "profile", "welcome", "back", "café", "{{name}}"]
+
+
+def page(size_mb: int) -> str:
+    rng = random.Random(size_mb)
+    parts: list[str] = ["<!DOCTYPE html>\n<html>\n<head><title>Bench</title><style>p { color: red; }</style></head>\n<body>\n"]
+    size: int = 0
+
+    def words() -> str:
+        return " ".join(rng.choices(WORDS, k=rng.randint(3, 15)))
+
+    while size < size_mb * 1_000_000:
+        section: str = (
+            f'<section class="s{rng.randint(0, 9)}">\n  <h2>{words()}</h2>\n'
+            f'  <div><p>{words()} <b>{words()}</b> &amp; <a href="/x?a=1&b=2">{words()}</a>.</p>\n'
+            f'    <ul><li>{words()}</li><li>{words()}<br>{words()}</li></ul></div>\n'
+            f'  <script>var data = {{"k": "{words()}"}};</script>\n</section>\n'
+        )
+        parts.append(section)
+        size += len(section)
+
+    parts.append("</body>\n</html>\n")
+    return "".join(parts)
+
+
+def bench(extract: Callable[[Path], SlotTemplate | SpliceTemplate], path: Path) -> tuple[float, float, SlotTemplate | SpliceTemplate]:
+    start = time.perf_counter()
+    template = extract(path)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    extract(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1_000_000, template
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 50], help="page sizes in MB")
+    args = parser.parse_args()
+
+    ignored: frozenset[str] = HtmlTranslationTranslationHandler.IGNORED_TAGS
+    def soup(path: Path) -> SlotTemplate:
+        return HtmlTranslationTranslationHandler._compile_template(path.read_text(encoding="utf-8"))
+
+    def tokens(path: Path) -> SpliceTemplate:
+        return HtmlSlotParser.compile(path, ignored)
+
+    extractors: dict[str, Callable[[Path], SlotTemplate | SpliceTemplate]] = {"soup": soup, "tokens": tokens}
+
+    print(f"{'size (MB)':>9} | {'extractor':>9} | {'time (s)':>8} | {'peak (MB)':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size_mb in args.sizes:
+            text: str = page(size_mb)
+            path: Path = Path(directory) / f"page_{size_mb}.html"
+            path.write_text(text, encoding="utf-8")
+
+            segments: list[list[str]] = []
+            for name, extract in extractors.items():
+                elapsed, peak, template = bench(extract, path)
+                segments.append(template.segments)
+                print(f"{len(text) / 1_000_000:>9.0f} | {name:>9} | {elapsed:>8.2f} | {peak:>9.0f}")
+
+            assert segments[0] == segments[1], "extractors found different segments"
+
+
+if __name__ == "__main__":
+    main()
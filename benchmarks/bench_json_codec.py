@@ -0,0 +1,72 @@
+"""
+Benchmark the JSON codecs on locale files of increasing size.
+
+Documents are nested objects of short UI strings, numbers and flags, like the locale files transctl translates. Each
+codec parses the document from bytes and serializes it back; the serialized bytes of both codecs are checked to be
+identical.
+
+Usage:
+    python benchmarks/bench_json_codec.py [--sizes 1 50 500]
+"""
+
+import argparse
+import json
+import random
+import time
+
+from transctl.utils.i_o import HAS_ORJSON, JsonCodec, OrjsonCodec
+
+
+WORDS: list[str] = ["save", "cancel", "open", "file", "settings", "profile", "welcome", "back", "überprüfen", "café", "{{name}}", "résumé"]
+
+
+def document(size_mb: int) -> bytes:
+    rng = random.Random(size_mb)
+    sections: dict[str, dict[str, object]] = {}
+    size: int = 0
+    while size < size_mb * 1_000_000:
+        section: dict[str, object] = {}
+        for i in range(200):
+            if i % 10 == 0:
+                section[f"limit_{i}"] = rng.randint(0, 10_000)
+            elif i % 25 == 1:
+                section[f"ratio_{i}"] = round(rng.random(), 3)
+            else:
+                section[f"label_{i}"] = " ".join(rng.choices(WORDS, k=rng.randint(2, 12))).capitalize() + "."
+        sections[f"section_{len(sections)}"] = section
+        size += len(json.dumps(section, ensure_ascii=False, indent=2))
+
+    return json.dumps(sections, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def bench(codec: JsonCodec, data: bytes) -> tuple[float, float, bytes]:
+    start = time.perf_counter()
+    parsed = codec.loads(data)
+    parse = time.perf_counter() - start
+
+    start = time.perf_counter()
+    out = codec.dumps(parsed)
+    return parse, time.perf_counter() - start, out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 50, 500], help="document sizes in MB")
+    args = parser.parse_args()
+
+    codecs: list[JsonCodec] = [JsonCodec()] + ([OrjsonCodec()] if HAS_ORJSON else [])
+    print(f"{'size (MB)':>9} | {'codec':>6} | {'parse (MB/s)':>12} | {'serialize (MB/s)':>16}")
+    for size_mb in args.sizes:
+        data: bytes = document(size_mb)
+        megabytes: float = len(data) / 1_000_000
+        outputs: list[bytes] = []
+        for codec in codecs:
+            parse, serialize, out = bench(codec, data)
+            outputs.append(out)
+            print(f"{megabytes:>9.0f} | {codec.name:>6} | {megabytes / parse:>12.1f} | {megabytes / serialize:>16.1f}")
+
+        assert all(out == data for out in outputs), "codecs wrote different bytes"
+
+
+if __name__ == "__main__":
+    main()
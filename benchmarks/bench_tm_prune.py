@@ -0,0 +1,69 @@
+"""
+Benchmark TMStore.prune on stores of increasing size.
+
+Each store is filled with rows whose last_used_at is spread over the last 400 days, then pruned with a
+180 days TTL and a max_rows limit set to evict 10% of the remaining rows.
+
+Usage:
+    python benchmarks/bench_tm_prune.py [--sizes 100000 1000000 5000000]
+"""
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from transctl.models.policies import PrunePolicy
+from transctl.models.tm_store import TMStore
+
+from sqlalchemy.orm import Session
+
+
+DAY: int = 24 * 3600
+
+
+def _fill(db_path: Path, size: int, now: int) -> None:
+    rng = random.Random(size)
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO tm (lang, hash_, translation, created_at, last_used_at) VALUES (?, ?, ?, ?, ?)",
+            (
+                ("fr", f"{i:064x}", f"translation {i}", now - 400 * DAY, now - rng.randrange(400 * DAY))
+                for i in range(size)
+            ),
+        )
+
+
+def bench(size: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "store.sqlite"
+        store = TMStore(db_path=str(db_path))
+        _fill(db_path, size, TMStore._now())
+
+        # Roughly 45% of the rows are older than the TTL; evict 10% of what remains on top of it.
+        policy = PrunePolicy(ttl_days=180, max_rows=int(size * 0.55 * 0.9), vacuum=False)
+
+        start = time.perf_counter()
+        with Session(store.engine) as session:
+            store.prune(session, policy)
+        elapsed = time.perf_counter() - start
+
+        assert store.engine is not None
+        store.engine.dispose()
+        return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000, 5_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} | {'prune (s)':>10}")
+    for size in args.sizes:
+        print(f"{size:>12,} | {bench(size):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
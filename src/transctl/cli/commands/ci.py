@@ -7,16 +7,20 @@ import click
 
 @click.command('ci', help='Run the translation process in CI mode.')
 @click.option("-g", "--glossary", help="Path to glossary file (JSON).", default="")
+@click.option("--coalesce", is_flag=True, help="Extract every resource first and translate segments project-wide, deduplicated per target language.")
+@click.option("--paranoid", is_flag=True, help="Re-hash every source and output instead of trusting unchanged file stats.")
+@click.option("-j", "--jobs", type=click.IntRange(min=1), default=None, help="Number of target languages translated concurrently.")
+@click.option("-p", "--processes", type=click.IntRange(min=1), default=None, help="Number of worker processes parsing source files.")
 @click.option("--no-pull-request", is_flag=True, help="Do not open a new pull request.")
 @click.pass_context
-def ci(ctx: click.Context, glossary: str, no_pull_request: bool) -> None:
+def ci(ctx: click.Context, glossary: str, coalesce: bool, paranoid: bool, jobs: int | None, processes: int | None, no_pull_request: bool) -> None:
     if ctx.invoked_subcommand is None:
         coordinator: TranslationCoordinator = TranslationCoordinator()
         changed_files: list[str]
         if glossary:
-            changed_files = coordinator.translate_from_config(glossary)
+            changed_files = coordinator.translate_from_config(glossary, coalesce=coalesce, paranoid=paranoid, jobs=jobs, processes=processes)
         else:
-            changed_files = coordinator.translate_from_config()
+            changed_files = coordinator.translate_from_config(coalesce=coalesce, paranoid=paranoid, jobs=jobs, processes=processes)
 
         runner: BaseRunner = CIRunnerFactory.get_runner()
         runner.run("Translations updated.", changed_files, no_pull_request)
@@ -6,10 +6,11 @@ import click
 
 @click.command("build", short_help="Build the cache manifest.")
 @click.option("--force", is_flag=True, help="Force rebuild of the cache manifest.")
+@click.option("--paranoid", is_flag=True, help="Re-hash every source and output instead of trusting unchanged file stats.")
 @click.pass_context
-def build_cache(ctx: click.Context, force: bool) -> None:
+def build_cache(ctx: click.Context, force: bool, paranoid: bool) -> None:
     if ctx.invoked_subcommand is None:
         cfg: ConfigurationManager = ConfigurationManager()
-        manifest: TranslationRunManifest = TranslationRunManifest(cfg)
+        manifest: TranslationRunManifest = TranslationRunManifest(cfg, paranoid=paranoid)
         manifest.rebuild_from_config(force=force)
         return
\ No newline at end of file
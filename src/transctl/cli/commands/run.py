@@ -5,14 +5,18 @@ import click
 
 @click.command('run', help='Run the translation process.')
 @click.option("-g", "--glossary", help="Path to glossary file (JSON).", default="")
+@click.option("--coalesce", is_flag=True, help="Extract every resource first and translate segments project-wide, deduplicated per target language.")
+@click.option("--paranoid", is_flag=True, help="Re-hash every source and output instead of trusting unchanged file stats.")
+@click.option("-j", "--jobs", type=click.IntRange(min=1), default=None, help="Number of target languages translated concurrently.")
+@click.option("-p", "--processes", type=click.IntRange(min=1), default=None, help="Number of worker processes parsing source files.")
 @click.pass_context
-def run(ctx: click.Context, glossary: str) -> list[str]:
+def run(ctx: click.Context, glossary: str, coalesce: bool, paranoid: bool, jobs: int | None, processes: int | None) -> list[str]:
     if ctx.invoked_subcommand is None:
         coordinator: TranslationCoordinator = TranslationCoordinator()
 
         if glossary:
-            return coordinator.translate_from_config(glossary)
+            return coordinator.translate_from_config(glossary, coalesce=coalesce, paranoid=paranoid, jobs=jobs, processes=processes)
         else:
-            return coordinator.translate_from_config()
+            return coordinator.translate_from_config(coalesce=coalesce, paranoid=paranoid, jobs=jobs, processes=processes)
 
     return []
@@ -0,0 +1,17 @@
+class TranslationError(RuntimeError):
+    pass
+
+
+class RetryableTranslationError(TranslationError):
+    """
+    A translator request that failed but may succeed if sent again.
+
+    Attributes:
+        retry_after (Optional[float]): The delay, in seconds, the provider asked to wait before retrying, if any.
+        throttled (bool): Whether the provider rejected the request because its rate limit was reached.
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None, throttled: bool = False) -> None:
+        super().__init__(message)
+        self.retry_after: float | None = retry_after
+        self.throttled: bool = throttled
@@ -0,0 +1,92 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Iterator, Sequence
+
+from transctl.core.handlers.base_translation_handler import BaseTranslationHandler
+from transctl.core.segment_protector import PreparedSegment, SegmentProtector
+from transctl.core.source_file import SourceFile
+
+
+ExtractedSource = tuple[Any, dict[str, PreparedSegment | None]]
+
+# Set once per worker process by the pool initializer.
+_worker_protector: SegmentProtector | None = None
+
+
+def _init_worker(protector: SegmentProtector) -> None:
+    global _worker_protector
+    _worker_protector = protector
+
+
+def _extract_in_worker(handler_type: type[BaseTranslationHandler[Any]], path: Path, stream_threshold: int | None) -> ExtractedSource:
+    if _worker_protector is None:
+        raise RuntimeError("Extraction worker was not initialized.")
+
+    document: Any = handler_type.extract(SourceFile(path, stream_threshold))
+    return document, _worker_protector.prepare_many(document.segments)
+
+
+class ExtractionPool:
+    """
+    Extracts source documents and prepares their segments (protection and TM keys), spreading the work across
+    worker processes.
+
+    Workers only parse: the translation memory, the translator and the manifest stay in the parent process, so
+    TM writes and manifest updates are never shared between processes. With a single process, extraction runs
+    inline and reuses the content the manifest already read.
+
+    At most ``WINDOW`` jobs per process are extracted ahead of the one being consumed, so extracted documents do not
+    pile up in the parent while it translates.
+
+    Attributes:
+        protector (SegmentProtector): The protector used to prepare segments.
+        processes (int): The number of worker processes.
+    """
+
+    # Jobs in flight per worker process.
+    WINDOW: int = 2
+
+    def __init__(self, protector: SegmentProtector, processes: int) -> None:
+        self.protector: SegmentProtector = protector
+        self.processes: int = processes
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "ExtractionPool":
+        if self.processes > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.processes, initializer=_init_worker, initargs=(self.protector,))
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def map(self, jobs: Sequence[tuple[type[BaseTranslationHandler[Any]], SourceFile]]) -> Iterator[ExtractedSource]:
+        """
+        Extracts every source, yielding results in job order as soon as they are available. Jobs are submitted as
+        results are consumed, at most ``WINDOW`` per process ahead.
+
+        Args:
+            jobs (Sequence[tuple[type[BaseTranslationHandler[Any]], SourceFile]]): The handler type and source of every file.
+
+        Returns:
+            Iterator[ExtractedSource]: The extracted document and prepared segments of every job, in job order.
+        """
+
+        if self._executor is None:
+            for handler_type, source in jobs:
+                document: Any = handler_type.extract(source)
+                yield document, self.protector.prepare_many(document.segments)
+            return
+
+        # Workers re-read sources from disk rather than receiving their content through a pipe.
+        window: deque[Future[ExtractedSource]] = deque()
+        for handler_type, source in jobs:
+            if len(window) >= self.processes * self.WINDOW:
+                yield window.popleft().result()
+            window.append(self._executor.submit(_extract_in_worker, handler_type, source.path, source.stream_threshold))
+
+        while window:
+            yield window.popleft().result()
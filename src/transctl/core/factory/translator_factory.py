@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Callable, TypeAlias
 
 from transctl.core.translators.azure_translator import AzureTranslator
@@ -6,7 +7,7 @@ from transctl.core.translators.deepl_translator import DeepLTranslator
 from transctl.models.engine_config import Engine, EngineConfig
 
 
-TranslatorCtor: TypeAlias = Callable[[EngineConfig], BaseTranslator]
+TranslatorCtor: TypeAlias = Callable[[EngineConfig, Path | None], BaseTranslator]
 
 
 class TranslatorFactory:
@@ -16,12 +17,13 @@ class TranslatorFactory:
     }
 
     @staticmethod
-    def get_translator(engine_config: EngineConfig) -> BaseTranslator:
+    def get_translator(engine_config: EngineConfig, working_dir: Path | None = None) -> BaseTranslator:
         """
         Creates an instance of a translator based on the provided engine configuration.
 
         Args:
             engine_config (EngineConfig): The engine configuration.
+            working_dir (Optional[Path]): The directory translators persist provider state in (e.g. glossary IDs).
 
         Returns:
             An instance of BaseTranslator corresponding for the specified provider.
@@ -30,4 +32,4 @@ class TranslatorFactory:
         ctor: TranslatorCtor | None = TranslatorFactory.translator_mapping.get(engine_config.provider)
         if ctor is None:
             raise ValueError(f"Unsupported provider: {engine_config.provider}")
-        return ctor(engine_config)
+        return ctor(engine_config, working_dir)
@@ -0,0 +1,123 @@
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, TypeVar
+
+from transctl.core.translators.glossary_matcher import GlossaryMatcher
+from transctl.utils.i_o import load_json
+from transctl.utils.utils_suit import compute_hash
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, eq=False)
+class Glossary:
+    """
+    A validated glossary, loaded once per run and shared by every handler and translator.
+
+    Engines compile the glossary into the structures they need (see :meth:`compiled`) the first time they use it, and
+    reuse them for every later file and request.
+
+    Attributes:
+        entries (Mapping[str, str]): The read-only mapping of source term to translation.
+        digest (str): A hash of the entries, identifying the glossary content.
+    """
+
+    entries: Mapping[str, str]
+    digest: str
+    _compiled: dict[str, Any] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def from_entries(cls, entries: Mapping[Any, Any]) -> "Glossary":
+        """
+        Validates glossary entries.
+
+        Args:
+            entries (Mapping[Any, Any]): The mapping of source term to translation.
+
+        Returns:
+            Glossary: The glossary.
+
+        Raises:
+            ValueError: if a term or translation is not a non-empty string.
+        """
+
+        for term, translation in entries.items():
+            if not isinstance(term, str) or not isinstance(translation, str) or not term.strip() or not translation.strip():
+                raise ValueError(f"Invalid glossary entry {term!r}: terms and translations must be non-empty strings.")
+
+        frozen: dict[str, str] = dict(entries)
+        digest: str = compute_hash(json.dumps(sorted(frozen.items()), ensure_ascii=False))
+        return cls(entries=MappingProxyType(frozen), digest=digest)
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "Glossary":
+        """
+        Loads and validates a glossary file (JSON object of source term to translation).
+
+        Args:
+            path (str | Path): The glossary file.
+
+        Returns:
+            Glossary: The glossary.
+        """
+
+        return cls.from_entries(load_json(path))
+
+    def signature(self, text: str) -> str:
+        """
+        Returns the signature of the glossary entries whose term occurs in a text (case-insensitively, on whole words).
+
+        The signature changes when a term of the text is added to the glossary, removed from it, or translated
+        differently, and only then, so translations of the text can be reused across glossary edits that do not
+        concern it.
+
+        Args:
+            text (str): The source text.
+
+        Returns:
+            str: A hash of the matching entries, or an empty string if no term occurs in the text.
+        """
+
+        if not self.entries:
+            return ""
+
+        matcher, entries_by_term = self.compiled("signature", _build_term_index)
+        found: list[str] = matcher.find(text.casefold())
+        if not found:
+            return ""
+
+        pairs: list[tuple[str, str]] = sorted({pair for term in found for pair in entries_by_term[term]})
+        return compute_hash(json.dumps(pairs, ensure_ascii=False))
+
+    def compiled(self, name: str, build: Callable[["Glossary"], T]) -> T:
+        """
+        Returns a structure compiled from the glossary, building it on first use.
+
+        Args:
+            name (str): The name of the structure, unique per engine and settings.
+            build (Callable[[Glossary], T]): Builds the structure.
+
+        Returns:
+            T: The compiled structure.
+        """
+
+        with self._lock:
+            if name not in self._compiled:
+                self._compiled[name] = build(self)
+
+            compiled: T = self._compiled[name]
+            return compiled
+
+
+def _build_term_index(glossary: Glossary) -> tuple[GlossaryMatcher, dict[str, list[tuple[str, str]]]]:
+    # Terms are matched case-insensitively; the entries sharing a case-folded term are signed together.
+    entries_by_term: dict[str, list[tuple[str, str]]] = {}
+    for term, translation in glossary.entries.items():
+        entries_by_term.setdefault(term.casefold(), []).append((term, translation))
+
+    return GlossaryMatcher({term: term for term in entries_by_term}), entries_by_term
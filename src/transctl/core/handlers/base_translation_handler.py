@@ -1,45 +1,218 @@
 import logging
-import re
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Generic, Mapping, Protocol, TypeVar
 
+from transctl.console_formater import ConsoleFormatter
 from transctl.core.configuration_manager import ConfigurationManager
 from transctl.core.constants.supported_languages import SUPPORTED_LANGUAGES
-from transctl.core.factory.translator_factory import TranslatorFactory
+from transctl.core.glossary import Glossary
+from transctl.core.segment_protector import PreparedSegment
+from transctl.core.segment_resolver import SegmentResolver
+from transctl.core.segment_table import SegmentTable
+from transctl.core.source_file import SourceFile
 from transctl.core.translation_run_manifest import TranslationRunManifest
 from transctl.core.translators.base_translator import BaseTranslator
 from transctl.models.app_config import AppConfig
 from transctl.models.engine_config import EngineConfig
-from transctl.models.policies import PrunePolicy
 from transctl.models.tm_store import TMStore
+from transctl.utils.utils_suit import sanitize_path
 
 from sqlalchemy.orm import Session
 
 
-class BaseTranslationHandler(ABC):
-    def __init__(self, config: AppConfig, cfg: ConfigurationManager) -> None:
+class ExtractedDocument(Protocol):
+    """
+    A source file parsed into its translatable segments, in document order.
+    """
+
+    @property
+    def segments(self) -> list[str]: ...
+
+
+TDocument = TypeVar("TDocument", bound=ExtractedDocument)
+
+
+class BaseTranslationHandler(ABC, Generic[TDocument]):
+    """
+    Base class of the per resource type translation handlers.
+
+    The TM store and the translator are owned by the caller and shared by every handler of a run, so adding
+    resource types does not add database engines or translation clients.
+    """
+
+    def __init__(self, config: AppConfig, cfg: ConfigurationManager, store: TMStore, translator: BaseTranslator) -> None:
         self.engine: EngineConfig = config.engine
         self.manifest: TranslationRunManifest | None = None
         self.logger: logging.Logger = logging.getLogger(__name__)
         self.extension: str = ""
         self.languages: list[str] = config.targets
-        self.translator: BaseTranslator = TranslatorFactory.get_translator(config.engine)
+        self.translator: BaseTranslator = translator
 
         if config.source not in SUPPORTED_LANGUAGES:
             raise ValueError(f'Source language {config.source} is not supported.')
 
         self.source_language = config.source
-        self.store: TMStore = TMStore(db_path=str(cfg.get_store_path()))
-        self._pruning_policy: PrunePolicy = PrunePolicy()
+        self.stream_threshold: int | None = config.performance.stream_threshold
+        self.store: TMStore = store
+        self.resolver: SegmentResolver = SegmentResolver(config, self.translator, self.store)
+
+    @classmethod
+    @abstractmethod
+    def extract(cls, source: SourceFile) -> TDocument:
+        """
+        Parses a source file into its translatable segments. Extraction only depends on the source, so it can run
+        in a worker process.
 
-        self.placeholder_regex: re.Pattern[str] = re.compile(r"\{\{.*?\}\}")
-        self.email_regex: re.Pattern[str] = re.compile(r"\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b", re.IGNORECASE)
-        self.url_regex: re.Pattern[str] = re.compile(r"\bhttps?://[^\s<>()]+", re.IGNORECASE)
+        Args:
+            source (SourceFile): The source file, whose content is read and parsed at most once.
+
+        Returns:
+            TDocument: The parsed document, reusable to render every target.
+        """
+        pass
 
     @abstractmethod
-    def translate_file(self, file_path: Path, output_path: Path, glossary: Path | None = None, output_path_tag: str | None = None) -> list[str]:
+    def write_output(self, document: TDocument, translations: list[str], out_path: Path) -> None:
+        """
+        Renders a translated document and writes it to disk.
+
+        Args:
+            document (TDocument): The document returned by :meth:`extract`.
+            translations (list[str]): The translation of every segment, in document order.
+            out_path (Path): The output file.
+        """
         pass
 
-    def prune_store(self) -> None:
+    def check_extension(self, file_path: Path) -> None:
+        if file_path.suffix != self.extension:
+            raise ValueError(f"File {file_path} does not have the expected extension {self.extension}")
+
+    def pending_outputs(self, output_path: Path, output_path_tag: str | None = None) -> list[tuple[str, Path]]:
+        """
+        Lists the target outputs of the currently bound source that are missing or outdated.
+
+        Args:
+            output_path (Path): The output path pattern.
+            output_path_tag (Optional[str]): The tag replaced by the target language in the output path.
+
+        Returns:
+            list[tuple[str, Path]]: The (target, output path) pairs that need translating.
+        """
+
+        if self.manifest is None:
+            raise ValueError("No translation manifest bound to the handler.")
+
+        pending: list[tuple[str, Path]] = []
+        for target in self.languages:
+            if target == self.source_language:
+                continue
+
+            out_path: Path = output_path
+            if output_path_tag is not None:
+                out_path = Path(sanitize_path(str(out_path), output_path_tag, target))
+
+            if self.manifest.is_output_valid(out_path):
+                self.logger.info(ConsoleFormatter.success(f"[{self.source_language} - {target}] Localization done."))
+                continue
+
+            self.manifest.update_required = True
+            pending.append((target, out_path))
+
+        return pending
+
+    def write_target(self, target: str, document: TDocument, translations: dict[str, str], out_path: Path) -> bool:
+        """
+        Writes the output of a target language if every segment of the document was translated.
+
+        Args:
+            target (str): The target language code.
+            document (TDocument): The document returned by :meth:`extract`.
+            translations (dict[str, str]): A mapping of source segment to translation.
+            out_path (Path): The output file.
+
+        Returns:
+            bool: True if the output was written, False otherwise.
+        """
+
+        missing: int = sum(1 for s in document.segments if s not in translations)
+        if missing:
+            self.logger.error(ConsoleFormatter.error(
+                f"[{self.source_language} - {target}] {missing} segment(s) could not be translated. Skipping {out_path}."))
+            return False
+
+        self.write_output(document, [translations[s] for s in document.segments], out_path)
+        if self.manifest is not None:
+            self.manifest.record_output(out_path)
+        self.logger.info(ConsoleFormatter.success(f"[{self.source_language} - {target}] Localization done."))
+        return True
+
+    def translate_document(self, session: Session, document: TDocument, pending: list[tuple[str, Path]],
+                           glossary: Glossary | None = None,
+                           prepared: Mapping[str, PreparedSegment | None] | None = None) -> list[str]:
+        """
+        Translates an extracted document into every pending target and writes the outputs.
+
+        Args:
+            session (Session): An active SQLAlchemy session.
+            document (TDocument): The document returned by :meth:`extract`.
+            pending (list[tuple[str, Path]]): The (target, output path) pairs returned by :meth:`pending_outputs`.
+            glossary (Optional[Glossary]): The glossary to apply, if any.
+            prepared (Optional[Mapping[str, Optional[PreparedSegment]]]): The document's segments already prepared
+                                                                          by the protector, if any.
+
+        Returns:
+            list[str]: The paths of the written outputs.
+        """
+
+        for target, _ in pending:
+            self.logger.info(ConsoleFormatter.info(f"[{self.source_language} - {target}] Localization in progress..."))
+
+        # Segments are prepared once for every target. Targets are translated concurrently, outputs are written in
+        # configuration order.
+        table: SegmentTable = self.resolver.table(document.segments, glossary, prepared)
+        translations: dict[str, dict[str, str]] = self.resolver.resolve_many(session, [(target, table) for target, _ in pending], glossary)
+
+        written: list[str] = []
+        for target, out_path in pending:
+            if self.write_target(target, document, translations[target], out_path):
+                written.append(str(out_path))
+
+        return written
+
+    def translate_pending(self, session: Session, source: SourceFile, pending: list[tuple[str, Path]],
+                          glossary: Glossary | None = None) -> list[str]:
+        """
+        Translates a bound source into every pending target and writes the outputs.
+
+        Args:
+            session (Session): An active SQLAlchemy session.
+            source (SourceFile): The source file.
+            pending (list[tuple[str, Path]]): The (target, output path) pairs returned by :meth:`pending_outputs`.
+            glossary (Optional[Glossary]): The glossary to apply, if any.
+
+        Returns:
+            list[str]: The paths of the written outputs.
+        """
+
+        return self.translate_document(session, self.extract(source), pending, glossary)
+
+    def translate_file(self, file_path: Path, output_path: Path, glossary: Glossary | None = None, output_path_tag: str | None = None) -> list[str]:
+        self.logger.info(ConsoleFormatter.info(f"Processing path: {file_path}"))
+        result_write_paths: list[str] = []
+
+        self.check_extension(file_path)
+        if self.manifest is None:
+            raise ValueError("No translation manifest bound to the handler.")
+
+        source: SourceFile = SourceFile(file_path, self.stream_threshold)
+        self.manifest.bind_source(source, glossary.digest if glossary is not None else "")
+
         with Session(self.store.engine) as session:
-            self.store.prune(session, self._pruning_policy)
+            pending: list[tuple[str, Path]] = self.pending_outputs(output_path, output_path_tag)
+            if pending:
+                result_write_paths = self.translate_pending(session, source, pending, glossary)
+
+            session.commit()
+
+        return result_write_paths
@@ -1,29 +1,35 @@
-import re
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any
 
-from transctl.console_formater import ConsoleFormatter
 from transctl.core.configuration_manager import ConfigurationManager
 from transctl.core.handlers.base_translation_handler import BaseTranslationHandler
+from transctl.core.source_file import SourceFile
+from transctl.core.templates.html_stream import HtmlSlotParser
+from transctl.core.templates.slot_template import SlotTemplate, SpliceTemplate
 from transctl.core.translation_run_manifest import TranslationRunManifest
+from transctl.core.translators.base_translator import BaseTranslator
 from transctl.models.app_config import AppConfig
-from transctl.utils.i_o import load_json, read_html, write_file
-from transctl.utils.utils_suit import compute_hash, normalize_text, sanitize_path
+from transctl.models.tm_store import TMStore
+from transctl.utils.i_o import write_file
 
 from bs4 import BeautifulSoup
 from bs4.element import Comment, Doctype, NavigableString, PageElement
-from sqlalchemy.orm import Session
+from bs4.formatter import Formatter, HTMLFormatter
 
 
-class HtmlTranslationTranslationHandler(BaseTranslationHandler):
-    def __init__(self, cfg: ConfigurationManager, config: AppConfig, manifest: TranslationRunManifest) -> None:
-        super().__init__(config, cfg)
+class HtmlTranslationTranslationHandler(BaseTranslationHandler[SlotTemplate | SpliceTemplate]):
+    # Elements whose text is never translated.
+    IGNORED_TAGS: frozenset[str] = frozenset({"style", "script", "head", "title", "meta", "link", "noscript"})
+
+    def __init__(self, cfg: ConfigurationManager, config: AppConfig, manifest: TranslationRunManifest, store: TMStore,
+                 translator: BaseTranslator) -> None:
+        super().__init__(config, cfg, store, translator)
         self.extension = ".html"
         self.manifest: TranslationRunManifest = manifest
-        self._ignore: list[str] = ["style", "script", "head", "title", "meta", "link", "noscript"]
-        self.patterns: list[re.Pattern[str]] = [self.placeholder_regex, self.email_regex, self.url_regex]
+        self._formatter: Formatter = HTMLFormatter.REGISTRY["minimal"]
 
-    def _is_translatable_text(self, node: NavigableString) -> bool:
+    @classmethod
+    def _is_translatable_text(cls, node: NavigableString) -> bool:
         if isinstance(node, Doctype):
             return False
 
@@ -34,89 +40,51 @@ class HtmlTranslationTranslationHandler(BaseTranslationHandler):
             return False
 
         for p in node.parents:
-            if getattr(p, "name", None) in self._ignore:
+            if getattr(p, "name", None) in cls.IGNORED_TAGS:
                 return False
 
         return True
 
-    def translate_file(self, file_path: Path, output_path: Path, glossary: Path | None = None,
-                       output_path_tag: str | None = None) -> list[str]:
-
-        self.logger.info(ConsoleFormatter.info(f"Processing path: {file_path}"))
-        result_write_paths: list[str] = []
-
-        if file_path.suffix != self.extension:
-            raise ValueError(f"File {file_path} does not have the expected extension {self.extension}")
-
-        glossary_content: dict[str, str] | None = None
-        if glossary:
-            glossary_content = load_json(glossary)
-
-        file_content: str = read_html(file_path)
-        self.manifest.bind_source(file_path)
-
-        with Session(self.store.engine) as session:
-            for target in self.languages:
-                if target == self.source_language:
-                    continue
-
-                self.logger.info(ConsoleFormatter.info(f"[{self.source_language} - {target}] Localization in progress..."))
-
-                out_path: Path = output_path
-                if output_path_tag is not None:
-                    out_path = Path(sanitize_path(str(out_path), output_path_tag, target))
-
-                if self.manifest.is_output_valid(out_path):
-                    self.logger.info(ConsoleFormatter.success(f"[{self.source_language} - {target}] Localization done."))
-                    continue
-
-                self.manifest.update_required = True
-                soup: Any = BeautifulSoup(file_content, "html.parser")
-
-                nodes: list[PageElement] = []
-                texts: list[str] = []
-
-                for n in soup.descendants:
-                    if isinstance(n, NavigableString) and self._is_translatable_text(n):
-                        nodes.append(n)
-                        texts.append(str(n))
-
-                texts = [self.engine.protect_text(x, self.patterns) for x in texts]
-                translations: list[str] = []
-
-                for text in texts:
-                    if self.engine.is_placeholder_only(text):
-                        translations.append(self.engine.unprotect_text(text))
-                        continue
-
-                    text_hash: str = compute_hash(normalize_text(text))
-                    cache: Optional[str] = self.store.lookup(session, target, text_hash)
-
-                    if not cache:
-                        try:
-                            translation: str = str(
-                                self.translator.translate(self.source_language, target, text, glossary_content)
-                            )  # Enforce string as we only send a single string for translation
-
-                            translation = self.engine.unprotect_text(translation)
-                            self.store.upsert(session, target, text_hash, translation)
-                            cache = translation
-
-                        except Exception as e:
-                            print(f"Error translating text: {self.engine.unprotect_text(text)}. Error: {e}")
-                            continue
-
-                    translations.append(cache)
-
-                for node, tr in zip(nodes, translations):
-                    node.replace_with(tr)
-
-                out_html = str(soup)
-                write_file(str(out_path.parent), out_path.name, out_html)
-                result_write_paths.append(str(out_path))
-
-                self.logger.info(ConsoleFormatter.success(f"[{self.source_language} - {target}] Localization done."))
-            session.commit()
-
-        self.prune_store()
-        return result_write_paths
+    @classmethod
+    def _compile_template(cls, file_content: str) -> SlotTemplate:
+        """
+        Parses an HTML document once and compiles its translatable text nodes into a slot template.
+
+        Args:
+            file_content (str): The HTML document.
+
+        Returns:
+            SlotTemplate: The template whose segments are the translatable text nodes in document order.
+        """
+
+        soup: Any = BeautifulSoup(file_content, "html.parser")
+        nodes: list[PageElement] = [
+            n for n in soup.descendants if isinstance(n, NavigableString) and cls._is_translatable_text(n)
+        ]
+
+        marker: str = SlotTemplate.new_marker()
+        segments: list[str] = []
+        for index, node in enumerate(nodes):
+            segments.append(str(node))
+            node.replace_with(f"{marker}{index};")
+
+        return SlotTemplate.from_marked(str(soup), marker, segments)
+
+    @classmethod
+    def extract(cls, source: SourceFile) -> SlotTemplate | SpliceTemplate:
+        # Large sources are tokenized as they are read rather than built into a tree, and only their text runs are
+        # kept: targets are written by splicing the translations into the source.
+        if source.streamed:
+            return HtmlSlotParser.compile(source.path, cls.IGNORED_TAGS)
+
+        return cls._compile_template(source.html)
+
+    def write_output(self, document: SlotTemplate | SpliceTemplate, translations: list[str], out_path: Path) -> None:
+        fills: list[str] = [self._formatter.substitute(tr) for tr in translations]
+        if isinstance(document, SpliceTemplate):
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(out_path, "w", encoding="utf-8") as out:
+                document.write(fills, out)
+            return
+
+        write_file(str(out_path.parent), out_path.name, document.render(fills))
@@ -1,101 +1,168 @@
-import re
+import os
+from json.encoder import encode_basestring
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, TextIO
 
 from transctl.console_formater import ConsoleFormatter
 from transctl.core.configuration_manager import ConfigurationManager
-from transctl.core.handlers.base_translation_handler import BaseTranslationHandler
+from transctl.core.glossary import Glossary
+from transctl.core.handlers.streaming_translation_handler import StreamingTranslationHandler
+from transctl.core.segment_table import SegmentTable
+from transctl.core.source_file import SourceFile
+from transctl.core.templates.json_stream import iter_json_slots, iter_json_tokens
+from transctl.core.templates.slot_template import SlotTemplate
 from transctl.core.translation_run_manifest import TranslationRunManifest
+from transctl.core.translators.base_translator import BaseTranslator
 from transctl.models.app_config import AppConfig
-from transctl.utils.i_o import load_json, write_json
-from transctl.utils.utils_suit import (
-    compute_hash,
-    iter_strings,
-    normalize_text,
-    sanitize_path,
-    set_at_path,
-)
+from transctl.models.tm_store import TMStore
+from transctl.utils.i_o import dumps_json, iter_text, write_file
 
 from sqlalchemy.orm import Session
 
 
-class JsonTranslationTranslationHandler(BaseTranslationHandler):
+class JsonTranslationTranslationHandler(StreamingTranslationHandler[SlotTemplate]):
 
-    def __init__(self, cfg: ConfigurationManager, config: AppConfig, manifest: TranslationRunManifest) -> None:
-        super().__init__(config, cfg)
+    # The number of strings resolved and written at once when streaming a source.
+    STREAM_WINDOW: int = 5_000
+
+    def __init__(self, cfg: ConfigurationManager, config: AppConfig, manifest: TranslationRunManifest, store: TMStore,
+                 translator: BaseTranslator) -> None:
+        super().__init__(config, cfg, store, translator)
         self.extension = ".json"
         self.manifest: TranslationRunManifest = manifest
-        self.patterns: list[re.Pattern[str]] = [self.placeholder_regex, self.email_regex, self.url_regex]
-
-    def translate_file(self, file_path: Path, output_path: Path, glossary: Path | None = None,
-                       output_path_tag: str | None = None) -> list[str]:
-
-        self.logger.info(ConsoleFormatter.info(f"Processing path: {file_path}"))
-        result_write_paths: list[str] = []
-
-        if file_path.suffix != self.extension:
-            raise ValueError(f"File {file_path} does not have the expected extension {self.extension}")
-
-        glossary_content: dict[str, str] | None = None
-        if glossary:
-            glossary_content = load_json(glossary)
-
-        file_content: dict[Any, Any] = load_json(file_path)
-        file_content_iter: list[Any] = list(iter_strings(load_json(file_path)))
-
-        self.manifest.bind_source(file_path)
-
-        with Session(self.store.engine) as session:
-            for target in self.languages:
-                if target == self.source_language:
-                    continue
-
-                self.logger.info(ConsoleFormatter.info(f"[{self.source_language} - {target}] Localization in progress..."))
-
-                out_path: Path = output_path
-                if output_path_tag is not None:
-                    out_path = Path(sanitize_path(str(out_path), output_path_tag, target))
-
-                if self.manifest.is_output_valid(out_path):
-                    self.logger.info(
-                        ConsoleFormatter.success(f"[{self.source_language} - {target}] Localization done."))
-                    continue
-
-                self.manifest.update_required = True
-
-                translations: dict[Any, Any] = {}
-                for key, value in file_content_iter:
-                    protected_value: str = self.engine.protect_text(value, self.patterns)
-                    if self.engine.is_placeholder_only(protected_value):
-                        translations[key] = value
-                        continue
-
-                    text_hash: str = compute_hash(normalize_text(protected_value))
-                    cache: Optional[str] = self.store.lookup(session, target, text_hash)
-
-                    if not cache:
-                        try:
-                            translation: str = str(
-                                self.translator.translate(self.source_language, target, protected_value, glossary_content)
-                            )  # Enforce string as we only send a single string for translation
-
-                            translation = self.engine.unprotect_text(translation)
-                            self.store.upsert(session, target, text_hash, translation)
-                            cache = translation
-
-                        except Exception as e:
-                            print(f"Error translating text: {value}. Error: {e}")
-                            continue
-
-                    translations[key] = cache
-
-                file_content_copy: dict[Any, Any] = file_content.copy()
-                for key, _ in file_content_iter:
-                    set_at_path(file_content_copy, key, translations[key])
-
-                write_json(str(out_path.parent), out_path.name, file_content_copy)
-                result_write_paths.append(str(out_path))
 
+    @classmethod
+    def _mark(cls, value: Any, marker: str, segments: list[str]) -> Any:
+        """
+        Rebuilds a JSON value with every string replaced by a slot marker, collecting the strings in document order.
+        """
+
+        if isinstance(value, dict):
+            return {k: cls._mark(v, marker, segments) for k, v in value.items()}
+        if isinstance(value, list):
+            return [cls._mark(v, marker, segments) for v in value]
+        if isinstance(value, str):
+            segments.append(value)
+            return f"{marker}{len(segments) - 1};"
+
+        return value
+
+    @classmethod
+    def _compile_template(cls, file_content: dict[Any, Any]) -> SlotTemplate:
+        """
+        Serializes a JSON document once with its string values replaced by slot markers, and compiles it into a
+        slot template.
+
+        Args:
+            file_content (dict[Any, Any]): The parsed JSON document.
+
+        Returns:
+            SlotTemplate: The template whose segments are the string values in document order.
+        """
+
+        marker: str = SlotTemplate.new_marker()
+        segments: list[str] = []
+        marked: Any = cls._mark(file_content, marker, segments)
+
+        return SlotTemplate.from_marked(dumps_json(marked).decode("utf-8"), marker, segments)
+
+    @classmethod
+    def extract(cls, source: SourceFile) -> SlotTemplate:
+        return cls._compile_template(source.json)
+
+    def streams(self, source: SourceFile) -> bool:
+        return source.streamed
+
+    def translate_stream(self, session: Session, source: SourceFile, pending: list[tuple[str, Path]],
+                         glossary: Glossary | None = None) -> list[str]:
+        """
+        Translates a JSON source window by window: the source is tokenized incrementally, the strings of every window
+        are resolved for all pending targets at once, and the window is appended to every target's output. Only one
+        window is held in memory, whatever the size of the source.
+
+        Outputs are written to a temporary file next to them, and only replace them once every segment was translated.
+        """
+
+        for target, _ in pending:
+            self.logger.info(ConsoleFormatter.info(f"[{self.source_language} - {target}] Localization in progress..."))
+
+        outputs: dict[str, tuple[Path, TextIO]] = {}
+        completed: bool = False
+        try:
+            for target, out_path in pending:
+                out_path.parent.mkdir(parents=True, exist_ok=True)
+                outputs[target] = (out_path, open(self._partial_path(out_path), "w", encoding="utf-8"))
+
+            window: list[tuple[str, str | None]] = []
+            count: int = 0
+            for static, segment in iter_json_slots(iter_json_tokens(iter_text(source.path))):
+                window.append((static, segment))
+                count += segment is not None
+                if count >= self.STREAM_WINDOW or len(window) >= 2 * self.STREAM_WINDOW:
+                    self._write_window(session, window, outputs, glossary)
+                    window, count = [], 0
+                    if not outputs:
+                        return []
+
+            self._write_window(session, window, outputs, glossary)
+            completed = True
+        finally:
+            # Partial outputs are only kept, to be moved into place, for the targets of a source read to its end.
+            for out_path, out in outputs.values():
+                out.close()
+            for target, out_path in pending:
+                if not completed or target not in outputs:
+                    self._partial_path(out_path).unlink(missing_ok=True)
+
+        written: list[str] = []
+        for target, (out_path, _) in outputs.items():
+            os.replace(self._partial_path(out_path), out_path)
+            if self.manifest is not None:
+                self.manifest.record_output(out_path)
+            self.logger.info(ConsoleFormatter.success(f"[{self.source_language} - {target}] Localization done."))
+            written.append(str(out_path))
+
+        return written
+
+    def _write_window(self, session: Session, window: list[tuple[str, str | None]], outputs: dict[str, tuple[Path, TextIO]],
+                      glossary: Glossary | None) -> None:
+        """
+        Resolves the strings of a window for every target still being written, and appends the window to their outputs.
+        A target missing a translation is dropped from ``outputs``.
+        """
+
+        segments: list[str] = [segment for _, segment in window if segment is not None]
+        translations: dict[str, dict[str, str]] = {}
+        if segments:
+            table: SegmentTable = self.resolver.table(segments, glossary)
+            translations = self.resolver.resolve_many(session, [(target, table) for target in outputs], glossary)
+            # The hits of the window are refreshed now rather than at the end of the run, so buffered touches stay
+            # bounded by the window size too.
+            self.store.flush_touches(session)
             session.commit()
-        self.prune_store()
-        return result_write_paths
+
+        for target in list(outputs):
+            out_path, out = outputs[target]
+            resolved: dict[str, str] = translations.get(target, {})
+            missing: int = sum(1 for s in segments if s not in resolved)
+            if missing:
+                self.logger.error(ConsoleFormatter.error(
+                    f"[{self.source_language} - {target}] {missing} segment(s) could not be translated. Skipping {out_path}."))
+                out.close()
+                del outputs[target]
+                continue
+
+            for static, segment in window:
+                out.write(static)
+                if segment is not None:
+                    out.write(encode_basestring(resolved[segment]))
+
+    @staticmethod
+    def _partial_path(out_path: Path) -> Path:
+        return out_path.with_name(f"{out_path.name}.partial")
+
+    def write_output(self, document: SlotTemplate, translations: list[str], out_path: Path) -> None:
+        # Markers are serialized inside the string quotes, so slots are filled with the escaped text alone, escaped
+        # the way json.dumps(ensure_ascii=False) escapes strings.
+        out_json: str = document.render([encode_basestring(tr)[1:-1] for tr in translations])
+        write_file(str(out_path.parent), out_path.name, out_json)
@@ -0,0 +1,52 @@
+from abc import abstractmethod
+from pathlib import Path
+
+from transctl.core.glossary import Glossary
+from transctl.core.handlers.base_translation_handler import BaseTranslationHandler, TDocument
+from transctl.core.source_file import SourceFile
+
+from sqlalchemy.orm import Session
+
+
+class StreamingTranslationHandler(BaseTranslationHandler[TDocument]):
+    """
+    Base class of the handlers able to translate large sources incrementally, with bounded memory whatever their
+    size, rather than extracting them whole.
+    """
+
+    @abstractmethod
+    def streams(self, source: SourceFile) -> bool:
+        """
+        Whether a source is translated incrementally with :meth:`translate_stream` rather than extracted whole.
+
+        Args:
+            source (SourceFile): The source file.
+
+        Returns:
+            bool: True if the source is streamed.
+        """
+        pass
+
+    @abstractmethod
+    def translate_stream(self, session: Session, source: SourceFile, pending: list[tuple[str, Path]],
+                         glossary: Glossary | None = None) -> list[str]:
+        """
+        Translates a source into every pending target incrementally.
+
+        Args:
+            session (Session): An active SQLAlchemy session. It is committed as the source is translated.
+            source (SourceFile): A source for which :meth:`streams` is True.
+            pending (list[tuple[str, Path]]): The (target, output path) pairs returned by :meth:`pending_outputs`.
+            glossary (Optional[Glossary]): The glossary to apply, if any.
+
+        Returns:
+            list[str]: The paths of the written outputs.
+        """
+        pass
+
+    def translate_pending(self, session: Session, source: SourceFile, pending: list[tuple[str, Path]],
+                          glossary: Glossary | None = None) -> list[str]:
+        if self.streams(source):
+            return self.translate_stream(session, source, pending, glossary)
+
+        return super().translate_pending(session, source, pending, glossary)
@@ -0,0 +1,80 @@
+import logging
+import os
+
+from transctl.console_formater import ConsoleFormatter
+from transctl.models.policies import PrunePolicy
+from transctl.models.tm_store import TMStatKey, TMStore
+
+from sqlalchemy.orm import Session
+
+
+class PruneScheduler:
+    """
+    Decides, at most once per translation run, whether the TM store is due for pruning.
+
+    The decision only relies on file sizes and the statistics cached in the store, so a run that does not
+    prune never scans the ``tm`` table.
+
+    Attributes:
+        store (TMStore): The TM store to prune.
+        policy (PrunePolicy): The pruning policy.
+    """
+
+    def __init__(self, store: TMStore, policy: PrunePolicy) -> None:
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.store: TMStore = store
+        self.policy: PrunePolicy = policy
+
+    @staticmethod
+    def _size_mb(path: str) -> float:
+        try:
+            return os.path.getsize(path) / (1024 * 1024)
+        except OSError:
+            return 0.0
+
+    def due_reason(self, stats: dict[TMStatKey, int]) -> str | None:
+        """
+        Returns why the store is due for pruning, or None if it is not.
+
+        Args:
+            stats (dict[TMStatKey, int]): The cached statistics of the store.
+        """
+
+        policy: PrunePolicy = self.policy
+
+        if policy.max_db_mb is not None and self._size_mb(self.store.db_path) > policy.max_db_mb:
+            return f"database larger than {policy.max_db_mb} MB"
+
+        if policy.max_wal_mb is not None and self._size_mb(f"{self.store.db_path}-wal") > policy.max_wal_mb:
+            return f"write-ahead log larger than {policy.max_wal_mb} MB"
+
+        if policy.max_rows is not None and stats[TMStatKey.ROW_ESTIMATE] > policy.max_rows:
+            return f"more than {policy.max_rows} rows"
+
+        if policy.every_n_runs is not None and stats[TMStatKey.RUNS_SINCE_PRUNE] >= policy.every_n_runs:
+            return f"{stats[TMStatKey.RUNS_SINCE_PRUNE]} runs since the last prune"
+
+        return None
+
+    def run(self) -> bool:
+        """
+        Records a translation run and prunes the store if it is due.
+
+        Returns:
+            bool: True if the store was pruned, False otherwise.
+        """
+
+        with Session(self.store.engine) as session:
+            self.store.increment_stat(session, TMStatKey.RUNS_SINCE_PRUNE, 1)
+            stats: dict[TMStatKey, int] = self.store.read_stats(session)
+            session.commit()
+
+            reason: str | None = self.due_reason(stats)
+            if reason is None:
+                self.logger.info(ConsoleFormatter.success("TM Store pruning not due."))
+                return False
+
+            self.logger.info(ConsoleFormatter.info(f"TM Store due for pruning: {reason}."))
+            self.store.prune(session, self.policy)
+
+        return True
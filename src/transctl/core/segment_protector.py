@@ -0,0 +1,76 @@
+import re
+from dataclasses import dataclass
+from typing import Iterable
+
+from transctl.models.engine_config import EngineConfig
+from transctl.utils.utils_suit import compute_hash, normalize_text
+
+
+@dataclass(frozen=True)
+class PreparedSegment:
+    """
+    A source segment ready for the translation memory.
+
+    Attributes:
+        protected (str): The source text with its protected spans wrapped in the engine's protection tags.
+        hash (str): The TM key of the segment, the hash of its normalized protected text.
+    """
+
+    protected: str
+    hash: str
+
+
+class SegmentProtector:
+    """
+    Protects placeholders, emails and URLs from translation and computes the TM key of segments.
+
+    The protector only holds the engine configuration and compiled pattern, so it can be shipped to worker processes.
+
+    Attributes:
+        engine (EngineConfig): The engine whose protection tags are used.
+    """
+
+    # Placeholders, emails and URLs, matched in a single left-to-right pass. At a given position the first alternative
+    # wins, and the spans never overlap, so a URL holding a placeholder is protected as a whole.
+    PROTECTED_RE: re.Pattern[str] = re.compile(
+        r"\{\{.*?\}\}"
+        r"|(?i:\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b)"
+        r"|(?i:\bhttps?://[^\s<>()]+)"
+    )
+
+    def __init__(self, engine: EngineConfig) -> None:
+        self.engine: EngineConfig = engine
+
+    def prepare(self, text: str) -> PreparedSegment | None:
+        """
+        Protects a segment and computes its TM key.
+
+        Args:
+            text (str): The source segment.
+
+        Returns:
+            Optional[PreparedSegment]: The prepared segment, or None if it only holds protected spans and is kept as is.
+        """
+
+        # Every protected span holds one of these literals, so most segments skip the regex entirely.
+        protected_text: str = text
+        if "{{" in text or "@" in text or "://" in text:
+            protected_text = self.engine.protect_text(text, self.PROTECTED_RE)
+
+        if self.engine.is_placeholder_only(protected_text):
+            return None
+
+        return PreparedSegment(protected=protected_text, hash=compute_hash(normalize_text(protected_text)))
+
+    def prepare_many(self, segments: Iterable[str]) -> dict[str, PreparedSegment | None]:
+        """
+        Prepares every distinct segment.
+
+        Args:
+            segments (Iterable[str]): The source segments.
+
+        Returns:
+            dict[str, Optional[PreparedSegment]]: A mapping of source segment to prepared segment.
+        """
+
+        return {text: self.prepare(text) for text in dict.fromkeys(segments)}
@@ -0,0 +1,197 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Mapping, Sequence
+
+from transctl.console_formater import ConsoleFormatter
+from transctl.core.glossary import Glossary
+from transctl.core.segment_protector import PreparedSegment, SegmentProtector
+from transctl.core.segment_table import SegmentTable
+from transctl.core.translators.base_translator import BaseTranslator
+from transctl.models.app_config import AppConfig
+from transctl.models.engine_config import EngineConfig
+from transctl.models.tm_store import TMStore
+
+from sqlalchemy.orm import Session
+
+
+@dataclass
+class ResolvePlan:
+    """
+    The TM lookup of a target language's segments, pending translation of its misses.
+
+    Attributes:
+        target (str): The target language code.
+        table (SegmentTable): The prepared segments.
+        cached (dict[str, str]): TM hits by segment hash.
+        misses (dict[str, str]): Protected source text of every TM miss, by segment hash.
+    """
+
+    target: str
+    table: SegmentTable
+    cached: dict[str, str] = field(default_factory=dict)
+    misses: dict[str, str] = field(default_factory=dict)
+
+
+class SegmentResolver:
+    """
+    Resolves source segments into translations for a target language.
+
+    Segments are protected, looked up in the translation memory and every miss is sent to the translator
+    in list requests packed up to the provider limits. Results are written back to the translation memory.
+
+    Attributes:
+        translator (BaseTranslator): The translator used for TM misses.
+        store (TMStore): The translation memory store.
+        protector (SegmentProtector): Protects segments from translation and computes their TM key.
+        jobs (int): The maximum number of target languages translated concurrently.
+    """
+
+    def __init__(self, config: AppConfig, translator: BaseTranslator, store: TMStore) -> None:
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.engine: EngineConfig = config.engine
+        self.source_language: str = config.source
+        self.translator: BaseTranslator = translator
+        self.store: TMStore = store
+        self.jobs: int = config.performance.jobs
+
+        self.protector: SegmentProtector = SegmentProtector(config.engine)
+
+    def table(self, segments: Iterable[str], glossary: Glossary | None = None,
+              prepared: Mapping[str, PreparedSegment | None] | None = None) -> SegmentTable:
+        """
+        Protects, checks, hashes and signs the distinct segments of a document once for all its target languages.
+
+        Args:
+            segments (Iterable[str]): The source segments. Duplicates are prepared once.
+            glossary (Optional[Glossary]): The glossary to apply, if any.
+            prepared (Optional[Mapping[str, Optional[PreparedSegment]]]): Segments already prepared by the protector,
+                                                                          e.g. in a worker process.
+
+        Returns:
+            SegmentTable: The segment table, reusable for every target language.
+        """
+
+        return SegmentTable.build(segments, self.protector, glossary, prepared)
+
+    def plan(self, session: Session, target: str, table: SegmentTable) -> ResolvePlan:
+        """
+        Looks up the prepared segments of a target language in the translation memory.
+
+        A TM entry is only reused if the glossary entries of its segment are the same as when it was translated, so
+        editing a term invalidates the segments containing it and nothing else.
+
+        Args:
+            session (Session): An active SQLAlchemy session.
+            target (str): The target language code.
+            table (SegmentTable): The prepared segments.
+
+        Returns:
+            ResolvePlan: The TM hits and the misses left to translate.
+        """
+
+        plan: ResolvePlan = ResolvePlan(target=target, table=table)
+        plan.cached = self.store.lookup_many(session, target, table.protected.keys(), table.signatures)
+        plan.misses = {h: p for h, p in table.protected.items() if not plan.cached.get(h)}
+        return plan
+
+    def complete(self, session: Session, plan: ResolvePlan, resolved: dict[str, str]) -> dict[str, str]:
+        """
+        Writes the translated misses of a plan back to the translation memory and maps every segment to its translation.
+
+        Args:
+            session (Session): An active SQLAlchemy session.
+            plan (ResolvePlan): The plan returned by :meth:`plan`.
+            resolved (dict[str, str]): A mapping of segment hash to translation of the plan's misses.
+
+        Returns:
+            dict[str, str]: A mapping of source segment to translation. Segments that could not be translated are omitted.
+        """
+
+        table: SegmentTable = plan.table
+        self.store.upsert_many(session, plan.target, resolved, table.signatures)
+
+        known: dict[str, str] = plan.cached | resolved
+        translations: dict[str, str] = {}
+        for text, key, kept in zip(table.texts, table.keys, table.kept):
+            if kept:
+                translations[text] = text
+            elif key in known:
+                translations[text] = known[key]
+
+        return translations
+
+    def resolve_many(self, session: Session, requests: Sequence[tuple[str, SegmentTable]],
+                     glossary: Glossary | None = None) -> dict[str, dict[str, str]]:
+        """
+        Resolves the segments of several target languages, translating the misses of up to ``jobs`` targets concurrently.
+
+        Only the translator calls run on the worker pool. TM reads and writes stay on the calling thread, which owns the
+        session, and results and errors are handled in request order, so the outcome and the logs do not depend on
+        which provider call returns first.
+
+        Args:
+            session (Session): An active SQLAlchemy session.
+            requests (Sequence[tuple[str, SegmentTable]]): The (target language, prepared segments) pairs to resolve.
+                                                           Targets sharing their segments share a single table.
+            glossary (Optional[Glossary]): The glossary the tables were signed with, applied to the misses.
+
+        Returns:
+            dict[str, dict[str, str]]: A mapping of target language to the mapping of source segment to translation.
+        """
+
+        plans: list[ResolvePlan] = [self.plan(session, target, table) for target, table in requests]
+
+        def translate(plan: ResolvePlan) -> tuple[dict[str, str], list[str]]:
+            return self._translate_batches(plan.target, plan.misses, glossary)
+
+        results: list[tuple[dict[str, str], list[str]]]
+        workers: int = min(self.jobs, sum(1 for plan in plans if plan.misses))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(translate, plans))
+        else:
+            results = [translate(plan) for plan in plans]
+
+        resolved_by_target: dict[str, dict[str, str]] = {}
+        for plan, (resolved, errors) in zip(plans, results):
+            for error in errors:
+                self.logger.error(ConsoleFormatter.error(error))
+            resolved_by_target[plan.target] = self.complete(session, plan, resolved)
+
+        return resolved_by_target
+
+    def _translate_batches(self, target: str, misses: dict[str, str], glossary: Glossary | None) -> tuple[dict[str, str], list[str]]:
+        """
+        Translates TM misses in batched list requests without touching the store or logging, so it is safe to run
+        on a worker thread.
+
+        Returns:
+            tuple[dict[str, str], list[str]]: The translations by segment hash, and the error message of every failed batch.
+        """
+
+        hashes: list[str] = list(misses.keys())
+        sources: list[str] = list(misses.values())
+        translations: dict[str, str] = {}
+        errors: list[str] = []
+
+        # Requests are filled up to the provider limits, and a failed request only loses its own segments. Every
+        # batch is sent to the provider as a single request.
+        for request in self.translator.pack(sources, glossary):
+            batch: list[str] = hashes[request.start:request.stop]
+            texts: list[str] = sources[request.start:request.stop]
+
+            try:
+                result: str | list[str] = self.translator.translate(self.source_language, target, texts, glossary)
+            except Exception as e:
+                errors.append(f"[{self.source_language} - {target}] Error translating {len(batch)} segment(s). Error: {e}")
+                continue
+
+            if not isinstance(result, list) or len(result) != len(batch):
+                errors.append(f"[{self.source_language} - {target}] Unexpected translator response for {len(batch)} segment(s).")
+                continue
+
+            for text_hash, translation in zip(batch, result):
+                translations[text_hash] = self.engine.unprotect_text(translation)
+
+        return translations, errors
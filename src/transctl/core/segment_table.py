@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from typing import Iterable, Mapping
+
+from transctl.core.glossary import Glossary
+from transctl.core.segment_protector import PreparedSegment, SegmentProtector
+
+
+@dataclass(frozen=True)
+class SegmentTable:
+    """
+    The distinct segments of a document, protected, checked and hashed once and shared by every target language.
+
+    Segments are stored column-wise: the i-th entry of ``texts``, ``keys`` and ``kept`` describe the i-th distinct
+    segment, in order of first appearance. Segments sharing a TM key are protected and signed once, so the only work
+    left per target is the TM lookup and the translation of its misses.
+
+    Attributes:
+        texts (list[str]): The distinct source segments.
+        keys (list[str]): The TM key of every segment, empty for kept segments.
+        kept (bytearray): 1 for segments that only hold protected spans and are kept as is, 0 otherwise.
+        protected (dict[str, str]): The protected source text of every TM key.
+        signatures (dict[str, str]): The glossary signature of every TM key holding glossary terms.
+    """
+
+    texts: list[str]
+    keys: list[str]
+    kept: bytearray
+    protected: dict[str, str]
+    signatures: dict[str, str]
+
+    @classmethod
+    def build(cls, segments: Iterable[str], protector: SegmentProtector, glossary: Glossary | None = None,
+              prepared: Mapping[str, PreparedSegment | None] | None = None) -> "SegmentTable":
+        """
+        Prepares the distinct segments of a document.
+
+        Args:
+            segments (Iterable[str]): The source segments. Duplicates are prepared once.
+            protector (SegmentProtector): Protects segments and computes their TM key.
+            glossary (Optional[Glossary]): The glossary to apply, if any.
+            prepared (Optional[Mapping[str, Optional[PreparedSegment]]]): Segments already prepared by the protector,
+                                                                          e.g. in a worker process.
+
+        Returns:
+            SegmentTable: The segment table.
+        """
+
+        texts: list[str] = list(dict.fromkeys(segments))
+        keys: list[str] = []
+        kept: bytearray = bytearray(len(texts))
+        protected: dict[str, str] = {}
+        signatures: dict[str, str] = {}
+
+        for index, text in enumerate(texts):
+            segment: PreparedSegment | None = prepared[text] if prepared is not None and text in prepared else protector.prepare(text)
+            if segment is None:
+                kept[index] = 1
+                keys.append("")
+                continue
+
+            keys.append(segment.hash)
+            if segment.hash in protected:
+                continue
+
+            protected[segment.hash] = segment.protected
+            if glossary is not None:
+                signature: str = glossary.signature(text)
+                if signature:
+                    signatures[segment.hash] = signature
+
+        return cls(texts=texts, keys=keys, kept=kept, protected=protected, signatures=signatures)
+
+    def __len__(self) -> int:
+        return len(self.texts)
@@ -0,0 +1,71 @@
+import os
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from transctl.utils.i_o import decode_text, iter_text, parse_json, read_bytes
+from transctl.utils.utils_suit import compute_hash, compute_hash_chunks
+
+
+class SourceFile:
+    """
+    A source file read, hashed and parsed at most once per run.
+
+    Every property is computed lazily and cached, so the translation manifest can validate a source from its stat
+    alone, while the handler and the manifest share a single read, a single hash and a single parse when the content
+    is needed. Sources at least ``stream_threshold`` bytes large are hashed incrementally instead, without holding
+    their content in memory.
+
+    Attributes:
+        path (Path): The path of the source file.
+        stream_threshold (Optional[int]): The size, in bytes, from which the source is streamed. None never streams.
+    """
+
+    def __init__(self, path: Path, stream_threshold: int | None = None) -> None:
+        self.path: Path = Path(path)
+        self.stream_threshold: int | None = stream_threshold
+
+    def release(self) -> None:
+        """
+        Drops the cached content of the source, keeping its stat and hash. The content is read again if needed.
+        """
+
+        for name in ("data", "text", "json", "html"):
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def stat(self) -> os.stat_result:
+        return os.stat(self.path)
+
+    @cached_property
+    def data(self) -> bytes:
+        return read_bytes(self.path)
+
+    @cached_property
+    def text(self) -> str:
+        return decode_text(self.data)
+
+    @cached_property
+    def streamed(self) -> bool:
+        return self.stream_threshold is not None and self.stat.st_size >= self.stream_threshold
+
+    @cached_property
+    def hash(self) -> str:
+        if self.streamed and "text" not in self.__dict__:
+            return compute_hash_chunks(iter_text(self.path))
+
+        return compute_hash(self.text)
+
+    @cached_property
+    def json(self) -> dict[str, Any]:
+        if self.path.suffix != ".json":
+            raise ValueError(f"File {self.path} is not a valid json file.")
+
+        return parse_json(self.data)
+
+    @cached_property
+    def html(self) -> str:
+        if self.path.suffix != ".html":
+            raise ValueError(f"File {self.path} is not a valid html file.")
+
+        return self.text
@@ -0,0 +1,182 @@
+from array import array
+from html.parser import HTMLParser
+from pathlib import Path
+
+from transctl.core.templates.slot_template import SpliceTemplate
+from transctl.utils.i_o import iter_text
+
+from bs4.dammit import EntitySubstitution, UnicodeDammit
+
+
+# Elements that never hold content, whether or not they are written as <tag/>: those of BeautifulSoup's HTML builders.
+_VOID_TAGS: frozenset[str] = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link", "menuitem", "meta", "param", "source",
+    "track", "wbr", "basefont", "bgsound", "command", "frame", "image", "isindex", "nextid", "spacer",
+})
+
+
+class HtmlSlotParser(HTMLParser):
+    """
+    Locates the translatable text runs of an HTML document from the events of the ``html.parser`` tokenizer, without
+    building a tree.
+
+    Open elements are tracked by name only, to know whether a text run lies within an ignored element. Every
+    translatable text run becomes a slot, located by its character offsets in the source. Markup is not kept: targets
+    are written by splicing the translations into the source at those offsets (see :class:`SpliceTemplate`), so
+    unchanged markup is kept character for character and memory holds the text runs rather than the document.
+
+    Text runs, open elements and character references are handled like BeautifulSoup's ``html.parser`` builder does,
+    so the segments are those of its text nodes. Comments, declarations, processing instructions and CDATA sections
+    are never translated.
+
+    Attributes:
+        ignored_tags (frozenset[str]): The elements whose text is never translated.
+    """
+
+    def __init__(self, ignored_tags: frozenset[str]) -> None:
+        super().__init__(convert_charrefs=False)
+        self.ignored_tags: frozenset[str] = ignored_tags
+        # The number of open elements of every name, and of open ignored elements.
+        self._open: dict[str, int] = {}
+        self._stack: list[str] = []
+        self._ignored: int = 0
+
+        # The offset of every line start from the tokenizer's line on, to turn the (line, column) positions of its
+        # events into offsets. Lines before it are dropped, as no later event can start there.
+        self._line_starts: array[int] = array("q", [0])
+        self._first_line: int = 1
+        self._size: int = 0
+
+        # The text run being read, and its offset.
+        self._run: list[str] = []
+        self._run_start: int = -1
+
+        self._starts: array[int] = array("q")
+        self._ends: array[int] = array("q")
+        self._segments: list[str] = []
+
+    @classmethod
+    def compile(cls, path: Path, ignored_tags: frozenset[str], chunk_size: int = 1 << 20) -> SpliceTemplate:
+        """
+        Locates the translatable text runs of an HTML file, reading it in chunks.
+
+        Args:
+            path (Path): The HTML file.
+            ignored_tags (frozenset[str]): The elements whose text is never translated.
+            chunk_size (int): The number of characters read at once.
+
+        Returns:
+            SpliceTemplate: The template whose segments are the translatable text runs in document order.
+        """
+
+        parser: HtmlSlotParser = cls(ignored_tags)
+        for chunk in iter_text(path, chunk_size):
+            parser.feed(chunk)
+
+        return parser.finish(path)
+
+    def feed(self, data: str) -> None:
+        start: int = self._size
+        position: int = data.find("\n")
+        while position >= 0:
+            self._line_starts.append(start + position + 1)
+            position = data.find("\n", position + 1)
+
+        self._size += len(data)
+        super().feed(data)
+
+        line, _ = self.getpos()
+        if line > self._first_line:
+            del self._line_starts[:line - self._first_line]
+            self._first_line = line
+
+    def finish(self, path: Path) -> SpliceTemplate:
+        """
+        Parses the rest of the document and returns its template.
+
+        Args:
+            path (Path): The file the document was read from.
+
+        Returns:
+            SpliceTemplate: The located slots.
+        """
+
+        self.close()
+        self._flush(self._size)
+        return SpliceTemplate(path=Path(path), starts=self._starts, ends=self._ends, segments=self._segments)
+
+    def _offset(self) -> int:
+        # The offset of the event being handled.
+        line, column = self.getpos()
+        return self._line_starts[line - self._first_line] + column
+
+    def _flush(self, end: int) -> None:
+        # Ends the text run being read at an offset, and makes it a slot if it is translatable.
+        if self._run_start < 0:
+            return
+
+        text: str = "".join(self._run)
+        start: int = self._run_start
+        self._run.clear()
+        self._run_start = -1
+        if self._ignored or not text.strip():
+            return
+
+        self._starts.append(start)
+        self._ends.append(end)
+        self._segments.append(text)
+
+    def handle_data(self, data: str) -> None:
+        if self._run_start < 0:
+            self._run_start = self._offset()
+        self._run.append(data)
+
+    def handle_entityref(self, name: str) -> None:
+        # Unknown entities are kept as written, without their semicolon, like BeautifulSoup does.
+        character: str | None = EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name)
+        self.handle_data(character if character is not None else f"&{name}")
+
+    def handle_charref(self, name: str) -> None:
+        code: int = int(name[1:], 16) if name[:1] in ("x", "X") else int(name)
+        data, _ = UnicodeDammit.numeric_character_reference(code)
+        self.handle_data(data)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._flush(self._offset())
+        if tag in _VOID_TAGS:
+            return
+
+        self._stack.append(tag)
+        self._open[tag] = self._open.get(tag, 0) + 1
+        if tag in self.ignored_tags:
+            self._ignored += 1
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._flush(self._offset())
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush(self._offset())
+        # An end tag closes the innermost open element of its name, and every element opened within it. End tags
+        # of elements that are not open are ignored.
+        if not self._open.get(tag):
+            return
+
+        while True:
+            name: str = self._stack.pop()
+            self._open[name] -= 1
+            if name in self.ignored_tags:
+                self._ignored -= 1
+            if name == tag:
+                return
+
+    def handle_comment(self, data: str) -> None:
+        self._flush(self._offset())
+
+    def handle_decl(self, decl: str) -> None:
+        self._flush(self._offset())
+
+    def handle_pi(self, data: str) -> None:
+        self._flush(self._offset())
+
+    def unknown_decl(self, data: str) -> None:
+        self._flush(self._offset())
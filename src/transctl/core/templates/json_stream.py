@@ -0,0 +1,187 @@
+import math
+import re
+from json import JSONDecodeError, JSONDecoder
+from json.encoder import encode_basestring
+from typing import Iterable, Iterator
+
+
+# A JSON token: (character, "") for the structural characters "{}[]:,", ("string", decoded text) for strings and
+# ("scalar", literal) for numbers, booleans and null, with the literal written the way json.dumps writes its value.
+JsonToken = tuple[str, str]
+
+_WHITESPACE_RE: re.Pattern[str] = re.compile(r"[ \t\n\r]+")
+_NUMBER_RE: re.Pattern[str] = re.compile(r"-?(?:0|[1-9]\d*)(\.\d+)?([eE][-+]?\d+)?")
+_WORD_RE: re.Pattern[str] = re.compile(r"-?[A-Za-z]+")
+_CONSTANTS: frozenset[str] = frozenset({"true", "false", "null", "NaN", "Infinity", "-Infinity"})
+_STRUCTURAL: frozenset[str] = frozenset("{}[]:,")
+# Decodes strings with the C scanner of the json module.
+_DECODER: JSONDecoder = JSONDecoder()
+
+
+def iter_json_tokens(chunks: Iterable[str]) -> Iterator[JsonToken]:
+    """
+    Tokenizes a JSON document given in chunks, holding at most one chunk and the token spanning its end in memory.
+
+    Args:
+        chunks (Iterable[str]): The text of the document, in chunks of any size.
+
+    Returns:
+        Iterator[JsonToken]: The tokens of the document, in order.
+
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+
+    source: Iterator[str] = iter(chunks)
+    buffer: str = ""
+    pos: int = 0
+    eof: bool = False
+
+    # A token reaching the end of the buffer may continue in the next chunk: it is then scanned again once the next
+    # chunk is appended.
+    while True:
+        if pos == len(buffer):
+            if eof:
+                return
+            buffer, pos, eof = _refill(source, buffer, pos)
+            continue
+
+        char: str = buffer[pos]
+        if char in _STRUCTURAL:
+            yield char, ""
+            pos += 1
+        elif char == '"':
+            try:
+                value, end = _DECODER.raw_decode(buffer, pos)
+            except JSONDecodeError as e:
+                # An unterminated string, or an escape sequence cut short, may be completed by the next chunk.
+                if eof or not (e.msg.startswith("Unterminated") or e.pos >= len(buffer) - 6):
+                    raise ValueError(f"Invalid JSON: {e.msg}.") from None
+                buffer, pos, eof = _refill(source, buffer, pos)
+                continue
+
+            yield "string", value
+            pos = end
+        elif whitespace := _WHITESPACE_RE.match(buffer, pos):
+            pos = whitespace.end()
+        else:
+            match: re.Match[str] | None = _WORD_RE.match(buffer, pos) or _NUMBER_RE.match(buffer, pos)
+            # A number cut after its sign, ".", "e" or exponent sign does not match, or matches short of the end of
+            # the buffer.
+            if len(buffer) - (match.end() if match else pos) <= 2 and not eof:
+                buffer, pos, eof = _refill(source, buffer, pos)
+                continue
+            if match is None:
+                raise ValueError(f"Invalid JSON: unexpected character {char!r}.")
+
+            yield "scalar", _scalar(match)
+            pos = match.end()
+
+
+def _refill(source: Iterator[str], buffer: str, pos: int) -> tuple[str, int, bool]:
+    # Drops the consumed part of the buffer and appends the next chunk. Returns the new buffer, position and EOF flag.
+    chunk: str | None = next(source, None)
+    return buffer[pos:] + (chunk or ""), 0, chunk is None
+
+
+def _scalar(match: re.Match[str]) -> str:
+    # Scalars are written the way json.dumps writes the value json.loads parses them into.
+    literal: str = match.group(0)
+    if literal[-1].isalpha():
+        if literal not in _CONSTANTS:
+            raise ValueError(f"Invalid JSON: unexpected literal {literal!r}.")
+        return literal
+
+    if match.lastindex is None:
+        return str(int(literal))
+
+    number: float = float(literal)
+    if math.isinf(number):
+        return "Infinity" if number > 0 else "-Infinity"
+
+    return float.__repr__(number)
+
+
+def iter_json_slots(tokens: Iterable[JsonToken], flush_pieces: int = 4096) -> Iterator[tuple[str, str | None]]:
+    """
+    Formats a tokenized JSON object like ``json.dumps(indent=2, ensure_ascii=False)``, with every string value left as
+    a slot for its translation.
+
+    Args:
+        tokens (Iterable[JsonToken]): The tokens returned by :func:`iter_json_tokens`.
+        flush_pieces (int): The number of static pieces from which static output is yielded even if no slot follows.
+
+    Returns:
+        Iterator[tuple[str, Optional[str]]]: The static output preceding every string value and the source text of
+        that value, in document order. Static output flushed without a value, including the end of the document,
+        comes with None.
+
+    Raises:
+        ValueError: If the document is not a valid JSON object.
+    """
+
+    source: Iterator[JsonToken] = iter(tokens)
+    out: list[str] = []
+    # The closing character of every open container.
+    stack: list[str] = []
+
+    def take() -> JsonToken:
+        token: JsonToken | None = next(source, None)
+        if token is None:
+            raise ValueError("Invalid JSON: unexpected end of document.")
+        return token
+
+    def member(token: JsonToken) -> JsonToken:
+        # Writes the key of an object member and returns the first token of its value.
+        if token[0] != "string":
+            raise ValueError("Invalid JSON: expecting a property name enclosed in double quotes.")
+        out.append(encode_basestring(token[1]) + ": ")
+        if take()[0] != ":":
+            raise ValueError("Invalid JSON: expecting ':' delimiter.")
+        return take()
+
+    kind, text = take()
+    if kind != "{":
+        raise ValueError("Invalid File Format. Expected a JSON object at top level")
+
+    while True:
+        if kind == "string":
+            yield "".join(out), text
+            out.clear()
+        elif kind == "scalar":
+            out.append(text)
+        elif kind in ("{", "["):
+            closer: str = "}" if kind == "{" else "]"
+            first: JsonToken = take()
+            if first[0] == closer:
+                out.append(kind + closer)
+            else:
+                stack.append(closer)
+                out.append(kind + "\n" + "  " * len(stack))
+                kind, text = member(first) if closer == "}" else first
+                continue
+        else:
+            raise ValueError(f"Invalid JSON: unexpected {kind!r}.")
+
+        if len(out) >= flush_pieces:
+            yield "".join(out), None
+            out.clear()
+
+        # After a value: close containers until the next member or the end of the document.
+        while stack:
+            kind, _ = take()
+            if kind == ",":
+                out.append(",\n" + "  " * len(stack))
+                kind, text = member(take()) if stack[-1] == "}" else take()
+                break
+            if kind != stack[-1]:
+                raise ValueError(f"Invalid JSON: expecting ',' or {stack[-1]!r}.")
+
+            stack.pop()
+            out.append("\n" + "  " * len(stack) + kind)
+        else:
+            if next(source, None) is not None:
+                raise ValueError("Invalid JSON: extra data after the document.")
+
+            yield "".join(out), None
+            return
@@ -0,0 +1,133 @@
+import re
+import uuid
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence, TextIO
+
+from transctl.utils.i_o import iter_text
+
+
+@dataclass(frozen=True)
+class SlotTemplate:
+    """
+    A document compiled into static chunks interleaved with translatable segment slots.
+
+    The template is built once per source file and rendered once per target language, so the cost of
+    parsing and walking the source document does not grow with the number of targets.
+
+    Attributes:
+        chunks (list[str]): The static output surrounding the slots. Always holds ``len(segments) + 1`` entries.
+        segments (list[str]): The source text of every slot, in document order.
+    """
+
+    chunks: list[str]
+    segments: list[str]
+
+    @staticmethod
+    def new_marker() -> str:
+        """
+        Creates a unique marker prefix used to tag slots in a serialized document.
+
+        Returns:
+            str: The marker prefix. A slot is tagged as ``f"{marker}{index};"``.
+        """
+
+        return f"transctl-slot-{uuid.uuid4().hex}-"
+
+    @classmethod
+    def from_marked(cls, rendered: str, marker: str, segments: list[str]) -> "SlotTemplate":
+        """
+        Splits a serialized document whose slots were replaced by markers into a template.
+
+        Args:
+            rendered (str): The serialized document containing the slot markers.
+            marker (str): The marker prefix returned by :meth:`new_marker`.
+            segments (list[str]): The source text of every slot, indexed like the markers.
+
+        Returns:
+            SlotTemplate: The compiled template.
+
+        Raises:
+            ValueError: If the markers found in the document do not match the segments in order.
+        """
+
+        parts: list[str] = re.split(rf"{re.escape(marker)}(\d+);", rendered)
+        indices: list[int] = [int(i) for i in parts[1::2]]
+
+        if indices != list(range(len(segments))):
+            raise ValueError("Unable to compile template: slot markers are missing or out of order.")
+
+        return cls(chunks=parts[0::2], segments=segments)
+
+    def render(self, fills: Sequence[str]) -> str:
+        """
+        Renders the template by filling every slot.
+
+        Args:
+            fills (Sequence[str]): The already escaped output of every slot, in document order.
+
+        Returns:
+            str: The rendered document.
+        """
+
+        if len(fills) != len(self.segments):
+            raise ValueError(f"Expected {len(self.segments)} slot values, got {len(fills)}.")
+
+        out: list[str] = [self.chunks[0]]
+        for fill, chunk in zip(fills, self.chunks[1:]):
+            out.append(fill)
+            out.append(chunk)
+
+        return "".join(out)
+
+
+@dataclass(frozen=True)
+class SpliceTemplate:
+    """
+    A source file whose translatable segments are located by their character offsets, for sources too large to hold.
+
+    Only the segments and their offsets are kept: every target is written by reading the source again and splicing
+    the slot values at those offsets, so memory grows with the text content rather than with the document.
+
+    Attributes:
+        path (Path): The source file, read as text by :func:`iter_text`.
+        starts (array[int]): The offset of every slot in the source.
+        ends (array[int]): The offset following every slot in the source.
+        segments (list[str]): The source text of every slot, in document order.
+    """
+
+    path: Path
+    starts: "array[int]"
+    ends: "array[int]"
+    segments: list[str]
+
+    def write(self, fills: Sequence[str], out: TextIO) -> None:
+        """
+        Copies the source to a text stream, replacing every slot by its value.
+
+        Args:
+            fills (Sequence[str]): The already escaped output of every slot, in document order.
+            out (TextIO): The output stream.
+        """
+
+        if len(fills) != len(self.segments):
+            raise ValueError(f"Expected {len(self.segments)} slot values, got {len(fills)}.")
+
+        index: int = 0
+        # The offset of the chunk being copied, and the offset the source is copied from.
+        offset: int = 0
+        cut: int = 0
+        for chunk in iter_text(self.path):
+            end: int = offset + len(chunk)
+            while index < len(fills) and self.starts[index] < end:
+                out.write(chunk[max(cut - offset, 0):self.starts[index] - offset])
+                out.write(fills[index])
+                cut = self.ends[index]
+                index += 1
+
+            out.write(chunk[max(cut - offset, 0):])
+            offset = end
+
+        if index != len(fills):
+            raise ValueError(f"Source {self.path} changed since its slots were located.")
@@ -1,26 +1,44 @@
+import logging
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable, Iterator
 
+from transctl.console_formater import ConsoleFormatter
 from transctl.core.configuration_manager import ConfigurationManager
+from transctl.core.extraction_pool import ExtractedSource, ExtractionPool
+from transctl.core.factory.translator_factory import TranslatorFactory
+from transctl.core.glossary import Glossary
 from transctl.core.handlers.base_translation_handler import BaseTranslationHandler
 from transctl.core.handlers.handle_html_translation import HtmlTranslationTranslationHandler
 from transctl.core.handlers.handle_json_translation import JsonTranslationTranslationHandler
+from transctl.core.handlers.streaming_translation_handler import StreamingTranslationHandler
+from transctl.core.prune_scheduler import PruneScheduler
+from transctl.core.segment_protector import PreparedSegment, SegmentProtector
+from transctl.core.segment_resolver import SegmentResolver
+from transctl.core.segment_table import SegmentTable
+from transctl.core.source_file import SourceFile
 from transctl.core.translation_run_manifest import TranslationRunManifest
+from transctl.core.translators.base_translator import BaseTranslator
 from transctl.models.app_config import AppConfig
+from transctl.models.tm_store import TMStore
 from transctl.models.translation_resource import TranslationResource, TranslationResourceType
 
+from sqlalchemy.orm import Session
+
 
 THandlerCtor = Callable[
     [
         ConfigurationManager,
         AppConfig,
-        TranslationRunManifest
+        TranslationRunManifest,
+        TMStore,
+        BaseTranslator
     ],
-    BaseTranslationHandler]
+    BaseTranslationHandler[Any]]
 
 
 class TranslationCoordinator:
     def __init__(self) -> None:
+        self.logger: logging.Logger = logging.getLogger(__name__)
         self._config_manager: ConfigurationManager = ConfigurationManager()
 
         self._handler_mapping: dict[TranslationResourceType, THandlerCtor] = {
@@ -30,26 +48,227 @@ class TranslationCoordinator:
 
         self._tr_manifest: TranslationRunManifest = TranslationRunManifest(self._config_manager)
 
-    def translate_from_config(self, glossary: str | None = None) -> list[str]:
+    def translate_from_config(self, glossary: str | None = None, coalesce: bool = False, paranoid: bool = False,
+                              jobs: int | None = None, processes: int | None = None) -> list[str]:
+        """
+        Translates every configured resource.
+
+        Args:
+            glossary (Optional[str]): Path to a glossary file (JSON).
+            coalesce (bool): Extract the segments of every resource first and translate them project-wide, deduplicated
+                             per target language, before writing any output.
+            paranoid (bool): Re-read and re-hash every source and output instead of trusting unchanged file stats.
+            jobs (Optional[int]): The maximum number of target languages translated concurrently. Overrides the
+                                  configured ``[performance] jobs``.
+            processes (Optional[int]): The number of worker processes parsing the sources. Overrides the configured
+                                       ``[performance] processes``.
+
+        Returns:
+            list[str]: The paths of the written outputs.
+        """
+
         config: AppConfig | None = self._config_manager.configuration
-        glossary_path: Path | None = Path(glossary) if glossary else None
 
         if config is None:
             raise ValueError("Configuration is not loaded.")
 
+        if jobs is not None or processes is not None:
+            overrides: dict[str, int] = {}
+            if jobs is not None:
+                overrides["jobs"] = jobs
+            if processes is not None:
+                overrides["processes"] = processes
+            config = config.model_copy(update={"performance": config.performance.model_copy(update=overrides)})
+
         resources: list[TranslationResource]
         if config.resources is None:
             return []
 
-        response: list[str] = []
-        for type_, resources in config.resources.items():
-            handler: BaseTranslationHandler = self._handler_mapping[type_](self._config_manager, config, self._tr_manifest)
+        self._tr_manifest.paranoid = paranoid
+        # Loaded, validated and compiled once for the whole run.
+        loaded_glossary: Glossary | None = Glossary.from_file(glossary) if glossary else None
+
+        # A single TM store engine and translation client for the whole run, shared by every handler.
+        store: TMStore = TMStore(db_path=str(self._config_manager.get_store_path()), touch_granularity=config.prune.touch_granularity_s)
+        translator: BaseTranslator = TranslatorFactory.get_translator(config.engine, self._config_manager.get_working_directory())
+
+        response: list[str]
+        if coalesce:
+            response = self._translate_coalesced(config, store, translator, loaded_glossary)
+        elif config.performance.processes > 1:
+            response = self._translate_in_processes(config, store, translator, loaded_glossary)
+        else:
+            response = []
+            for type_, resources in config.resources.items():
+                handler: BaseTranslationHandler[Any] = self._handler_mapping[type_](self._config_manager, config, self._tr_manifest, store, translator)
+
+                resource: TranslationResource
+                for resource in resources:
+                    for input_path, output_path in resource.bucket:
+                        handler_re: list[str] = handler.translate_file(input_path, output_path, loaded_glossary, resource.tag)
+                        response.extend(handler_re)
+
+        # Record TM recency once per run instead of once per hit.
+        with Session(store.engine) as session:
+            store.flush_touches(session)
+            session.commit()
+
+        self._tr_manifest.rebuild_from_config()
+        PruneScheduler(store, config.prune).run()
+        return response
+
+    def _collect_outdated(self, config: AppConfig, store: TMStore, translator: BaseTranslator,
+                          glossary: Glossary | None) -> list[tuple[BaseTranslationHandler[Any], SourceFile, list[tuple[str, Path]]]]:
+        """
+        Binds every configured source to the manifest and collects the ones with at least one outdated output.
+        When sources are extracted in worker processes, the content read to hash them is dropped.
+
+        Args:
+            config (AppConfig): The loaded configuration.
+            store (TMStore): The TM store.
+            translator (BaseTranslator): The translator.
+            glossary (Optional[Glossary]): The glossary to apply, if any. Outputs translated with another glossary
+                                           are outdated.
+
+        Returns:
+            list[tuple[BaseTranslationHandler[Any], SourceFile, list[tuple[str, Path]]]]: The handler, source and
+            (target, output path) pairs of every outdated source, in configuration order.
+        """
+
+        work: list[tuple[BaseTranslationHandler[Any], SourceFile, list[tuple[str, Path]]]] = []
+        for type_, resources in (config.resources or {}).items():
+            handler: BaseTranslationHandler[Any] = self._handler_mapping[type_](self._config_manager, config, self._tr_manifest, store, translator)
 
-            resource: TranslationResource
             for resource in resources:
                 for input_path, output_path in resource.bucket:
-                    handler_re: list[str] = handler.translate_file(input_path, output_path, glossary_path, resource.tag)
-                    response.extend(handler_re)
+                    self.logger.info(ConsoleFormatter.info(f"Processing path: {input_path}"))
+                    handler.check_extension(input_path)
+                    source: SourceFile = SourceFile(input_path, config.performance.stream_threshold)
+                    self._tr_manifest.bind_source(source, glossary.digest if glossary is not None else "")
+
+                    outputs: list[tuple[str, Path]] = handler.pending_outputs(output_path, resource.tag)
+                    # Worker processes read the source again, so its content is not held until it is extracted.
+                    if config.performance.processes > 1:
+                        source.release()
+                    if outputs:
+                        work.append((handler, source, outputs))
+
+        return work
+
+    @staticmethod
+    def _streamer(handler: BaseTranslationHandler[Any], source: SourceFile) -> StreamingTranslationHandler[Any] | None:
+        """
+        Returns the handler if it translates a source incrementally rather than extracting it, None otherwise.
+        """
+
+        if isinstance(handler, StreamingTranslationHandler) and handler.streams(source):
+            return handler
+
+        return None
+
+    def _translate_in_processes(self, config: AppConfig, store: TMStore, translator: BaseTranslator, glossary: Glossary | None) -> list[str]:
+        """
+        Translates every configured resource file by file, parsing the sources in worker processes.
+
+        The parent validates the sources against the manifest, then translates each file as soon as its extraction
+        is done, in configuration order, while the workers parse the next ones. TM and manifest writes stay in the
+        parent process. Streamed sources are translated by the parent in turn, without extraction.
+
+        Args:
+            config (AppConfig): The loaded configuration.
+            store (TMStore): The TM store.
+            translator (BaseTranslator): The translator.
+            glossary (Optional[Glossary]): The glossary to apply, if any.
+
+        Returns:
+            list[str]: The paths of the written outputs.
+        """
+
+        work: list[tuple[BaseTranslationHandler[Any], SourceFile, list[tuple[str, Path]]]] = self._collect_outdated(config, store, translator, glossary)
+        protector: SegmentProtector = SegmentProtector(config.engine)
+
+        response: list[str] = []
+        with ExtractionPool(protector, config.performance.processes) as pool, Session(store.engine) as session:
+            extracted: Iterator[ExtractedSource] = pool.map(
+                [(type(handler), source) for handler, source, _ in work if self._streamer(handler, source) is None])
+            for handler, source, outputs in work:
+                streamer: StreamingTranslationHandler[Any] | None = self._streamer(handler, source)
+                if streamer is not None:
+                    response.extend(streamer.translate_stream(session, source, outputs, glossary))
+                else:
+                    document, prepared = next(extracted)
+                    response.extend(handler.translate_document(session, document, outputs, glossary, prepared))
+                session.commit()
+
+        return response
+
+    def _translate_coalesced(self, config: AppConfig, store: TMStore, translator: BaseTranslator, glossary: Glossary | None) -> list[str]:
+        """
+        Translates every configured resource in three project-wide phases: extract the segments of every outdated
+        output, resolve the distinct segments of each target language in bulk, then write the outputs. Streamed
+        sources are translated file by file first, as holding their segments would defeat streaming.
+
+        Args:
+            config (AppConfig): The loaded configuration.
+            store (TMStore): The TM store.
+            translator (BaseTranslator): The translator.
+            glossary (Optional[Glossary]): The glossary to apply, if any.
+
+        Returns:
+            list[str]: The paths of the written outputs.
+        """
+
+        if not config.resources:
+            return []
+
+        resolver: SegmentResolver = SegmentResolver(config, translator, store)
+
+        # Phase 1: extract the segments of every source with at least one outdated output.
+        work: list[tuple[BaseTranslationHandler[Any], SourceFile, list[tuple[str, Path]]]] = self._collect_outdated(config, store, translator, glossary)
+        response: list[str] = []
+        with Session(store.engine) as session:
+            for handler, source, outputs in work:
+                streamer: StreamingTranslationHandler[Any] | None = self._streamer(handler, source)
+                if streamer is not None:
+                    response.extend(streamer.translate_stream(session, source, outputs, glossary))
+                    session.commit()
+
+        work = [(handler, source, outputs) for handler, source, outputs in work if self._streamer(handler, source) is None]
+        jobs: list[tuple[BaseTranslationHandler[Any], Any, list[tuple[str, Path]]]] = []
+        segments_by_target: dict[str, dict[str, None]] = {}
+        prepared: dict[str, PreparedSegment | None] = {}
+
+        with ExtractionPool(resolver.protector, config.performance.processes) as pool:
+            extracted: Iterator[ExtractedSource] = pool.map([(type(handler), source) for handler, source, _ in work])
+            for (handler, _, outputs), (document, document_prepared) in zip(work, extracted):
+                jobs.append((handler, document, outputs))
+                prepared.update(document_prepared)
+
+                for target, _ in outputs:
+                    segments_by_target.setdefault(target, {}).update(dict.fromkeys(document.segments))
+
+        # Phase 2: resolve the distinct segments of every target language project-wide.
+        translations_by_target: dict[str, dict[str, str]] = {}
+        for target, segments in segments_by_target.items():
+            self.logger.info(ConsoleFormatter.info(f"[{config.source} - {target}] Resolving {len(segments)} distinct segment(s)..."))
+
+        # Targets with the same outdated outputs share their segments, which are then prepared once for all of them.
+        tables: dict[tuple[str, ...], SegmentTable] = {}
+        requests: list[tuple[str, SegmentTable]] = []
+        for target, segments in segments_by_target.items():
+            key: tuple[str, ...] = tuple(segments)
+            if key not in tables:
+                tables[key] = resolver.table(key, glossary, prepared)
+            requests.append((target, tables[key]))
+
+        with Session(store.engine) as session:
+            translations_by_target = resolver.resolve_many(session, requests, glossary)
+            session.commit()
+
+        # Phase 3: write the outputs.
+        for handler, document, outputs in jobs:
+            for target, out_path in outputs:
+                if handler.write_target(target, document, translations_by_target[target], out_path):
+                    response.append(str(out_path))
 
-        self._tr_manifest.rebuild_from_config()
         return response
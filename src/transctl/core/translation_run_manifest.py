@@ -1,11 +1,14 @@
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from transctl.console_formater import ConsoleFormatter
 from transctl.core.configuration_manager import ConfigurationManager
-from transctl.models.translation_manifest import TranslationManifest, TREntry
-from transctl.utils.i_o import load_json
-from transctl.utils.utils_suit import compute_hash, sanitize_path
+from transctl.core.source_file import SourceFile
+from transctl.models.translation_manifest import FileStat, TranslationManifest, TREntry
+from transctl.utils.i_o import dumps_json, load_json
+from transctl.utils.utils_suit import sanitize_path
 
 
 class TranslationRunManifest:
@@ -14,6 +17,9 @@ class TranslationRunManifest:
 
     The manifest is stored as a JSON file inside the configured working directory (see ``ConfigurationManager.get_working_directory``).
 
+    Along with content hashes, the manifest records the size, mtime and inode of every source and output. A file whose
+    stat tuple still matches is trusted without being read or hashed again, unless ``paranoid`` is set.
+
     Thread-safety / concurrency
     - This class performs simple file reads/writes and does not provide cross-process
       locking. If multiple processes may update the manifest concurrently, external
@@ -25,9 +31,13 @@ class TranslationRunManifest:
         _manifest (TranslationManifest | None): in-memory manifest; None if not loaded.
         _active_source (str): content-hash of the currently bound source (empty string if none).
         _active_source_details (TREntry | None): TREntry for the active source if present in manifest.
+        _active_glossary (str): digest of the glossary bound along with the active source (empty string if none).
+        _files (dict[str, FileStat]): hashes and stats of every file hashed or trusted during this run.
+        _written (dict[str, str]): target files written during this run and their glossary digest (see :meth:`record_output`).
+        paranoid (bool): always re-read and re-hash files, ignoring recorded stats.
     """
 
-    def __init__(self, cfg: ConfigurationManager) -> None:
+    def __init__(self, cfg: ConfigurationManager, paranoid: bool = False) -> None:
         """
         Initialize the manifest manager and attempt to load the cached JSON file.
         """
@@ -43,21 +53,71 @@ class TranslationRunManifest:
 
         self._active_source: str = ""
         self._active_source_details: TREntry | None = None
+        self._active_glossary: str = ""
+
+        self._files: dict[str, FileStat] = {}
+        self._written: dict[str, str] = {}
 
         self.update_required: bool = False
+        self.paranoid: bool = paranoid
+
+    def _hash_file(self, path: Path) -> str:
+        """
+        Return the content hash of a file, trusting the recorded hash when the file's stat tuple is unchanged.
+
+        Args
+            path (Path): path of the file to hash.
+
+        Raises
+            OSError: if the file cannot be read.
+        """
+
+        # The content is not needed past the hash, so it is read in chunks rather than held in memory.
+        return self._hash_source(SourceFile(path, stream_threshold=0))
 
-    def bind_source(self, origin_path: Path) -> None:
+    def _hash_source(self, source: SourceFile) -> str:
+        """
+        Return the content hash of a source, trusting the recorded hash when its stat tuple is unchanged.
+        The source's content is only read (once, and shared with its other users) when it must be hashed.
+
+        Args
+            source (SourceFile): the source to hash.
+
+        Raises
+            OSError: if the file cannot be read.
+        """
+
+        key: str = str(source.path)
+        st: os.stat_result = source.stat
+
+        current: FileStat | None = self._files.get(key)
+        if current is None and self._manifest is not None:
+            current = self._manifest.files.get(key)
+
+        if (not self.paranoid and current is not None
+                and (current.size, current.mtime_ns, current.inode) == (st.st_size, st.st_mtime_ns, st.st_ino)):
+            self._files[key] = current
+            return current.hash
+
+        self._files[key] = FileStat(hash=source.hash, size=st.st_size, mtime_ns=st.st_mtime_ns, inode=st.st_ino)
+        return source.hash
+
+    def bind_source(self, origin: Path | SourceFile, glossary_digest: str = "") -> None:
         """
         Bind a source file so subsequent validations refer to it.
 
         Args
-            origin_path (Path): path to the source file to bind.
+            origin (Path | SourceFile): the source file to bind. Passing the run's SourceFile lets the
+                manifest share its single read and hash with the handler.
+            glossary_digest (str): digest of the glossary the source is translated with (empty string if none).
+                Outputs translated with another glossary are outdated.
 
         Raises
             OSError: if the file cannot be read.
         """
-        content: str = origin_path.read_text(encoding='utf-8')
-        self._active_source = compute_hash(content)
+        source: SourceFile = origin if isinstance(origin, SourceFile) else SourceFile(origin)
+        self._active_source = self._hash_source(source)
+        self._active_glossary = glossary_digest
 
         if self._manifest is None:
             return
@@ -72,8 +132,10 @@ class TranslationRunManifest:
         - A source has been bound via :meth:`bind_source` and that source exists in the
           loaded manifest (``_active_source_details`` is not ``None``).
         - ``target_path`` exists on disk and is readable.
-        - The computed hash of the target's content equals the expected hash recorded
-          in the active source's TREntry.outputs mapping.
+        - The hash of the target's content equals the expected hash recorded
+          in the active source's TREntry.outputs mapping. The recorded hash is trusted
+          without reading the file when its size, mtime and inode are unchanged.
+        - The target was translated with the glossary bound along with the source.
 
         Args
             target_path (Path): path to the target/translated file to validate.
@@ -85,11 +147,14 @@ class TranslationRunManifest:
         if self._active_source_details is None:
             return False
 
-        if not target_path.exists():
+        expected: str | None = self._active_source_details.outputs.get(str(target_path), None)
+        if expected is None or not target_path.exists():
             return False
 
-        content: str = target_path.read_text(encoding='utf-8')
-        return compute_hash(content) == self._active_source_details.outputs.get(str(target_path), None)
+        if self._active_source_details.glossaries.get(str(target_path), "") != self._active_glossary:
+            return False
+
+        return self._hash_file(target_path) == expected
 
     def _write_manifest(self, manifest: TranslationManifest) -> None:
         """
@@ -106,20 +171,129 @@ class TranslationRunManifest:
             OSError: if the file cannot be written.
         """
 
-        self._cache_dir.write_text(manifest.model_dump_json(indent=2), encoding="utf-8")
+        self._cache_dir.write_bytes(dumps_json(manifest.model_dump(mode="json")))
+
+    def record_output(self, target_path: Path) -> None:
+        """
+        Record that a target file was written during this run, with the glossary bound along with its source,
+        so the next rebuild re-hashes it.
+
+        Args
+            target_path (Path): path to the written target file.
+        """
+
+        self._written[str(target_path)] = self._active_glossary
+
+    def _iter_config_files(self) -> list[tuple[Path, list[Path]]]:
+        """
+        List every configured source along with the output path of each target language.
+        """
+
+        if self.cfg.configuration is None or not self.cfg.configuration.resources:
+            return []
+
+        targets = list(self.cfg.configuration.targets or [])
+        files: list[tuple[Path, list[Path]]] = []
+        for _, resources in self.cfg.configuration.resources.items():
+            for resource in resources:
+                tag = resource.tag
+                for input_path, output_path in resource.bucket:
+                    outputs = [Path(sanitize_path(str(output_path), tag, lang)) for lang in targets]
+                    files.append((Path(input_path), outputs))
+
+        return files
+
+    def _rebuild_full(self) -> TranslationManifest:
+        """
+        Build a manifest by hashing every existing source and output, in parallel.
+        """
+
+        new_manifest = TranslationManifest(sources={})
+        files = [(source, outputs) for source, outputs in self._iter_config_files() if source.exists()]
+
+        paths: list[Path] = []
+        for source, outputs in files:
+            paths.append(source)
+            paths.extend(out for out in outputs if out.exists())
+
+        with ThreadPoolExecutor() as pool:
+            hashes: dict[str, str] = dict(zip(map(str, paths), pool.map(self._hash_file, paths)))
+
+        for source, outputs in files:
+            source_hash = hashes[str(source)]
+            new_manifest.files[str(source)] = self._files[str(source)]
+
+            # ensure entry
+            entry = new_manifest.sources.get(source_hash)
+            if entry is None:
+                entry = TREntry(outputs={})
+                new_manifest.sources[source_hash] = entry
+
+            # outputs left unchanged keep the glossary they were translated with
+            previous_entry: TREntry | None = self._manifest.sources.get(source_hash) if self._manifest is not None else None
+
+            # lazy output ("expected") computation
+            for out_path in outputs:
+                if str(out_path) not in hashes:
+                    continue
+
+                entry.outputs[str(out_path)] = hashes[str(out_path)]
+                new_manifest.files[str(out_path)] = self._files[str(out_path)]
+                if (previous_entry is not None and str(out_path) in previous_entry.glossaries
+                        and previous_entry.outputs.get(str(out_path)) == hashes[str(out_path)]):
+                    entry.glossaries[str(out_path)] = previous_entry.glossaries[str(out_path)]
+
+        return new_manifest
+
+    def _rebuild_incremental(self, previous: TranslationManifest) -> TranslationManifest:
+        """
+        Build a manifest from the loaded one, only hashing the files touched during this run.
+
+        Sources bound during this run were already hashed by :meth:`bind_source`; outputs recorded by
+        :meth:`record_output` are re-hashed. Every other source and output is carried forward as is.
+        """
+
+        new_manifest = TranslationManifest(sources={})
+
+        for source, outputs in self._iter_config_files():
+            stat: FileStat | None = self._files.get(str(source)) or previous.files.get(str(source))
+            if stat is None:
+                if not source.exists():
+                    continue
+                self._hash_file(source)
+                stat = self._files[str(source)]
+
+            new_manifest.files[str(source)] = stat
+            entry = new_manifest.sources.setdefault(stat.hash, TREntry(outputs={}))
+            previous_entry: TREntry | None = previous.sources.get(stat.hash)
+
+            for out_path in outputs:
+                key = str(out_path)
+                if key in self._written:
+                    entry.outputs[key] = self._hash_file(out_path)
+                    new_manifest.files[key] = self._files[key]
+                    if self._written[key]:
+                        entry.glossaries[key] = self._written[key]
+                elif previous_entry is not None and key in previous_entry.outputs:
+                    entry.outputs[key] = previous_entry.outputs[key]
+                    if key in previous.files:
+                        new_manifest.files[key] = previous.files[key]
+                    if key in previous_entry.glossaries:
+                        entry.glossaries[key] = previous_entry.glossaries[key]
+
+        return new_manifest
 
     def rebuild_from_config(self, force: bool = False) -> None:
         """
         Build a new manifest from an application configuration and persist it.
 
-        Walks configured resources in ``config`` and for each resource collects the
-        current source file content hash and the hashes of any existing target files
-        for the configured ``targets`` languages. Only files that exist on disk are
-        included (missing files are skipped).
+        By default the manifest is updated incrementally: only the sources bound and the outputs
+        written during this run are hashed, everything else is carried forward from the loaded
+        manifest. A forced rebuild (or a missing manifest) walks every configured resource and
+        hashes every existing source and output in a thread pool.
 
         Parameters
-            config (AppConfig): application configuration containing resources and
-                targets. If ``config.resources`` is falsy, the method does nothing.
+            force (bool): rebuild the manifest from scratch, even if nothing changed during this run.
 
         Side effects
             - Writes the newly built manifest to disk using :meth:`_write_manifest`.
@@ -131,8 +305,6 @@ class TranslationRunManifest:
             self.logger.info(ConsoleFormatter.success("Success."))
             return
 
-        new_manifest = TranslationManifest(version=1, sources={})
-
         if self.cfg.configuration is None:
             return
 
@@ -140,45 +312,25 @@ class TranslationRunManifest:
             self.logger.info(ConsoleFormatter.success("Success."))
             return
 
-        targets = list(self.cfg.configuration.targets or [])
-        for _, resources in self.cfg.configuration.resources.items():
-            for resource in resources:
-                tag = resource.tag
-                for input_path, output_path in resource.bucket:
-                    input_path = Path(input_path)
-                    if not input_path.exists():
-                        continue
-
-                    # source hash
-                    source_content = input_path.read_text(encoding="utf-8")
-                    source_hash = compute_hash(source_content)
-
-                    # ensure entry
-                    entry = new_manifest.sources.get(source_hash)
-                    if entry is None:
-                        entry = TREntry(outputs={})
-                        new_manifest.sources[source_hash] = entry
-
-                    # lazy output ("expected") computation
-                    for lang in targets:
-                        out_path = Path(sanitize_path(str(output_path), tag, lang))
-                        if not out_path.exists():
-                            continue
-
-                        out_content = out_path.read_text(encoding="utf-8")
-                        entry.outputs[str(out_path)] = compute_hash(out_content)
+        new_manifest: TranslationManifest
+        if force or self._manifest is None:
+            new_manifest = self._rebuild_full()
+        else:
+            new_manifest = self._rebuild_incremental(self._manifest)
 
         self._write_manifest(new_manifest)
+        self._manifest = new_manifest
+        self._written.clear()
         self.logger.info(ConsoleFormatter.success("Success."))
 
     def purge(self) -> None:
         """
-        Clear the manifest by writing an empty manifest (version 1) to disk.
+        Clear the manifest by writing an empty manifest to disk.
         """
 
         self.logger.warning(ConsoleFormatter.warning("Purging translation manifest..."))
 
-        empty = TranslationManifest(version=1, sources={})
+        empty = TranslationManifest(sources={})
         self._write_manifest(empty)
 
         self.logger.info(ConsoleFormatter.success("Translation manifest purged successfully."))
@@ -1,56 +1,89 @@
 import html
 import re
+from pathlib import Path
+from typing import Any, Sequence
 
 from transctl.core.constants.supported_languages import SUPPORTED_LANGUAGES_AZURE
+from transctl.core.errors.translation_errors import RetryableTranslationError
+from transctl.core.glossary import Glossary
 from transctl.core.translators.base_translator import BaseTranslator
+from transctl.core.translators.glossary_matcher import GlossaryMatcher
+from transctl.core.translators.rate_limiter import parse_retry_after
+from transctl.core.translators.request_packer import RequestLimits, pack_requests
 from transctl.models.engine_config import AzureTranslateEngine
 
 from azure.ai.translation.text import TextTranslationClient
 from azure.ai.translation.text.models import TranslatedTextItem
 from azure.core.credentials import AzureKeyCredential
+from azure.core.exceptions import HttpResponseError, ServiceRequestError
+
+
+def _utf16_length(text: str) -> int:
+    return len(text.encode("utf-16-le")) // 2
 
 
 class AzureTranslator(BaseTranslator):
-    def __init__(self, config: AzureTranslateEngine) -> None:
-        super().__init__(SUPPORTED_LANGUAGES_AZURE, config.protection_tag)
+    # Azure accepts up to 1,000 texts and 50,000 characters per request.
+    LIMITS: RequestLimits = RequestLimits(max_items=1000, max_size=50_000, measure=_utf16_length)
+
+    def __init__(self, config: AzureTranslateEngine, working_dir: Path | None = None) -> None:
+        super().__init__(SUPPORTED_LANGUAGES_AZURE, config.protection_tag, config.rate_limit)
 
         self.supported_languages = SUPPORTED_LANGUAGES_AZURE
         self._config = config
+        # Failed requests are retried by the rate limiter only: the client's retry policy would otherwise retry 408,
+        # 429 and 5xx on its own, multiplying the attempts and hiding throttling from the limiter.
         self._client: TextTranslationClient = TextTranslationClient(
             region=config.region,
-            credential=AzureKeyCredential(config.api_key)
+            credential=AzureKeyCredential(config.api_key),
+            retry_total=0
         )
 
-    def _apply_dynamic_glossary(self, text: str, glossary: dict[str, str]) -> str:
-        protected_span_re = re.compile(
+        self._protected_span_re: re.Pattern[str] = re.compile(
             rf'<span[^>]*\bclass="{re.escape(self.tag)}"[^>]*>.*?</span>',
             flags=re.IGNORECASE | re.DOTALL,
         )
 
-        chunks = protected_span_re.split(text)
-        protected_chunks = protected_span_re.findall(text)
+    def _glossary_matcher(self, glossary: Glossary) -> GlossaryMatcher:
+        """
+        Returns the compiled matcher of a glossary, compiled once per glossary and protection tag.
+
+        Args:
+            glossary (Glossary): The glossary.
+
+        Returns:
+            GlossaryMatcher: A matcher replacing every term by its protected translation.
+        """
 
-        word_re = re.compile(r"\w+|\W+", re.UNICODE)
+        def build(g: Glossary) -> GlossaryMatcher:
+            return GlossaryMatcher({
+                term: f'<span class="{self.tag}">{html.escape(repl, quote=False)}</span>' for term, repl in g.entries.items()
+            })
 
-        def replace_words(chunk: str) -> str:
-            parts = word_re.findall(chunk)
-            for i, tok in enumerate(parts):
-                if re.fullmatch(r"\w+", tok, flags=re.UNICODE):
-                    repl = glossary.get(tok)
-                    if repl is not None:
-                        parts[i] = f'<span class="{self.tag}">{html.escape(repl, quote=False)}</span>'
-            return "".join(parts)
+        return glossary.compiled(f"azure-matcher:{self.tag}", build)
 
-        # Rebuild.
-        out = []
-        for i, unprot in enumerate(chunks):
-            out.append(replace_words(unprot))
-            if i < len(protected_chunks):
-                out.append(protected_chunks[i])
+    def pack(self, texts: Sequence[str], glossary: Glossary | None = None) -> list[range]:
+        # The glossary spans count towards the request size, so texts are measured as they are sent.
+        if glossary is None or not glossary.entries:
+            return super().pack(texts)
 
+        matcher: GlossaryMatcher = self._glossary_matcher(glossary)
+        return pack_requests([self._apply_dynamic_glossary(t, matcher) for t in texts], self.LIMITS)
+
+    def _apply_dynamic_glossary(self, text: str, matcher: GlossaryMatcher) -> str:
+        out: list[str] = []
+        last: int = 0
+
+        # Terms are only replaced outside the already protected spans.
+        for span in self._protected_span_re.finditer(text):
+            out.append(matcher.replace(text[last:span.start()]))
+            out.append(span.group(0))
+            last = span.end()
+
+        out.append(matcher.replace(text[last:]))
         return "".join(out)
 
-    def translate(self, source: str, target: str, text: str | list[str], glossary: dict[str, str] | None = None) -> str | list[str]:
+    def translate(self, source: str, target: str, text: str | list[str], glossary: Glossary | None = None) -> str | list[str]:
         source_code: str | None = self.supported_languages.get(source, None)
         target_code: str | None = self.supported_languages.get(target, None)
 
@@ -69,18 +102,29 @@ class AzureTranslator(BaseTranslator):
             is_list = False
             texts = [text]
 
-        if glossary is not None:
-            if is_list:
-                texts = [self._apply_dynamic_glossary(t, glossary) for t in texts]
-            else:
-                texts = [self._apply_dynamic_glossary(str(texts), glossary)]
-
-        result: list[TranslatedTextItem] = self._client.translate(
-            body=texts,
-            to_language=[target_code],
-            from_language=source_code,
-            text_type="html"
-        )
-
-        response = [item.translations[0].text for item in result]
+        if glossary is not None and glossary.entries:
+            matcher: GlossaryMatcher = self._glossary_matcher(glossary)
+            texts = [self._apply_dynamic_glossary(t, matcher) for t in texts]
+
+        def request(batch: list[str]) -> list[str]:
+            try:
+                result: list[TranslatedTextItem] = self._client.translate(
+                    body=batch,
+                    to_language=[target_code],
+                    from_language=source_code,
+                    text_type="html"
+                )
+            except HttpResponseError as e:
+                status: int = e.status_code or 0
+                if status == 429 or status >= 500:
+                    headers: Any = getattr(e.response, "headers", None) or {}
+                    retry_after: float | None = parse_retry_after(headers.get("Retry-After"))
+                    raise RetryableTranslationError(str(e), retry_after=retry_after, throttled=status == 429) from e
+                raise
+            except ServiceRequestError as e:
+                raise RetryableTranslationError(str(e)) from e
+
+            return [item.translations[0].text for item in result]
+
+        response: list[str] = self.rate_limiter.call(lambda: request(texts))
         return response if is_list else response[0]
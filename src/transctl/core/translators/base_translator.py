@@ -1,12 +1,38 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Sequence
+
+from transctl.core.glossary import Glossary
+from transctl.core.translators.rate_limiter import RateLimiter
+from transctl.core.translators.request_packer import RequestLimits, pack_requests
+from transctl.models.policies import RateLimitPolicy
 
 
 class BaseTranslator(ABC):
-    def __init__(self, supported_languages: Dict[str, str], tag: str) -> None:
+    # Limits of a single provider request, see :meth:`pack`. A list given to :meth:`translate` is sent in a single
+    # request, so callers pack the texts first.
+    LIMITS: RequestLimits = RequestLimits(max_items=50)
+
+    def __init__(self, supported_languages: Dict[str, str], tag: str, rate_limit: RateLimitPolicy | None = None) -> None:
         self.supported_languages: Dict[str, str] = supported_languages
         self.tag: str = tag
+        # Shared by every request of the translator, including concurrent ones.
+        self.rate_limiter: RateLimiter = RateLimiter(rate_limit if rate_limit is not None else RateLimitPolicy())
+
+    def pack(self, texts: Sequence[str], glossary: Glossary | None = None) -> List[range]:
+        """
+        Splits a list of texts into the fewest consecutive requests that fit the provider limits.
+
+        Args:
+            texts (Sequence[str]): The texts to translate.
+            glossary (Optional[Glossary]): The glossary the texts are translated with, for translators sending it
+                                           along with the texts.
+
+        Returns:
+            List[range]: The index range of every request, in order.
+        """
+
+        return pack_requests(texts, self.LIMITS)
 
     @abstractmethod
-    def translate(self, source: str, target: str, text: str | List[str], glossary: Dict[str, str] | None = None) -> str | List[str]:
+    def translate(self, source: str, target: str, text: str | List[str], glossary: Glossary | None = None) -> str | List[str]:
         pass
@@ -0,0 +1,125 @@
+import logging
+import threading
+from pathlib import Path
+
+from transctl.console_formater import ConsoleFormatter
+from transctl.core.glossary import Glossary
+from transctl.models.glossary_registry import GlossaryRecord, GlossaryRegistryFile
+from transctl.utils.i_o import dumps_json, loads_json
+from transctl.utils.utils_suit import compute_hash
+
+import deepl
+from deepl import GlossaryInfo
+
+
+class DeepLGlossaryRegistry:
+    """
+    Keeps track of the glossaries created on DeepL so each one is created once and reused across calls and runs.
+
+    Glossaries are keyed by a hash of their language pair and entries. When the entries of a language pair change, a
+    new glossary is created and the previous one is deleted. The registry is persisted as JSON in the working
+    directory; without a path, glossaries are only reused within the run.
+
+    Attributes:
+        path (Optional[Path]): The JSON file the registry is persisted to.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.path: Path | None = path
+        self._lock: threading.Lock = threading.Lock()
+        self._registry: GlossaryRegistryFile = self._load()
+
+    def _load(self) -> GlossaryRegistryFile:
+        if self.path is None or not self.path.exists():
+            return GlossaryRegistryFile()
+
+        try:
+            return GlossaryRegistryFile.model_validate(loads_json(self.path.read_bytes()))
+        except (OSError, ValueError) as e:
+            self.logger.warning(ConsoleFormatter.warning(f"Ignoring unreadable glossary registry {self.path}: {e}"))
+            return GlossaryRegistryFile()
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+
+        self.path.write_bytes(dumps_json(self._registry.model_dump(mode="json")))
+
+    @staticmethod
+    def key(source_lang: str, target_lang: str, glossary: Glossary) -> str:
+        """
+        Returns the key of a glossary, which changes whenever its language pair or entries change.
+
+        Args:
+            source_lang (str): The DeepL source language code.
+            target_lang (str): The DeepL target language code.
+            glossary (Glossary): The glossary.
+
+        Returns:
+            str: The glossary key.
+        """
+
+        return compute_hash(f"{source_lang}:{target_lang}:{glossary.digest}")
+
+    def get_or_create(self, translator: deepl.Translator, source_lang: str, target_lang: str, glossary: Glossary) -> str:
+        """
+        Returns the ID of the glossary of a language pair, creating it if its entries are not registered yet.
+
+        Args:
+            translator (deepl.Translator): The DeepL client.
+            source_lang (str): The DeepL source language code.
+            target_lang (str): The DeepL target language code.
+            glossary (Glossary): The glossary.
+
+        Returns:
+            str: The glossary ID.
+        """
+
+        key: str = self.key(source_lang, target_lang, glossary)
+
+        with self._lock:
+            record: GlossaryRecord | None = self._registry.glossaries.get(key)
+            if record is not None:
+                return record.glossary_id
+
+            created: GlossaryInfo = translator.create_glossary(
+                name=f"transctl-{source_lang}-{target_lang}-{key[:12]}",
+                source_lang=source_lang,
+                target_lang=target_lang,
+                entries=dict(glossary.entries)
+            )
+
+            # The glossary of this language pair changed: the previous one is no longer needed.
+            stale: list[str] = [
+                k for k, r in self._registry.glossaries.items() if (r.source_lang, r.target_lang) == (source_lang, target_lang)
+            ]
+            for stale_key in stale:
+                self._delete(translator, self._registry.glossaries.pop(stale_key).glossary_id)
+
+            self._registry.glossaries[key] = GlossaryRecord(glossary_id=created.glossary_id, source_lang=source_lang, target_lang=target_lang)
+            self._save()
+            return created.glossary_id
+
+    def forget(self, glossary_id: str) -> None:
+        """
+        Drops a glossary from the registry, e.g. when it was deleted on the provider side.
+
+        Args:
+            glossary_id (str): The glossary ID.
+        """
+
+        with self._lock:
+            keys: list[str] = [k for k, r in self._registry.glossaries.items() if r.glossary_id == glossary_id]
+            for key in keys:
+                del self._registry.glossaries[key]
+
+            if keys:
+                self._save()
+
+    def _delete(self, translator: deepl.Translator, glossary_id: str) -> None:
+        try:
+            translator.delete_glossary(glossary_id)
+        except deepl.DeepLException as e:
+            # Already gone or not ours to delete anymore; the registry no longer refers to it either way.
+            self.logger.warning(ConsoleFormatter.warning(f"Could not delete DeepL glossary {glossary_id}: {e}"))
@@ -1,19 +1,41 @@
-from typing import Dict, List
+import json
+from pathlib import Path
+from typing import List, cast
 
 from transctl.core.constants.supported_languages import SUPPORTED_LANGUAGES_DEEPL
+from transctl.core.errors.translation_errors import RetryableTranslationError
+from transctl.core.glossary import Glossary
 from transctl.core.translators.base_translator import BaseTranslator
+from transctl.core.translators.deepl_glossary_registry import DeepLGlossaryRegistry
+from transctl.core.translators.request_packer import RequestLimits
 from transctl.models.engine_config import DeepLEngine
 
 import deepl
-from deepl import GlossaryInfo, TextResult
+from deepl import TextResult
+
+
+def _json_size(text: str) -> int:
+    # Size of a text in the JSON request body (ASCII-escaped, plus its separator).
+    return len(json.dumps(text)) + 1
 
 
 class DeepLTranslator(BaseTranslator):
-    def __init__(self, config: DeepLEngine) -> None:
-        super().__init__(SUPPORTED_LANGUAGES_DEEPL, config.protection_tag)
+    # DeepL accepts up to 50 texts and 128 KiB per request; 1 KiB is left for the other request parameters.
+    LIMITS: RequestLimits = RequestLimits(max_items=50, max_size=127 * 1024, measure=_json_size)
+
+    # File of the working directory the created glossaries are recorded in.
+    GLOSSARY_REGISTRY: str = "deepl_glossaries.json"
+
+    def __init__(self, config: DeepLEngine, working_dir: Path | None = None) -> None:
+        super().__init__(SUPPORTED_LANGUAGES_DEEPL, config.protection_tag, config.rate_limit)
+        # Failed requests are retried by the rate limiter only: the client would otherwise retry 429 and 5xx on its
+        # own, multiplying the attempts and hiding throttling from the limiter. The setting is global to the client.
+        deepl.http_client.max_network_retries = 0
         self._translator: deepl.Translator = deepl.Translator(config.api_key)
+        self._glossaries: DeepLGlossaryRegistry = DeepLGlossaryRegistry(
+            working_dir.joinpath(self.GLOSSARY_REGISTRY) if working_dir is not None else None)
 
-    def translate(self, source: str, target: str, text: str | List[str], glossary: Dict[str, str] | None = None) -> str | List[str]:
+    def translate(self, source: str, target: str, text: str | List[str], glossary: Glossary | None = None) -> str | List[str]:
         source_code: str | None = self.supported_languages.get(source, None)
         target_code: str | None = self.supported_languages.get(target, None)
 
@@ -23,32 +45,46 @@ class DeepLTranslator(BaseTranslator):
         if target_code is None:
             raise ValueError(f"Language {target} is not supported.")
 
-        glos: GlossaryInfo | None = None
-        if glossary is not None:
-            glos = self._translator.create_glossary(
-                name=f"glos-{source_code}-{target_code}",
-                source_lang=source_code,
-                target_lang=target_code,
-                entries=glossary
-            )
+        glossary_id: str | None = None
+        if glossary is not None and glossary.entries:
+            glossary_id = self._glossaries.get_or_create(self._translator, source_code, target_code, glossary)
+
+        def request(texts: str | list[str]) -> TextResult | list[TextResult]:
+            try:
+                return self._translator.translate_text(
+                    texts,
+                    source_lang=source_code,
+                    target_lang=target_code,
+                    tag_handling="xml",
+                    ignore_tags=self.tag,
+                    glossary=glossary_id
+                )
+            except deepl.TooManyRequestsException as e:
+                raise RetryableTranslationError(str(e), throttled=True) from e
+            except deepl.DeepLException as e:
+                if isinstance(e, deepl.ConnectionException) or (e.http_status_code or 0) >= 500:
+                    raise RetryableTranslationError(str(e)) from e
+                raise
+
+        def send(texts: str | list[str]) -> TextResult | list[TextResult]:
+            return self.rate_limiter.call(lambda: request(texts))
+
+        def translate_all() -> str | List[str]:
+            if isinstance(text, list):
+                return [res.text for res in cast(list[TextResult], send(text))]
+
+            return cast(TextResult, send(text)).text
 
-        result: TextResult | list[TextResult]
         try:
-            result = self._translator.translate_text(
-                text,
-                source_lang=source_code,
-                target_lang=target_code,
-                tag_handling="xml",
-                ignore_tags=self.tag,
-                glossary=glos
-            )
+            try:
+                return translate_all()
+            except deepl.DeepLException as e:
+                if glossary_id is None or e.http_status_code != 404:
+                    raise
+
+                # The registered glossary was deleted on DeepL: create it again, once.
+                self._glossaries.forget(glossary_id)
+                glossary_id = self._glossaries.get_or_create(self._translator, source_code, target_code, cast(Glossary, glossary))
+                return translate_all()
         except deepl.DeepLException as e:
             raise RuntimeError(f"Translation failed: {e}")
-        finally:
-            if glos is not None:
-                self._translator.delete_glossary(glos)
-
-        if isinstance(result, list):
-            return [res.text for res in result]
-
-        return result.text
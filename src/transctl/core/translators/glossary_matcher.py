@@ -0,0 +1,111 @@
+import re
+from typing import Any, Iterator
+
+
+class GlossaryMatcher:
+    """
+    Replaces glossary terms, including multi-word terms, in a single left-to-right pass over a text.
+
+    Texts and terms are split into word tokens and single non-word characters, and the terms are compiled into a trie
+    of tokens. At every token the longest term starting there wins, and matching resumes after it, so terms only
+    match whole words and never overlap.
+
+    Attributes:
+        size (int): The number of terms.
+    """
+
+    TOKEN_RE: re.Pattern[str] = re.compile(r"\w+|\W", re.UNICODE)
+
+    # Trie key of the replacement of a term. Tokens are never empty, so it cannot clash with one.
+    _END: str = ""
+
+    def __init__(self, entries: dict[str, str]) -> None:
+        self._trie: dict[str, Any] = {}
+        self.size: int = 0
+
+        for term, replacement in entries.items():
+            tokens: list[str] = self.TOKEN_RE.findall(term)
+            if not tokens:
+                continue
+
+            node: dict[str, Any] = self._trie
+            for token in tokens:
+                node = node.setdefault(token, {})
+
+            node[self._END] = replacement
+            self.size += 1
+
+    def find(self, text: str) -> list[str]:
+        """
+        Lists the replacement of every glossary term of a text, in order of appearance.
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            list[str]: The replacement of every matched term.
+        """
+
+        if not self._trie or not text:
+            return []
+
+        return [replacement for _, _, replacement in self._matches(self.TOKEN_RE.findall(text))]
+
+    def replace(self, text: str) -> str:
+        """
+        Replaces every glossary term of a text.
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            str: The text with every term replaced by its replacement.
+        """
+
+        if not self._trie or not text:
+            return text
+
+        tokens: list[str] = self.TOKEN_RE.findall(text)
+        out: list[str] = []
+        position: int = 0
+
+        for start, end, replacement in self._matches(tokens):
+            out.extend(tokens[position:start])
+            out.append(replacement)
+            position = end
+
+        out.extend(tokens[position:])
+        return "".join(out)
+
+    def _matches(self, tokens: list[str]) -> Iterator[tuple[int, int, str]]:
+        # Yields the token range and replacement of every longest, non-overlapping match.
+        trie: dict[str, Any] = self._trie
+        end_key: str = self._END
+        count: int = len(tokens)
+        i: int = 0
+
+        while i < count:
+            node: dict[str, Any] | None = trie.get(tokens[i])
+            if node is None:
+                i += 1
+                continue
+
+            match_end: int = -1
+            replacement: str = ""
+            j: int = i + 1
+            while True:
+                if end_key in node:
+                    match_end, replacement = j, node[end_key]
+                if j >= count:
+                    break
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                j += 1
+
+            if match_end < 0:
+                i += 1
+                continue
+
+            yield i, match_end, replacement
+            i = match_end
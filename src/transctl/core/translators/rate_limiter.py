@@ -0,0 +1,188 @@
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, TypeVar
+
+from transctl.console_formater import ConsoleFormatter
+from transctl.core.errors.translation_errors import RetryableTranslationError
+from transctl.models.policies import RateLimitPolicy
+
+
+T = TypeVar("T")
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parses a Retry-After header, given either in seconds or as an HTTP date.
+
+    Args:
+        value (Optional[str]): The header value.
+
+    Returns:
+        Optional[float]: The delay in seconds, or None if the header is missing or invalid.
+    """
+
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at: datetime = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """
+    Throttles and retries the requests of a translator.
+
+    Requests are paced by a token bucket shared by every thread using the translator. A request failing with a
+    :class:`RetryableTranslationError` is retried after the delay the provider asked for (Retry-After), or after an
+    exponential backoff with jitter, either capped at ``backoff_max_s``. The delay pauses every request, not only the one that failed, so concurrent
+    workers do not keep hitting a throttled provider. When the provider throttles, the rate is halved, then recovers
+    gradually on success, so throughput settles just below the provider quota.
+
+    Attributes:
+        policy (RateLimitPolicy): The throttling and retry policy.
+    """
+
+    # Share of the configured rate recovered after every successful request.
+    RECOVERY_STEP: float = 0.05
+    # Lowest share of the configured rate the limiter slows down to.
+    MIN_RATE_FACTOR: float = 1 / 32
+
+    def __init__(self, policy: RateLimitPolicy, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep, jitter: Callable[[], float] = random.random) -> None:
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.policy: RateLimitPolicy = policy
+
+        self._clock: Callable[[], float] = clock
+        self._sleep: Callable[[float], None] = sleep
+        self._jitter: Callable[[], float] = jitter
+        self._lock: threading.Lock = threading.Lock()
+
+        self._rate: float | None = policy.requests_per_second
+        self._tokens: float = float(policy.burst)
+        self._updated: float = clock()
+        self._paused_until: float = 0.0
+
+    @property
+    def rate(self) -> float | None:
+        """
+        The current request rate, in requests per second, or None if requests are not throttled.
+        """
+
+        return self._rate
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request may be sent.
+        """
+
+        while True:
+            with self._lock:
+                now: float = self._clock()
+                wait: float = self._paused_until - now
+
+                if wait <= 0:
+                    if self._rate is None:
+                        return
+
+                    self._tokens = min(float(self.policy.burst), self._tokens + (now - self._updated) * self._rate)
+                    self._updated = now
+                    # Tolerate rounding in the refill, otherwise a token could stay a hair short of complete.
+                    if self._tokens >= 1 - 1e-9:
+                        self._tokens = max(0.0, self._tokens - 1)
+                        return
+
+                    wait = (1 - self._tokens) / self._rate
+
+            self._sleep(wait)
+
+    def pause(self, delay: float, throttled: bool = False) -> None:
+        """
+        Holds every request for a given delay.
+
+        Args:
+            delay (float): The delay in seconds.
+            throttled (bool): Whether the provider throttled the request, in which case the rate is halved.
+        """
+
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + delay)
+
+            # Resume at a steady pace rather than with a burst.
+            self._tokens = 0.0
+            self._updated = self._paused_until
+
+            configured: float | None = self.policy.requests_per_second
+            if throttled and self._rate is not None and configured is not None:
+                self._rate = max(configured * self.MIN_RATE_FACTOR, self._rate / 2)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the delay before a retry when the provider gave no Retry-After.
+
+        Args:
+            attempt (int): The number of the retry, starting at 0.
+
+        Returns:
+            float: A delay between half and all of the exponential backoff.
+        """
+
+        delay: float = min(self.policy.backoff_max_s, self.policy.backoff_base_s * (2 ** attempt))
+        return delay / 2 + self._jitter() * delay / 2
+
+    def call(self, request: Callable[[], T]) -> T:
+        """
+        Sends a request once the rate limit allows it, retrying it while it fails with a retryable error.
+
+        Args:
+            request (Callable[[], T]): Sends the request.
+
+        Returns:
+            T: The result of the request.
+
+        Raises:
+            RetryableTranslationError: if the request still fails after ``max_retries`` retries.
+        """
+
+        attempt: int = 0
+        while True:
+            self.acquire()
+            try:
+                result: T = request()
+            except RetryableTranslationError as e:
+                if attempt >= self.policy.max_retries:
+                    raise
+
+                # A Retry-After far in the future is capped like the backoff, so a provider cannot stall the run.
+                delay: float = min(e.retry_after, self.policy.backoff_max_s) if e.retry_after is not None else self.backoff(attempt)
+                self.logger.warning(ConsoleFormatter.warning(f"Translation request failed ({e}). Retrying in {delay:.1f}s..."))
+                self.pause(delay, throttled=e.throttled)
+                attempt += 1
+                continue
+
+            self._recover()
+            return result
+
+    def _recover(self) -> None:
+        configured: float | None = self.policy.requests_per_second
+        if configured is None:
+            return
+
+        with self._lock:
+            if self._rate is not None and self._rate < configured:
+                self._rate = min(configured, self._rate + configured * self.RECOVERY_STEP)
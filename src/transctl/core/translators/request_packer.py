@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+
+@dataclass(frozen=True)
+class RequestLimits:
+    """
+    The limits of a single translation request of a provider.
+
+    Attributes:
+        max_items (int): The maximum number of texts in a request.
+        max_size (Optional[int]): The maximum total size of the texts of a request, as measured by ``measure``.
+        measure (Callable[[str], int]): The size a text takes up in a request.
+    """
+
+    max_items: int
+    max_size: int | None = None
+    measure: Callable[[str], int] = len
+
+
+def pack_requests(texts: Sequence[str], limits: RequestLimits) -> list[range]:
+    """
+    Splits a list of texts into consecutive requests that fit the provider limits.
+
+    Requests are filled greedily, which yields the fewest requests of any split that keeps the texts in order.
+    A text that exceeds ``max_size`` on its own is sent in a request of its own.
+
+    Args:
+        texts (Sequence[str]): The texts to translate.
+        limits (RequestLimits): The provider limits.
+
+    Returns:
+        list[range]: The index range of every request, in order.
+    """
+
+    requests: list[range] = []
+    start: int = 0
+    size: int = 0
+
+    for index, text in enumerate(texts):
+        cost: int = limits.measure(text) if limits.max_size is not None else 0
+        count: int = index - start
+
+        if count and (count >= limits.max_items or (limits.max_size is not None and size + cost > limits.max_size)):
+            requests.append(range(start, index))
+            start, size = index, 0
+
+        size += cost
+
+    if start < len(texts):
+        requests.append(range(start, len(texts)))
+
+    return requests
+
@@ -8,6 +8,7 @@ from transctl.core.constants.supported_languages import SUPPORTED_LANGUAGES
 from transctl.core.errors.configuration_errors import ConfigurationError
 from transctl.core.factory.engine_factory import EngineFactory
 from transctl.models.engine_config import EngineConfig
+from transctl.models.policies import PerformancePolicy, PrunePolicy
 from transctl.models.translation_resource import TranslationResource, TranslationResourceType
 
 import tomli
@@ -27,12 +28,16 @@ class AppConfig(BaseModel):
      targets (Optional[list[str]]): List of target locales.
      engine (EngineConfig): The translation engine.
      resources (Optional[dict[TranslationResourceType, list[TranslationResource]]]): A mapping of translation resource types to lists of translation resources, defining where to find the content to be translated and how to structure the output.
+     prune (PrunePolicy): The translation memory pruning policy.
+     performance (PerformancePolicy): The concurrency policy of translation runs.
     """
 
     source: str
     targets: list[str] = []
     engine: EngineConfig
     resources: Optional[dict[TranslationResourceType, list[TranslationResource]]] = None
+    prune: PrunePolicy = PrunePolicy()
+    performance: PerformancePolicy = PerformancePolicy()
 
     @classmethod
     def _parse_translation_resources(cls, data: Any, path_resolution_key: str) -> dict[TranslationResourceType, list[TranslationResource]] | None:
@@ -96,9 +101,13 @@ class AppConfig(BaseModel):
 
         engine_config: Any = obj.get("engine", None)
         translation_resource_config: Any = obj.get("resources", None)
+        prune_config: Any = obj.get("prune", {})
+        performance_config: Any = obj.get("performance", {})
 
         engine: EngineConfig
         resources: dict[TranslationResourceType, list[TranslationResource]] | None
+        prune: PrunePolicy
+        performance: PerformancePolicy
 
         if not source or source is None:
             raise ConfigurationError("No source locale specified.")
@@ -120,6 +129,8 @@ class AppConfig(BaseModel):
             logger.info(ConsoleFormatter.success("Localization engine setup success."))
 
             resources = cls._parse_translation_resources(translation_resource_config, path_resolution_key=source)
+            prune = PrunePolicy.model_validate(prune_config)
+            performance = PerformancePolicy.model_validate(performance_config)
         except (ValidationError, ValueError, TypeError) as e:
             raise ConfigurationError(str(e)) from e
 
@@ -127,7 +138,9 @@ class AppConfig(BaseModel):
             source=source,
             targets=targets,
             engine=engine,
-            resources=resources
+            resources=resources,
+            prune=prune,
+            performance=performance
         )
 
     @classmethod
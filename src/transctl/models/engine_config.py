@@ -1,9 +1,10 @@
 import re
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import cached_property
 from typing import Annotated, Any, Literal, Self, Union
 
-from transctl.utils.utils_suit import normalize_text
+from transctl.models.policies import RateLimitPolicy
 
 from pydantic import BaseModel, Field, ValidationError, model_validator
 
@@ -21,6 +22,7 @@ class Engine(str, Enum):
 class TranslatorBase(BaseModel, ABC):
     api_key: str = Field(title="API Key", json_schema_extra={"visible": False})
     protection_tag: str
+    rate_limit: RateLimitPolicy = Field(default_factory=RateLimitPolicy, json_schema_extra={"visible": False})
 
     @model_validator(mode="before")
     @classmethod
@@ -38,13 +40,13 @@ class TranslatorBase(BaseModel, ABC):
         return self
 
     @abstractmethod
-    def protect_text(self, text: str, patterns: list[re.Pattern[str]]) -> str:
+    def protect_text(self, text: str, pattern: re.Pattern[str]) -> str:
         """
-        Protects text for translation by wrapping matches of the given patterns in specified tags.
+        Protects text for translation by wrapping every match of the given pattern in specified tags, in a single pass.
 
         Args:
             text (str): The input text to protect.
-            patterns (list[re.Pattern[str]]): A list of compiled regular expression patterns to match-text that should be protected.
+            pattern (re.Pattern[str]): The compiled regular expression matching the text that should be protected.
 
         Returns:
             str: The text with protected segments wrapped in tags.
@@ -85,31 +87,34 @@ class DeepLEngine(TranslatorBase):
     provider: Literal[Engine.DeepL] = Field(title="Provider", json_schema_extra={"visible": False}, default=Engine.DeepL)
     protection_tag: str = Field(json_schema_extra={"visible": False}, default="keep")
 
-    def protect_text(self, text: str, patterns: list[re.Pattern[str]]) -> str:
-        def _sub(match: re.Match[str]) -> str:
-            return f"<{self.protection_tag}>{match.group(0)}</{self.protection_tag}>"
-
-        out = text
-        for pattern in patterns:
-            out = re.sub(pattern, _sub, out)
-
-        return out
+    def protect_text(self, text: str, pattern: re.Pattern[str]) -> str:
+        return pattern.sub(self._wrap, text)
 
     def unprotect_text(self, text: str) -> str:
-        return re.sub(
-            rf"</?{re.escape(self.protection_tag)}>",
-            "",
-            text
-        )
+        if self.protection_tag not in text:
+            return text
+
+        return self._tag_re.sub("", text)
 
     def is_placeholder_only(self, protected_text: str) -> bool:
-        remainder = re.sub(
-            rf"<{re.escape(self.protection_tag)}>\s*.*?\s*</{re.escape(self.protection_tag)}>",
-            "",
-            protected_text,
-            flags=re.DOTALL,
-        )
-        return normalize_text(remainder) == ""
+        if self.protection_tag not in protected_text:
+            return not protected_text.strip()
+
+        remainder = self._protected_re.sub("", protected_text)
+        return not remainder.strip()
+
+    # The tag regexes run for every segment of every target, so they are compiled once per engine.
+    @cached_property
+    def _tag_re(self) -> re.Pattern[str]:
+        return re.compile(rf"</?{re.escape(self.protection_tag)}>")
+
+    @cached_property
+    def _protected_re(self) -> re.Pattern[str]:
+        tag: str = re.escape(self.protection_tag)
+        return re.compile(rf"<{tag}>\s*.*?\s*</{tag}>", flags=re.DOTALL)
+
+    def _wrap(self, match: re.Match[str]) -> str:
+        return f"<{self.protection_tag}>{match.group(0)}</{self.protection_tag}>"
 
 
 # ====================================== #
@@ -126,35 +131,34 @@ class AzureTranslateEngine(TranslatorBase):
             raise ValidationError("Azure region is not set.")
         return self
 
-    def protect_text(self, text: str, patterns: list[re.Pattern[str]]) -> str:
-        def _sub(match: re.Match[str]) -> str:
-            return f'<span class="{self.protection_tag}">{match.group(0)}</span>'
-
-        out = text
-        for pattern in patterns:
-            out = re.sub(pattern, _sub, out)
-
-        return out
+    def protect_text(self, text: str, pattern: re.Pattern[str]) -> str:
+        return pattern.sub(self._wrap, text)
 
     def unprotect_text(self, text: str) -> str:
-        if not text:
+        if not text or self.protection_tag not in text:
             return text
 
-        pattern = re.compile(
-            rf'<span\s+class="{re.escape(self.protection_tag)}"\s*>(.*?)</span>',
-            flags=re.IGNORECASE | re.DOTALL,
-        )
-
-        return pattern.sub(r"\1", text)
+        return self._span_re.sub(r"\1", text)
 
     def is_placeholder_only(self, protected_text: str) -> bool:
-        remainder = re.sub(
-            rf'<span[^>]*class="{re.escape(self.protection_tag)}"[^>]*>\s*.*?\s*</span>',
-            "",
-            protected_text,
-            flags=re.IGNORECASE | re.DOTALL,
-        )
-        return normalize_text(remainder) == ""
+        if self.protection_tag not in protected_text:
+            return not protected_text.strip()
+
+        remainder = self._protected_re.sub("", protected_text)
+        return not remainder.strip()
+
+    # The tag regexes run for every segment of every target, so they are compiled once per engine.
+    @cached_property
+    def _span_re(self) -> re.Pattern[str]:
+        return re.compile(rf'<span\s+class="{re.escape(self.protection_tag)}"\s*>(.*?)</span>', flags=re.IGNORECASE | re.DOTALL)
+
+    @cached_property
+    def _protected_re(self) -> re.Pattern[str]:
+        tag: str = re.escape(self.protection_tag)
+        return re.compile(rf'<span[^>]*class="{tag}"[^>]*>\s*.*?\s*</span>', flags=re.IGNORECASE | re.DOTALL)
+
+    def _wrap(self, match: re.Match[str]) -> str:
+        return f'<span class="{self.protection_tag}">{match.group(0)}</span>'
 
 
 # ======================================= #
@@ -172,7 +176,7 @@ class AnthropicEngine(TranslatorBase):
 
         return self
 
-    def protect_text(self, text: str, patterns: list[re.Pattern[str]]) -> str:
+    def protect_text(self, text: str, pattern: re.Pattern[str]) -> str:
         raise NotImplementedError
 
     def unprotect_text(self, text: str) -> str:
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+
+class GlossaryRecord(BaseModel):
+    """
+    A glossary created on the provider side.
+    """
+
+    glossary_id: str
+    source_lang: str
+    target_lang: str
+
+
+class GlossaryRegistryFile(BaseModel):
+    version: int = 1
+    glossaries: dict[str, GlossaryRecord] = {}
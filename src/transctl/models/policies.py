@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, NonNegativeInt, PositiveFloat, PositiveInt
 
 
 class PrunePolicy(BaseModel):
@@ -11,10 +11,65 @@ class PrunePolicy(BaseModel):
         ttl_days: The number of days after which a translation memory entry is considered stale and eligible for pruning.
         max_rows: The maximum number of rows allowed in the translation memory database.
         max_db_mb: The maximum size of the database in megabytes.
+        max_wal_mb: The maximum size of the write-ahead log in megabytes before a prune (and checkpoint) is triggered.
+        every_n_runs: Prune at least once every N translation runs, even if no limit was reached.
         vacuum: Whether to perform a VACUUM operation after pruning to reclaim space.
+        touch_granularity_s: Resolution, in seconds, of the last-used timestamps the TTL and LRU rules rely on. A cached
+                             translation is recorded as used at most once per period.
     """
 
     ttl_days: Optional[int] = 180
     max_rows: Optional[int] = 200_000
     max_db_mb: Optional[int] = 200
+    max_wal_mb: Optional[int] = 64
+    every_n_runs: Optional[int] = 20
     vacuum: bool = True
+    touch_granularity_s: int = 24 * 3600
+
+
+class PerformancePolicy(BaseModel):
+    """
+    Policy for the concurrency of a translation run.
+
+    Attributes:
+        jobs: The maximum number of target languages translated concurrently. Only translator requests run in
+              parallel; translation memory reads and writes stay serialized.
+        processes: The number of worker processes parsing source files and preparing their segments. Translation
+                   memory and manifest writes stay in the main process.
+        stream_threshold_mb: Sources at least this large, in megabytes, are hashed incrementally, and JSON sources are
+                             parsed, translated and written incrementally, so memory stays bounded whatever their size.
+                             HTML sources are tokenized as they are read instead of being built into a tree. None never
+                             streams.
+    """
+
+    jobs: PositiveInt = 1
+    processes: PositiveInt = 1
+    stream_threshold_mb: Optional[PositiveInt] = None
+
+    @property
+    def stream_threshold(self) -> int | None:
+        """
+        The size, in bytes, from which sources are streamed, or None if they never are.
+        """
+
+        return self.stream_threshold_mb * 1024 * 1024 if self.stream_threshold_mb is not None else None
+
+
+class RateLimitPolicy(BaseModel):
+    """
+    Policy for throttling and retrying the requests of a translation engine.
+
+    Attributes:
+        requests_per_second: The sustained request rate. Set it just below the provider quota; when the provider still
+                             throttles, the rate is lowered and recovers gradually. None disables throttling.
+        burst: The number of requests that can be sent back to back before throttling applies.
+        max_retries: The number of times a throttled or failed request is retried before giving up.
+        backoff_base_s: The delay before the first retry, doubled on every retry, when the provider gives no Retry-After.
+        backoff_max_s: The maximum delay between two retries, including the delays the provider asks for.
+    """
+
+    requests_per_second: Optional[PositiveFloat] = None
+    burst: PositiveInt = 1
+    max_retries: NonNegativeInt = 5
+    backoff_base_s: PositiveFloat = 1.0
+    backoff_max_s: PositiveFloat = 60.0
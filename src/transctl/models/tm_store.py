@@ -1,13 +1,14 @@
 import logging
-import os
 import time
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Iterable, Mapping, Optional
 
 from transctl.console_formater import ConsoleFormatter
 from transctl.models.policies import PrunePolicy
 
-from sqlalchemy import Engine, Integer, String, Text, create_engine, delete, func, select, text
+from sqlalchemy import ColumnClause, Connection, Engine, Index, Integer, String, Text, create_engine, delete, event, func, literal_column, select, text, update
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
 
 
@@ -26,6 +27,50 @@ class TM(Base):
     created_at: Mapped[int] = mapped_column(Integer, nullable=False)
     last_used_at: Mapped[int] = mapped_column(Integer, nullable=False)
 
+    # Signature of the glossary entries found in the source text when it was translated (NULL: none).
+    glossary_sig: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+
+    __table_args__ = (
+        Index("ix_tm_last_used_at", "last_used_at"),
+    )
+
+
+class TMStatKey(str, Enum):
+    ROW_ESTIMATE = "row_estimate"
+    RUNS_SINCE_PRUNE = "runs_since_prune"
+    LAST_PRUNED_AT = "last_pruned_at"
+
+
+class TMStat(Base):
+    """
+    Cached statistics about the TM store, cheap to read compared to scanning the ``tm`` table.
+    """
+
+    __tablename__ = "tm_stats"
+
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+def _migrate_last_used_at_index(conn: Connection) -> None:
+    # Stores created before the index existed only get it through this migration, as create_all skips existing tables.
+    conn.exec_driver_sql("CREATE INDEX IF NOT EXISTS ix_tm_last_used_at ON tm (last_used_at);")
+
+
+def _migrate_glossary_sig(conn: Connection) -> None:
+    # Fresh stores are created with the column; only older ones need it added.
+    columns: set[str] = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(tm);")}
+    if "glossary_sig" not in columns:
+        conn.exec_driver_sql("ALTER TABLE tm ADD COLUMN glossary_sig VARCHAR;")
+
+
+# Schema migrations, applied in order. A store's ``PRAGMA user_version`` records how many were applied.
+# Migrations must be idempotent: fresh stores are created with the latest schema before they run.
+MIGRATIONS: list[Callable[[Connection], None]] = [
+    _migrate_last_used_at_index,
+    _migrate_glossary_sig,
+]
+
 
 @dataclass
 class TMStore:
@@ -34,30 +79,127 @@ class TMStore:
 
     Attributes:
         db_path (str): The file path to the SQLite database.
+        touch_granularity (int): Resolution, in seconds, of the recorded last_used_at timestamps. Hits on rows already
+                                 touched within the current period are not written again.
     """
 
     db_path: str
     engine: Optional[Engine] = None
+    touch_granularity: int = 24 * 3600
+
+    # Hits whose last_used_at must be refreshed, buffered per language until flush_touches.
+    _touched: dict[str, set[str]] = field(default_factory=dict, init=False, repr=False)
+
+    # Maximum number of bound parameters used by a single ``IN`` query (SQLite caps host parameters at 999 on older builds).
+    LOOKUP_CHUNK_SIZE = 500
+
+    # Width of the rowid ranges scanned by a single pruning DELETE.
+    PRUNE_CHUNK_ROWS = 50_000
 
     def __post_init__(self) -> None:
+        # File databases use a QueuePool: connections are opened once and reused by every session of the run.
         self.engine = create_engine(f"sqlite:///{self.db_path}", future=True)
+        event.listen(self.engine, "connect", self._configure_connection)
 
         with self.engine.connect() as conn:
             conn.exec_driver_sql("PRAGMA journal_mode=WAL;")
-            conn.exec_driver_sql("PRAGMA synchronous=NORMAL;")
-            conn.exec_driver_sql("PRAGMA foreign_keys=ON;")
             conn.exec_driver_sql("PRAGMA auto_vacuum=INCREMENTAL;")
             conn.commit()
 
         Base.metadata.create_all(self.engine)
+        self._migrate()
+
+    def _migrate(self) -> None:
+        """
+        Applies the schema migrations the store has not seen yet.
+        """
+
+        assert self.engine is not None
+        with self.engine.connect() as conn:
+            version: int = conn.exec_driver_sql("PRAGMA user_version;").scalar() or 0
+            for migration in MIGRATIONS[version:]:
+                migration(conn)
+
+            if version < len(MIGRATIONS):
+                conn.exec_driver_sql(f"PRAGMA user_version={len(MIGRATIONS)};")
+            conn.commit()
+
+    @staticmethod
+    def _configure_connection(dbapi_connection: Any, _connection_record: Any) -> None:
+        # Connection scoped settings; journal_mode and auto_vacuum are persisted in the database file itself.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=NORMAL;")
+        cursor.execute("PRAGMA foreign_keys=ON;")
+        cursor.close()
 
     @staticmethod
     def _now() -> int:
         return int(time.time())
 
+    def _touch_stamp(self) -> int:
+        now = self._now()
+        return now - now % max(self.touch_granularity, 1)
+
+    def _touch(self, lang: str, hash_: str, last_used_at: int) -> None:
+        if last_used_at < self._touch_stamp():
+            self._touched.setdefault(lang, set()).add(hash_)
+
+    def flush_touches(self, session: Session) -> int:
+        """
+        Writes the buffered last_used_at refreshes with a single bulk UPDATE. Every touched row is stamped with the start
+        of the current granularity period.
+
+        Args:
+            session (Session): An active SQLAlchemy session.
+
+        Returns:
+            int: The number of refreshed rows.
+        """
+
+        stamp = self._touch_stamp()
+        params = [
+            {"lang": lang, "hash_": hash_, "last_used_at": stamp}
+            for lang, hashes in self._touched.items()
+            for hash_ in hashes
+        ]
+        self._touched.clear()
+
+        if params:
+            session.execute(update(TM), params)
+
+        return len(params)
+
+    def read_stats(self, session: Session) -> dict[TMStatKey, int]:
+        """
+        Reads the cached statistics of the TM store. The row estimate is seeded with an exact count the first time it is read.
+
+        Args:
+            session (Session): An active SQLAlchemy session.
+
+        Returns:
+            dict[TMStatKey, int]: The cached statistics. Missing counters default to 0.
+        """
+
+        rows = dict(session.execute(select(TMStat.key, TMStat.value)).tuples().all())
+        stats: dict[TMStatKey, int] = {key: rows.get(key.value, 0) for key in TMStatKey}
+
+        if TMStatKey.ROW_ESTIMATE.value not in rows:
+            stats[TMStatKey.ROW_ESTIMATE] = session.scalar(select(func.count()).select_from(TM)) or 0
+            self.write_stat(session, TMStatKey.ROW_ESTIMATE, stats[TMStatKey.ROW_ESTIMATE])
+
+        return stats
+
+    def write_stat(self, session: Session, key: TMStatKey, value: int) -> None:
+        stmt = insert(TMStat).values(key=key.value, value=value)
+        session.execute(stmt.on_conflict_do_update(index_elements=[TMStat.key], set_={"value": stmt.excluded.value}))
+
+    def increment_stat(self, session: Session, key: TMStatKey, delta: int) -> None:
+        stmt = insert(TMStat).values(key=key.value, value=delta)
+        session.execute(stmt.on_conflict_do_update(index_elements=[TMStat.key], set_={"value": TMStat.value + delta}))
+
     def lookup(self, session: Session, lang: str, hash_: str) -> Optional[str]:
         """
-        Looks up a translation in the TM store by language and hash. If found, updates the last_used_at timestamp.
+        Looks up a translation in the TM store by language and hash. If found, buffers a last_used_at refresh (see :meth:`flush_touches`).
 
         Args:
             session (Session): An active SQLAlchemy session.
@@ -71,7 +213,7 @@ class TMStore:
         row = session.get(TM, {"lang": lang, "hash_": hash_})
         if not row:
             return None
-        row.last_used_at = self._now()
+        self._touch(lang, hash_, row.last_used_at)
         return row.translation
 
     def upsert(self, session: Session, lang: str, hash_: str, translation: str) -> None:
@@ -101,73 +243,166 @@ class TMStore:
                 )
             )
 
-    def prune(self, session: Session, policy: PrunePolicy) -> None:
+    def lookup_many(self, session: Session, lang: str, hashes: Iterable[str], signatures: Mapping[str, str] | None = None) -> dict[str, str]:
         """
-        Prunes the Store based on the provided policy.
-        
+        Looks up a set of translations in the TM store using chunked ``IN`` queries. Buffers a last_used_at refresh for every
+        hit not already touched within the current granularity period (see :meth:`flush_touches`).
+
         Args:
             session (Session): An active SQLAlchemy session.
-            policy (PrunePolicy): The pruning policy to apply.
+            lang (str): The target language code.
+            hashes (Iterable[str]): The hashes of the source texts.
+            signatures (Optional[Mapping[str, str]]): The current glossary signature of every hash (missing: no glossary
+                                                      term). Rows translated with another signature are not returned.
+
+        Returns:
+            dict[str, str]: A mapping of hash to translation for every hash found.
         """
 
-        logger: logging.Logger = logging.getLogger(__name__)
-        logger.info(ConsoleFormatter.info("Pruning TM Store..."))
+        keys: list[str] = list(dict.fromkeys(hashes))
+        found: dict[str, str] = {}
+        stamp = self._touch_stamp()
+        touched: set[str] = self._touched.setdefault(lang, set())
 
-        should_prune = False
+        for start in range(0, len(keys), self.LOOKUP_CHUNK_SIZE):
+            chunk: list[str] = keys[start:start + self.LOOKUP_CHUNK_SIZE]
+            rows = session.execute(
+                select(TM.hash_, TM.translation, TM.last_used_at, TM.glossary_sig).where(TM.lang == lang, TM.hash_.in_(chunk))
+            ).all()
 
-        # Condition A: db file too large
-        if policy.max_db_mb is not None and os.path.exists(self.db_path):
-            size_mb = os.path.getsize(self.db_path) / (1024 * 1024)
-            if size_mb > policy.max_db_mb:
-                should_prune = True
+            for hash_, translation, last_used_at, glossary_sig in rows:
+                if signatures is not None and (glossary_sig or "") != signatures.get(hash_, ""):
+                    continue
 
-        # Condition B: row count too high (only compute if needed)
-        row_count = None
-        if policy.max_rows is not None:
-            row_count = session.scalar(select(func.count()).select_from(TM)) or 0
-            if row_count > policy.max_rows:
-                should_prune = True
+                found[hash_] = translation
+                if last_used_at < stamp:
+                    touched.add(hash_)
 
-        # Condition C: TTL is set (we can prune expired entries each run, but only if any exist)
-        # Cheap-ish check: do we have *any* expired entry?
-        if policy.ttl_days is not None:
-            cutoff = self._now() - policy.ttl_days * 24 * 3600
-            expired_exists = session.scalar(
-                select(func.count()).select_from(TM).where(TM.last_used_at < cutoff)
+        return found
+
+    def upsert_many(self, session: Session, lang: str, translations: dict[str, str], signatures: Mapping[str, str] | None = None) -> None:
+        """
+        Inserts or updates a set of translations in the TM store with a single ``INSERT ... ON CONFLICT DO UPDATE`` executemany.
+
+        Args:
+            session (Session): An active SQLAlchemy session.
+            lang (str): The target language code.
+            translations (dict[str, str]): A mapping of source text hash to translated text.
+            signatures (Optional[Mapping[str, str]]): The glossary signature every translation was produced with.
+        """
+
+        if not translations:
+            return
+
+        # Keys already stored are updated in place: only the others add rows to the estimate.
+        keys: list[str] = list(translations)
+        existing: int = 0
+        for start in range(0, len(keys), self.LOOKUP_CHUNK_SIZE):
+            existing += session.scalar(
+                select(func.count()).select_from(TM).where(TM.lang == lang, TM.hash_.in_(keys[start:start + self.LOOKUP_CHUNK_SIZE]))
+            ) or 0
+
+        now = self._now()
+        stmt = insert(TM)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TM.lang, TM.hash_],
+            set_={
+                "translation": stmt.excluded.translation,
+                "last_used_at": stmt.excluded.last_used_at,
+                "glossary_sig": stmt.excluded.glossary_sig,
+            },
+        )
+
+        sigs: Mapping[str, str] = signatures or {}
+        session.execute(
+            stmt,
+            [
+                {
+                    "lang": lang, "hash_": hash_, "translation": translation, "created_at": now, "last_used_at": now,
+                    "glossary_sig": sigs.get(hash_) or None,
+                }
+                for hash_, translation in translations.items()
+            ],
+        )
+
+        if len(keys) > existing:
+            self.increment_stat(session, TMStatKey.ROW_ESTIMATE, len(keys) - existing)
+
+    def _delete_used_before(self, session: Session, cutoff: int) -> int:
+        """
+        Deletes every row last used before ``cutoff``, walking the table in rowid ranges so pages are visited sequentially.
+
+        Args:
+            session (Session): An active SQLAlchemy session.
+            cutoff (int): The exclusive last_used_at upper bound.
+
+        Returns:
+            int: The number of deleted rows.
+        """
+
+        rowid: ColumnClause[Any] = literal_column("rowid")
+        low, high = session.execute(select(func.min(rowid), func.max(rowid)).select_from(TM)).one()
+        if low is None:
+            return 0
+
+        deleted: int = 0
+        for start in range(low, high + 1, self.PRUNE_CHUNK_ROWS):
+            result = session.execute(
+                delete(TM)
+                .where(rowid >= start, rowid < start + self.PRUNE_CHUNK_ROWS, TM.last_used_at < cutoff)
+                .execution_options(synchronize_session=False)
             )
-            if expired_exists and expired_exists > 0:
-                should_prune = True
+            deleted += getattr(result, "rowcount", 0) or 0
 
-        if not should_prune:
-            logger.info(ConsoleFormatter.success("No matching policy found. Nothing to prune."))
-            return 
+        return deleted
+
+    def prune(self, session: Session, policy: PrunePolicy) -> None:
+        """
+        Prunes the Store based on the provided policy and refreshes the cached statistics.
+
+        Deciding *whether* to prune is left to the caller (see ``PruneScheduler``); this method always applies
+        the TTL and max-rows rules of the policy.
+
+        Args:
+            session (Session): An active SQLAlchemy session.
+            policy (PrunePolicy): The pruning policy to apply.
+        """
+
+        logger: logging.Logger = logging.getLogger(__name__)
+        logger.info(ConsoleFormatter.info("Pruning TM Store..."))
 
-        # ---- Run Pruning actions ----
         now = self._now()
+        rowid: ColumnClause[Any] = literal_column("rowid")
+
+        # Deletes touch pages all over the table and its primary key index; a larger page cache keeps them in memory.
+        session.execute(text("PRAGMA cache_size=-65536;"))
 
         # 1) TTL prune
         if policy.ttl_days is not None:
-            cutoff = now - policy.ttl_days * 24 * 3600
-            session.execute(delete(TM).where(TM.last_used_at < cutoff))
+            self._delete_used_before(session, now - policy.ttl_days * 24 * 3600)
 
         # 2) Enforce max rows (LRU)
-        if policy.max_rows is not None:
-            # recompute after TTL deletion
-            row_count = session.scalar(select(func.count()).select_from(TM)) or 0
-            if row_count > policy.max_rows:
-                to_delete = row_count - policy.max_rows
-
-                oldest = session.execute(
-                    select(TM.lang, TM.hash_)
-                    .order_by(TM.last_used_at.asc())
-                    .limit(to_delete)
-                ).all()
-
-                for lang, hash_ in oldest:
-                    session.execute(
-                        delete(TM).where(TM.lang == lang, TM.hash_ == hash_)
-                    )
+        row_count = session.scalar(select(func.count()).select_from(TM)) or 0
+        if policy.max_rows is not None and row_count > policy.max_rows:
+            to_delete = row_count - policy.max_rows
+
+            # The last_used_at of the newest row to evict, read from the index
+            cutoff = session.scalar(
+                select(TM.last_used_at).order_by(TM.last_used_at.asc()).offset(to_delete - 1).limit(1)
+            )
+            assert cutoff is not None
 
+            # Evict everything strictly older than the cutoff, then break ties on the cutoff itself
+            evicted = self._delete_used_before(session, cutoff)
+            if evicted < to_delete:
+                ties = select(rowid).select_from(TM).where(TM.last_used_at == cutoff).limit(to_delete - evicted)
+                session.execute(delete(TM).where(rowid.in_(ties)).execution_options(synchronize_session=False))
+
+            row_count -= to_delete
+
+        self.write_stat(session, TMStatKey.ROW_ESTIMATE, row_count)
+        self.write_stat(session, TMStatKey.RUNS_SINCE_PRUNE, 0)
+        self.write_stat(session, TMStatKey.LAST_PRUNED_AT, now)
         session.commit()
 
         # 3) Reclaim disk space
@@ -175,4 +410,7 @@ class TMStore:
             session.execute(text("PRAGMA incremental_vacuum;"))
             session.commit()
 
+        # 4) Fold the WAL back into the database file
+        session.execute(text("PRAGMA wal_checkpoint(TRUNCATE);"))
+
         logger.info(ConsoleFormatter.success("TM Store pruned successfully."))
@@ -1,10 +1,28 @@
 from pydantic import BaseModel
 
 
+class FileStat(BaseModel):
+    """
+    Content hash of a file along with the stat fields used to detect that it has not changed since it was hashed.
+    """
+
+    hash: str
+    size: int
+    mtime_ns: int
+    inode: int
+
+
 class TREntry(BaseModel):
+    """
+    The content hash of every output of a source, along with the digest of the glossary each output was translated
+    with, for outputs translated with one.
+    """
+
     outputs: dict[str, str] = {}
+    glossaries: dict[str, str] = {}
 
 
 class TranslationManifest(BaseModel):
-    version: int = 1
+    version: int = 2
     sources: dict[str, TREntry] = {}
+    files: dict[str, FileStat] = {}
@@ -1,11 +1,176 @@
 import json
+import math
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import tomli_w
 
 
+try:
+    import orjson
+    HAS_ORJSON: bool = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def read_bytes(file: str | Path) -> bytes:
+    if not os.path.isfile(file):
+        raise FileNotFoundError(file)
+
+    data: bytes
+    with open(file, 'rb') as f:
+        data = f.read()
+
+    return data
+
+
+def decode_text(data: bytes) -> str:
+    """
+    Decodes UTF-8 bytes the way text-mode ``open`` does, translating CRLF and CR line endings to LF.
+    """
+
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def iter_text(file: str | Path, chunk_size: int = 1 << 20) -> Iterator[str]:
+    """
+    Reads a UTF-8 text file in chunks, translating line endings like :func:`decode_text`.
+
+    Args:
+        file (str | Path): The file to read.
+        chunk_size (int): The number of characters per chunk.
+
+    Returns:
+        Iterator[str]: The decoded chunks, in order.
+    """
+
+    with open(file, 'r', encoding='utf-8') as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+class JsonCodec:
+    """
+    Parses and serializes JSON documents with the standard library.
+
+    Documents are serialized to UTF-8 bytes the way ``json.dumps(ensure_ascii=False, indent=2)`` writes them, which is
+    the format of every JSON file transctl writes. Subclasses may use faster libraries, as long as they parse and
+    serialize every document exactly like this codec.
+
+    Attributes:
+        name (str): The name of the codec.
+    """
+
+    name: str = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        """
+        Parses a JSON document.
+
+        Args:
+            data (bytes | str): The document, as UTF-8 bytes or text.
+
+        Returns:
+            Any: The parsed value.
+
+        Raises:
+            ValueError: If the document is not valid UTF-8 or not valid JSON.
+        """
+
+        return json.loads(data.decode('utf-8') if isinstance(data, bytes) else data)
+
+    def dumps(self, data: Any) -> bytes:
+        """
+        Serializes a value to a JSON document.
+
+        Args:
+            data (Any): The value.
+
+        Returns:
+            bytes: The document, as UTF-8 bytes.
+
+        Raises:
+            TypeError: If the value holds objects that are not JSON serializable.
+        """
+
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Serializes JSON documents with orjson, falling back to the standard library for the values orjson would write
+    differently: NaN and infinite numbers, floats written with an exponent, integers beyond 64 bits, non-string keys
+    and non-JSON types.
+
+    Documents are still parsed by the C scanner of the standard library, which parses locale files, made of short
+    strings, at least as fast as orjson does and handles integers of any size.
+    """
+
+    name: str = "orjson"
+
+    # The scalar types orjson writes like the standard library. Floats are checked one by one.
+    _SCALARS: frozenset[type] = frozenset({str, int, bool, type(None)})
+
+    def dumps(self, data: Any) -> bytes:
+        if self._native(data):
+            try:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            except orjson.JSONEncodeError:
+                # Non-string keys, integers beyond 64 bits and lone surrogates.
+                pass
+
+        return super().dumps(data)
+
+    @classmethod
+    def _native(cls, data: Any) -> bool:
+        # Whether a value only holds JSON types that orjson writes like the standard library, floats included only if
+        # their repr has no exponent. Only containers are pushed, since most values of a document are strings.
+        scalars: frozenset[type] = cls._SCALARS
+        stack: list[Any] = [[data]]
+        while stack:
+            container: Any = stack.pop()
+            for item in container.values() if type(container) is dict else container:
+                kind: type = type(item)
+                if kind in scalars:
+                    continue
+                if kind is dict or kind is list or kind is tuple:
+                    stack.append(item)
+                elif kind is not float or not math.isfinite(item) or 'e' in float.__repr__(item):
+                    return False
+
+        return True
+
+
+# The codec every JSON document is read and written with: orjson when it is installed, the standard library otherwise.
+JSON_CODEC: JsonCodec = OrjsonCodec() if HAS_ORJSON else JsonCodec()
+
+
+def loads_json(data: bytes | str) -> Any:
+    """
+    Parses a JSON document with :data:`JSON_CODEC`.
+    """
+
+    return JSON_CODEC.loads(data)
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serializes a value to an indented UTF-8 JSON document with :data:`JSON_CODEC`.
+    """
+
+    return JSON_CODEC.dumps(data)
+
+
+def parse_json(text: bytes | str) -> dict[str, Any]:
+    data: Any = loads_json(text)
+
+    if not isinstance(data, dict):
+        raise ValueError("Invalid File Format. Expected a JSON object at top level")
+
+    return data
+
+
 def read_html(file: str | Path) -> str:
     if not os.path.isfile(file):
         raise FileNotFoundError(file)
@@ -29,22 +194,15 @@ def load_json(file: str | Path) -> dict[str, Any]:
     if not base_name.endswith(".json"):
         raise ValueError(f"File {file} is not a valid json file.")
 
-    data: Any
-    with open(file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    if not isinstance(data, dict):
-        raise ValueError("Invalid File Format. Expected a JSON object at top level")
-
-    return data
+    return parse_json(read_bytes(file))
 
 
 def write_json(output_dir: str, filename: str, data: dict[Any, Any]) -> None:
     path: str = os.path.join(output_dir, filename)
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(path, 'wb') as f:
+        f.write(dumps_json(data))
 
 
 def write_file(output_dir: str, filename: str, data: str) -> None:
@@ -1,11 +1,13 @@
 import hashlib
 import re
-from typing import Any, Iterator, Tuple, Union
+from typing import Any, Iterable, Iterator, Tuple, Union
 
 
 PathPart = Union[str, int]
 Path = Tuple[PathPart, ...]
 
+_BLANKS_RE: re.Pattern[str] = re.compile(r"[ \t]+")
+
 
 def normalize_text(text: str) -> str:
     """
@@ -22,7 +24,7 @@ def normalize_text(text: str) -> str:
 
     text = text.replace("\r\n", "\n").replace("\r", "\n")
     text = text.strip()
-    text = re.sub(r"[ \t]+", " ", text)
+    text = _BLANKS_RE.sub(" ", text)
     return text
 
 
@@ -40,6 +42,24 @@ def compute_hash(value_: str) -> str:
     return hashlib.sha256(value_.encode("utf-8")).hexdigest()
 
 
+def compute_hash_chunks(chunks: Iterable[str]) -> str:
+    """
+    Computes the SHA-256 hash of a text given in chunks, equal to :func:`compute_hash` of the whole text.
+
+    Args:
+        chunks (Iterable[str]): The chunks of the text, in order.
+
+    Returns:
+        str: The hexadecimal representation of the hash.
+    """
+
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk.encode("utf-8"))
+
+    return digest.hexdigest()
+
+
 def sanitize_path(path: str, tag: str, value_: str) -> str:
     """
     Sanitizes a given path by replacing the path pattern's tag the corresponding new tag.
@@ -0,0 +1,60 @@
+import threading
+
+from transctl.core.configuration_manager import ConfigurationManager
+from transctl.core.translation_run_manifest import TranslationRunManifest
+from transctl.core.translators.base_translator import BaseTranslator
+from transctl.models.app_config import AppConfig
+from transctl.models.engine_config import DeepLEngine
+from transctl.models.tm_store import TMStore
+
+import pytest
+
+
+class FakeTranslator(BaseTranslator):
+    """
+    Translates every text to "<target>:<text>" and records every request.
+
+    Setting ``fail`` makes every request raise; setting ``barrier`` holds every request until the barrier's parties
+    are all being translated at once.
+    """
+
+    def __init__(self) -> None:
+        super().__init__({}, "keep")
+        self.calls: list[tuple[str, list[str]]] = []
+        self.glossaries: list = []
+        self.fail: bool = False
+        self.barrier: threading.Barrier | None = None
+
+    def translate(self, source, target, text, glossary=None):
+        if self.barrier is not None:
+            self.barrier.wait()
+        if self.fail:
+            raise RuntimeError("boom")
+
+        texts = text if isinstance(text, list) else [text]
+        self.calls.append((target, list(texts)))
+        self.glossaries.append(glossary)
+        result = [f"{target}:{t}" for t in texts]
+        return result if isinstance(text, list) else result[0]
+
+
+@pytest.fixture
+def translator():
+    return FakeTranslator()
+
+
+@pytest.fixture
+def make_handler(tmp_path, monkeypatch, translator):
+    """
+    Builds a handler of the given type in a fresh project, sharing its store and the ``translator`` fixture.
+    """
+
+    monkeypatch.chdir(tmp_path)
+
+    def make(handler_type, targets=("fr", "de"), **config):
+        cfg = ConfigurationManager(cold_start=True)
+        app_config = AppConfig(source="en", targets=list(targets), engine=DeepLEngine(api_key="test-key"), **config)
+        store = TMStore(db_path=str(cfg.get_store_path()))
+        return handler_type(cfg, app_config, TranslationRunManifest(cfg), store, translator)
+
+    return make
@@ -140,3 +140,48 @@ def test_from_file_unknown_engine_provider_raises_configuration_error(tmp_path):
 
     with pytest.raises(ConfigurationError):
         AppConfig.from_file(path)
+
+
+def test_from_file_invalid_performance_jobs_raises_configuration_error(tmp_path):
+
+    os.environ["DEEPL_API_KEY"] = "test-key"
+    path = _write_cfg(tmp_path, f"config.{app_constants.APP_NAME}.toml", """
+        [locale]
+        source = "en"
+        targets = ["fr"]
+
+        [engine]
+        provider = "deepl"
+
+        [performance]
+        jobs = 0
+    """)
+
+    with pytest.raises(ConfigurationError):
+        AppConfig.from_file(path)
+
+
+def test_from_file_engine_rate_limit_reaches_the_engine_config(tmp_path):
+
+    os.environ["DEEPL_API_KEY"] = "test-key"
+    path = _write_cfg(tmp_path, f"config.{app_constants.APP_NAME}.toml", """
+        [locale]
+        source = "en"
+        targets = ["fr"]
+
+        [engine]
+        provider = "deepl"
+
+        [engine.rate_limit]
+        requests_per_second = 4
+        burst = 2
+        max_retries = 3
+        backoff_max_s = 30.0
+    """)
+
+    cfg = AppConfig.from_file(path)
+    assert cfg.engine.rate_limit.requests_per_second == 4
+    assert cfg.engine.rate_limit.burst == 2
+    assert cfg.engine.rate_limit.max_retries == 3
+    assert cfg.engine.rate_limit.backoff_max_s == 30.0
+    assert cfg.engine.rate_limit.backoff_base_s == 1.0
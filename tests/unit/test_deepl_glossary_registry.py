@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+from transctl.core.glossary import Glossary
+from transctl.core.translators.deepl_glossary_registry import DeepLGlossaryRegistry
+
+
+class FakeDeepL:
+    def __init__(self) -> None:
+        self.created: list[dict[str, str]] = []
+        self.deleted: list[str] = []
+
+    def create_glossary(self, name, source_lang, target_lang, entries):
+        self.created.append(dict(entries))
+        return SimpleNamespace(glossary_id=f"g{len(self.created)}")
+
+    def delete_glossary(self, glossary):
+        self.deleted.append(glossary)
+
+
+def test_glossary_is_created_once_and_reused_across_runs(tmp_path):
+    client = FakeDeepL()
+    path = tmp_path / "deepl_glossaries.json"
+
+    first = DeepLGlossaryRegistry(path).get_or_create(client, "EN", "FR", Glossary.from_entries({"cart": "panier"}))
+    again = DeepLGlossaryRegistry(path).get_or_create(client, "EN", "FR", Glossary.from_entries({"cart": "panier"}))
+
+    assert first == again == "g1"
+    assert len(client.created) == 1
+
+
+def test_changed_entries_replace_the_glossary_of_the_pair(tmp_path):
+    client = FakeDeepL()
+    registry = DeepLGlossaryRegistry(tmp_path / "deepl_glossaries.json")
+
+    registry.get_or_create(client, "EN", "FR", Glossary.from_entries({"cart": "panier"}))
+    registry.get_or_create(client, "EN", "DE", Glossary.from_entries({"cart": "Warenkorb"}))
+    replaced = registry.get_or_create(client, "EN", "FR", Glossary.from_entries({"cart": "chariot"}))
+
+    assert replaced == "g3"
+    assert client.deleted == ["g1"]
+    assert registry.get_or_create(client, "EN", "DE", Glossary.from_entries({"cart": "Warenkorb"})) == "g2"
+
+
+def test_forgotten_glossary_is_created_again(tmp_path):
+    client = FakeDeepL()
+    registry = DeepLGlossaryRegistry(tmp_path / "deepl_glossaries.json")
+
+    registry.forget(registry.get_or_create(client, "EN", "FR", Glossary.from_entries({"cart": "panier"})))
+
+    assert registry.get_or_create(client, "EN", "FR", Glossary.from_entries({"cart": "panier"})) == "g2"
+    assert client.deleted == []
@@ -0,0 +1,54 @@
+import json
+
+from transctl.core.extraction_pool import ExtractionPool
+from transctl.core.handlers.handle_json_translation import JsonTranslationTranslationHandler
+from transctl.core.segment_protector import SegmentProtector
+from transctl.core.source_file import SourceFile
+from transctl.models.engine_config import DeepLEngine
+
+import pytest
+
+
+@pytest.fixture
+def sources(tmp_path):
+    paths = []
+    for i in range(10):
+        path = tmp_path / f"page_{i}.json"
+        path.write_text(json.dumps({"title": f"Page {i}"}), encoding="utf-8")
+        paths.append(path)
+
+    return [(JsonTranslationTranslationHandler, SourceFile(path)) for path in paths]
+
+
+def test_jobs_are_submitted_through_a_bounded_window(sources):
+    protector = SegmentProtector(DeepLEngine(api_key="test-key"))
+
+    with ExtractionPool(protector, 2) as pool:
+        submitted = []
+        submit = pool._executor.submit
+
+        def spy(*args):
+            submitted.append(args[2].name)
+            return submit(*args)
+
+        pool._executor.submit = spy
+        extracted = pool.map(sources)
+
+        document, _ = next(extracted)
+        assert document.segments == ["Page 0"]
+        assert len(submitted) == 2 * ExtractionPool.WINDOW
+
+        assert [document.segments for document, _ in extracted] == [[f"Page {i}"] for i in range(1, 10)]
+        assert submitted == [f"page_{i}.json" for i in range(10)]
+
+
+def test_released_source_is_read_again(sources):
+    _, source = sources[0]
+    assert source.json == {"title": "Page 0"}
+    hash_ = source.hash
+
+    source.release()
+
+    assert "data" not in source.__dict__ and "json" not in source.__dict__
+    assert source.hash == hash_
+    assert source.json == {"title": "Page 0"}
@@ -0,0 +1,54 @@
+import json
+
+from transctl.core.glossary import Glossary
+
+import pytest
+
+
+def test_glossary_is_loaded_and_read_only(tmp_path):
+    path = tmp_path / "glossary.json"
+    path.write_text(json.dumps({"cart": "panier"}), encoding="utf-8")
+
+    glossary = Glossary.from_file(path)
+
+    assert dict(glossary.entries) == {"cart": "panier"}
+    with pytest.raises(TypeError):
+        glossary.entries["cart"] = "chariot"
+
+
+def test_digest_depends_on_content_only():
+    a = Glossary.from_entries({"cart": "panier", "save": "enregistrer"})
+    b = Glossary.from_entries({"save": "enregistrer", "cart": "panier"})
+
+    assert a.digest == b.digest
+    assert a.digest != Glossary.from_entries({"cart": "chariot", "save": "enregistrer"}).digest
+
+
+@pytest.mark.parametrize("entries", [{"cart": 3}, {"": "panier"}, {"cart": " "}])
+def test_invalid_entries_are_rejected(entries):
+    with pytest.raises(ValueError):
+        Glossary.from_entries(entries)
+
+
+def test_compiled_structures_are_built_once():
+    glossary = Glossary.from_entries({"cart": "panier"})
+    builds = []
+
+    def build(g):
+        builds.append(g)
+        return object()
+
+    assert glossary.compiled("matcher", build) is glossary.compiled("matcher", build)
+    assert len(builds) == 1
+
+
+def test_signature_only_depends_on_terms_of_the_text():
+    before = Glossary.from_entries({"cart": "panier", "save": "enregistrer"})
+    after = Glossary.from_entries({"cart": "chariot", "save": "enregistrer", "checkout": "paiement"})
+
+    assert before.signature("Add to cart") != ""
+    assert before.signature("Save your Cart") == before.signature("save your cart")
+    assert before.signature("Save now") == after.signature("Save now")
+    assert before.signature("Add to cart") != after.signature("Add to cart")
+    assert before.signature("Go to checkout") == "" != after.signature("Go to checkout")
+    assert before.signature("Carts and saved items") == ""
@@ -0,0 +1,46 @@
+from transctl.core.glossary import Glossary
+from transctl.core.translators.azure_translator import AzureTranslator
+from transctl.core.translators.glossary_matcher import GlossaryMatcher
+from transctl.models.engine_config import AzureTranslateEngine
+
+
+def test_single_word_terms_match_whole_words_only():
+    matcher = GlossaryMatcher({"cart": "[panier]"})
+
+    assert matcher.replace("Add to cart, carts and cart.") == "Add to [panier], carts and [panier]."
+
+
+def test_longest_multi_word_term_wins():
+    matcher = GlossaryMatcher({"shopping": "[achats]", "shopping cart": "[panier]", "shopping cart total": "[total]"})
+
+    assert matcher.replace("Your shopping cart total") == "Your [total]"
+    assert matcher.replace("Your shopping cart is empty") == "Your [panier] is empty"
+    assert matcher.replace("Go shopping now") == "Go [achats] now"
+
+
+def test_partial_multi_word_term_falls_back_to_shorter_match():
+    matcher = GlossaryMatcher({"sign": "[signe]", "sign in page": "[connexion]"})
+
+    assert matcher.replace("sign in now") == "[signe] in now"
+
+
+def test_unicode_words():
+    matcher = GlossaryMatcher({"café crème": "[coffee]"})
+
+    assert matcher.replace("Un café crème, un cafés") == "Un [coffee], un cafés"
+
+
+def test_azure_glossary_skips_protected_spans():
+    translator = AzureTranslator(AzureTranslateEngine(api_key="test-key", region="westeurope"))
+    glossary = Glossary.from_entries({"Save": "Enregistrer", "user name": "identifiant"})
+
+    text = 'Save your user name at <span class="notranslate">Save</span>'
+    matcher = translator._glossary_matcher(glossary)
+
+    assert translator._apply_dynamic_glossary(text, matcher) == (
+        '<span class="notranslate">Enregistrer</span> your <span class="notranslate">identifiant</span> '
+        'at <span class="notranslate">Save</span>'
+    )
+    # Compiled once per glossary, not per call or per translator.
+    other = AzureTranslator(AzureTranslateEngine(api_key="test-key", region="westeurope"))
+    assert other._glossary_matcher(glossary) is matcher
@@ -0,0 +1,88 @@
+import io
+
+from transctl.core.handlers.handle_html_translation import HtmlTranslationTranslationHandler
+from transctl.core.templates.html_stream import HtmlSlotParser
+
+import pytest
+
+
+IGNORED = HtmlTranslationTranslationHandler.IGNORED_TAGS
+
+DOCUMENT = """<!DOCTYPE html>
+<html lang=en>
+<HEAD><Title>Title</Title><style>p { color: red; }</style><meta charset="utf-8"><link rel=icon></HEAD>
+<body class='main'  id=top>
+  <!-- a comment -->
+  <p>Hello &amp; welcome &nbsp;&copy &#169; &#x41; &bogus; &amp</p>
+  <div>Contact {{email}} <b>now</b><br>after br<br/>x<img src=a>y</div>
+  <script>var x = "<p>not translated</p>";</script>
+  <p>unclosed <p>nested <span>deep</p> tail </div> end
+  <noscript><p>ignored</p></noscript>after noscript
+  a < b and c > d
+  <ul><li>one<li>two</ul>
+</body>
+</html>
+"""
+
+
+def _compile(tmp_path, text, size):
+    path = tmp_path / "index.html"
+    path.write_text(text, encoding="utf-8")
+    return HtmlSlotParser.compile(path, IGNORED, chunk_size=size)
+
+
+def _render(template, fills):
+    out = io.StringIO()
+    template.write(fills, out)
+    return out.getvalue()
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 1 << 20])
+def test_segments_match_the_text_nodes_of_beautifulsoup(tmp_path, size):
+    expected = HtmlTranslationTranslationHandler._compile_template(DOCUMENT).segments
+
+    assert _compile(tmp_path, DOCUMENT, size).segments == expected
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 1 << 20])
+def test_markup_is_copied_from_the_source_as_written(tmp_path, size):
+    text = "<html><HEAD><Title>T</Title></HEAD><body class='a'  id=b>\n<p>Hello <b>world</b></p>\n<BR><div x=\"1\">Two\n lines</div></body></html>\n"
+
+    template = _compile(tmp_path, text, size)
+
+    assert template.segments == ["Hello ", "world", "Two\n lines"]
+    assert _render(template, template.segments) == text
+    assert _render(template, ["1", "2", "3"]) == text.replace("Hello ", "1").replace("world", "2").replace("Two\n lines", "3")
+
+
+def test_void_and_self_closed_ignored_elements_do_not_hide_the_rest_of_the_document(tmp_path):
+    template = _compile(tmp_path, "<meta><p>after meta</p><link><p>after link</p></meta><title/>after title<p>end</p>", 5)
+
+    assert template.segments == ["after meta", "after link", "after title", "end"]
+
+
+def test_processing_instructions_and_cdata_are_kept_as_written(tmp_path):
+    text = "<p>a</p><?php echo 1 ?><![CDATA[raw]]><p>b</p>"
+
+    template = _compile(tmp_path, text, 4)
+
+    assert template.segments == ["a", "b"]
+    assert _render(template, ["A", "B"]) == "<p>A</p><?php echo 1 ?><![CDATA[raw]]><p>B</p>"
+
+
+@pytest.mark.parametrize("size", [1, 7, 1 << 20])
+def test_only_the_text_runs_and_the_current_lines_are_held(tmp_path, size):
+    text = "".join(f"<div class='row'>\n  <span>Row {i}</span>\n</div>\n" for i in range(500))
+    path = tmp_path / "index.html"
+    path.write_text(text, encoding="utf-8")
+
+    parser = HtmlSlotParser(IGNORED)
+    lines = 0
+    for i in range(0, len(text), size):
+        parser.feed(text[i:i + size])
+        lines = max(lines, len(parser._line_starts))
+    template = parser.finish(path)
+
+    assert template.segments == [f"Row {i}" for i in range(500)]
+    assert _render(template, [s.upper() for s in template.segments]) == text.replace("Row", "ROW")
+    assert lines <= 2 + size // 10
@@ -0,0 +1,74 @@
+from transctl.core.handlers import handle_html_translation
+from transctl.core.handlers.handle_html_translation import HtmlTranslationTranslationHandler
+
+import pytest
+from bs4 import BeautifulSoup
+
+
+HTML = """<!DOCTYPE html>
+<html>
+<head><title>Title</title><style>p { color: red; }</style></head>
+<body>
+  <!-- a comment -->
+  <p>Hello &amp; welcome</p>
+  <div>Contact {{email}} <b>now</b></div>
+  <script>var x = "not translated";</script>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def handler(make_handler):
+    return make_handler(HtmlTranslationTranslationHandler, targets=("fr", "de", "es"))
+
+
+def test_template_renders_source_unchanged(handler):
+    template = handler._compile_template(HTML)
+
+    assert template.segments == ["Hello & welcome", "Contact {{email}} ", "now"]
+    fills = [handler._formatter.substitute(s) for s in template.segments]
+    assert template.render(fills) == str(BeautifulSoup(HTML, "html.parser"))
+
+
+def test_document_is_parsed_once_for_all_targets(tmp_path, handler, monkeypatch):
+    parses = []
+    original = handle_html_translation.BeautifulSoup
+
+    def counting_soup(*args, **kwargs):
+        parses.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(handle_html_translation, "BeautifulSoup", counting_soup)
+
+    src = tmp_path / "index.html"
+    src.write_text(HTML, encoding="utf-8")
+
+    written = handler.translate_file(src, tmp_path / "[source]_index.html", output_path_tag="[source]")
+
+    assert len(written) == 3
+    assert len(parses) == 1
+
+    out = (tmp_path / "fr_index.html").read_text(encoding="utf-8")
+    assert "<p>fr:Hello &amp; welcome</p>" in out
+    assert "<title>Title</title>" in out
+    assert 'var x = "not translated";' in out
+
+
+def test_large_sources_are_tokenized_and_keep_their_markup(tmp_path, handler, monkeypatch):
+    def no_soup(*args, **kwargs):
+        raise AssertionError("large sources must not be parsed into a tree")
+
+    monkeypatch.setattr(handle_html_translation, "BeautifulSoup", no_soup)
+    handler.stream_threshold = 0
+
+    src = tmp_path / "index.html"
+    src.write_text(HTML.replace("<body>", "<body class='main'  id=top>"), encoding="utf-8")
+
+    written = handler.translate_file(src, tmp_path / "[source]_index.html", output_path_tag="[source]")
+
+    assert len(written) == 3
+    out = (tmp_path / "fr_index.html").read_text(encoding="utf-8")
+    assert out == src.read_text(encoding="utf-8").replace(
+        "Hello &amp; welcome", "fr:Hello &amp; welcome").replace(
+        "Contact {{email}} ", "fr:Contact {{email}} ").replace("<b>now</b>", "<b>fr:now</b>")
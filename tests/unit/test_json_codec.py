@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from transctl.utils.i_o import JsonCodec, OrjsonCodec, load_json, write_json
+
+pytest.importorskip("orjson")
+
+
+DOCUMENTS = [
+    {},
+    {"a": [], "b": {}, "c": [1, {"d": None}], "e": True, "f": False},
+    {"text": "Café   \x00\x1f\x7f / \\ \" 😀", "keys": {"é": "ü"}},
+    {"floats": [0.1, 1.5, -0.0, 1e15, 0.0001, 5e-324]},
+    {"exponents": [1e16, 1e-07, 1e-05, 1.7976931348623157e308]},
+    {"special": [float("nan"), float("inf"), float("-inf")]},
+    {"ints": [2 ** 63, -2 ** 63, 2 ** 64 - 1, 2 ** 64, -2 ** 70]},
+    {"tuple": (1, "a"), "surrogate": "\ud800"},
+    {1: "int key", None: "null key"},
+]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_orjson_codec_writes_the_same_bytes_as_the_standard_library(document):
+    expected = json.dumps(document, ensure_ascii=False, indent=2).encode("utf-8", "surrogatepass")
+
+    if "surrogate" in document:
+        with pytest.raises(UnicodeEncodeError):
+            JsonCodec().dumps(document)
+        with pytest.raises(UnicodeEncodeError):
+            OrjsonCodec().dumps(document)
+        return
+
+    assert JsonCodec().dumps(document) == expected
+    assert OrjsonCodec().dumps(document) == expected
+
+
+@pytest.mark.parametrize("text", [
+    '{"a": [1, 2.5, "x", null, true], "b": {"c": "é"}}',
+    '{"big": 18446744073709551616, "neg": -9223372036854775809, "long": 1234567890123456789}',
+    '{"nan": NaN, "inf": [Infinity, -Infinity]}',
+    '{"a": 1, "a": 2}',
+    '{"surrogate": "\\ud800"}',
+])
+def test_orjson_codec_parses_like_the_standard_library(text):
+    expected = json.dumps(json.loads(text), ensure_ascii=False)
+
+    assert json.dumps(OrjsonCodec().loads(text.encode("utf-8")), ensure_ascii=False) == expected
+    assert json.dumps(OrjsonCodec().loads(text), ensure_ascii=False) == expected
+
+
+@pytest.mark.parametrize("codec", [JsonCodec(), OrjsonCodec()])
+def test_codecs_raise_the_standard_library_errors(codec):
+    with pytest.raises(json.JSONDecodeError, match="Expecting"):
+        codec.loads(b'{"a": }')
+
+    with pytest.raises(TypeError):
+        codec.dumps({"a": object()})
+
+
+def test_write_json_round_trips_through_load_json(tmp_path):
+    document = {"greeting": "Grüß dich", "nested": {"count": 3, "ratio": 1e-07}}
+
+    write_json(str(tmp_path), "out/de.json", document)
+
+    assert (tmp_path / "out" / "de.json").read_bytes() == json.dumps(document, ensure_ascii=False, indent=2).encode("utf-8")
+    assert load_json(tmp_path / "out" / "de.json") == document
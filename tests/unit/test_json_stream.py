@@ -0,0 +1,48 @@
+import json
+from json.encoder import encode_basestring
+
+from transctl.core.templates.json_stream import iter_json_slots, iter_json_tokens
+
+import pytest
+
+
+DOCUMENT = {
+    "title": "Café \"quoted\" \\ back\nslash \U0001F600",
+    "nested": {"list": ["one", 2, None, True, False, {"deep": "two"}], "empty": {}, "none": []},
+    "numbers": [0, -0, 12345678901234567890, 1.5, -2.5e-7, 1E3, 1e400, -1e400],
+    "odd \"key\"": "{{name}}",
+}
+
+
+def _render(chunks, fill=lambda s: s, flush_pieces=4096):
+    out = []
+    for static, segment in iter_json_slots(iter_json_tokens(chunks), flush_pieces):
+        out.append(static)
+        if segment is not None:
+            out.append(encode_basestring(fill(segment)))
+    return "".join(out)
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 1 << 20])
+@pytest.mark.parametrize("indent", [None, 4])
+def test_output_matches_json_dumps_whatever_the_chunking(size, indent):
+    text = json.dumps(DOCUMENT, indent=indent).replace("1500000000", "1.5e9")
+    chunks = [text[i:i + size] for i in range(0, len(text), size)]
+
+    assert _render(chunks, flush_pieces=2) == json.dumps(json.loads(text), ensure_ascii=False, indent=2)
+
+
+def test_string_values_are_slots_in_document_order():
+    text = json.dumps(DOCUMENT)
+
+    segments = [s for _, s in iter_json_slots(iter_json_tokens([text])) if s is not None]
+
+    assert segments == [DOCUMENT["title"], "one", "two", "{{name}}"]
+    assert json.loads(_render([text], fill=str.upper))["nested"]["list"][5] == {"deep": "TWO"}
+
+
+@pytest.mark.parametrize("text", ['[1]', '{"a": 1,}', '{"a" 1}', '{"a": 1} x', '{"a": tru}', '{"a": "x', '{"a": 01}',
+                                  '{"a": "\\q"}', '{"a": 1e}', '{"a": [1,]}', '{"a": -}'])
+def test_invalid_documents_are_rejected(text):
+    with pytest.raises(ValueError):
+        _render([text[:5], text[5:]])
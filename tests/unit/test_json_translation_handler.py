@@ -0,0 +1,176 @@
+import json
+import threading
+
+from transctl.core.handlers.handle_json_translation import JsonTranslationTranslationHandler
+from transctl.core.segment_protector import SegmentProtector
+from transctl.core.source_file import SourceFile
+from transctl.core.translation_run_manifest import TranslationRunManifest
+from transctl.models.policies import PerformancePolicy
+from transctl.models.tm_store import TM
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def handler(make_handler):
+    return make_handler(JsonTranslationTranslationHandler)
+
+
+def _write_source(tmp_path, content):
+    src = tmp_path / "messages.json"
+    src.write_text(json.dumps(content), encoding="utf-8")
+    return src
+
+
+def test_misses_are_sent_in_batches(tmp_path, handler, translator):
+    content = {f"key_{i}": f"value {i % 120}" for i in range(300)}
+    src = _write_source(tmp_path, content)
+
+    written = handler.translate_file(src, tmp_path / "[source]_messages.json", output_path_tag="[source]")
+
+    assert len(written) == 2
+    # 120 unique strings per target -> 3 requests of at most LIMITS.max_items per target
+    assert len(translator.calls) == 6
+    assert all(len(texts) <= translator.LIMITS.max_items for _, texts in translator.calls)
+
+    out = json.loads((tmp_path / "fr_messages.json").read_text(encoding="utf-8"))
+    assert out["key_121"] == "fr:value 1"
+
+
+def test_nested_paths_and_placeholders_are_preserved(tmp_path, handler):
+    content = {"a": {"b": ["Hello", "{{name}}"]}, "n": 3}
+    src = _write_source(tmp_path, content)
+
+    handler.translate_file(src, tmp_path / "[source]_messages.json", output_path_tag="[source]")
+
+    out = json.loads((tmp_path / "de_messages.json").read_text(encoding="utf-8"))
+    assert out == {"a": {"b": ["de:Hello", "{{name}}"]}, "n": 3}
+
+
+def test_failed_batches_do_not_write_partial_output(tmp_path, handler, translator):
+    translator.fail = True
+    src = _write_source(tmp_path, {"a": "Hello"})
+
+    written = handler.translate_file(src, tmp_path / "[source]_messages.json", output_path_tag="[source]")
+
+    assert written == []
+    assert not (tmp_path / "fr_messages.json").exists()
+
+
+def test_targets_are_translated_concurrently(tmp_path, make_handler, translator):
+    # Every request only returns once every target is being translated at the same time.
+    translator.barrier = threading.Barrier(3, timeout=5)
+    handler = make_handler(JsonTranslationTranslationHandler, targets=("fr", "de", "es"), performance=PerformancePolicy(jobs=3))
+    src = _write_source(tmp_path, {"title": "Hello"})
+
+    written = handler.translate_file(src, tmp_path / "[source]_messages.json", output_path_tag="[source]")
+
+    assert written == [str(tmp_path / f"{lang}_messages.json") for lang in ("fr", "de", "es")]
+    for lang in ("fr", "de", "es"):
+        assert json.loads((tmp_path / f"{lang}_messages.json").read_text(encoding="utf-8")) == {"title": f"{lang}:Hello"}
+
+
+def test_segments_are_prepared_once_for_every_target(tmp_path, make_handler, monkeypatch):
+    calls: list[str] = []
+    prepare = SegmentProtector.prepare
+    monkeypatch.setattr(SegmentProtector, "prepare", lambda self, text: calls.append(text) or prepare(self, text))
+
+    handler = make_handler(JsonTranslationTranslationHandler, targets=("fr", "de", "es", "it"))
+    src = _write_source(tmp_path, {"a": "Save", "b": "Cancel", "c": "Save", "d": "{{name}}"})
+
+    written = handler.translate_file(src, tmp_path / "[source]_messages.json", output_path_tag="[source]")
+
+    assert len(written) == 4
+    assert sorted(calls) == ["Cancel", "Save", "{{name}}"]
+
+
+def test_output_matches_serializing_the_translated_tree(tmp_path, handler):
+    content = {
+        "title": "Café \"quoted\" \\ back\nslash  ",
+        "nested": {"list": ["one", 2, None, True, {"deep": "two"}], "empty": {}, "none": []},
+        "number": 1.5,
+        "emoji": "\U0001F600 {{name}}",
+    }
+    src = _write_source(tmp_path, content)
+    document = JsonTranslationTranslationHandler.extract(SourceFile(src))
+
+    handler.write_output(document, [f"<{s}>" for s in document.segments], tmp_path / "out.json")
+    handler.write_output(document, document.segments, tmp_path / "same.json")
+
+    expected = json.loads(json.dumps(content))
+    expected["title"] = f"<{content['title']}>"
+    expected["nested"]["list"][0] = "<one>"
+    expected["nested"]["list"][4]["deep"] = "<two>"
+    expected["emoji"] = f"<{content['emoji']}>"
+    assert (tmp_path / "out.json").read_text(encoding="utf-8") == json.dumps(expected, ensure_ascii=False, indent=2)
+    assert (tmp_path / "same.json").read_text(encoding="utf-8") == json.dumps(content, ensure_ascii=False, indent=2)
+
+
+def test_streamed_output_matches_extracted_output(tmp_path, handler, monkeypatch):
+    content = {f"section_{i}": {"title": f"Title {i % 7}", "count": i, "tags": ["a", "{{b}}", f"c {i}"]} for i in range(40)}
+    src = _write_source(tmp_path, content)
+    handler.translate_file(src, tmp_path / "[source]_messages.json", output_path_tag="[source]")
+    extracted = (tmp_path / "fr_messages.json").read_text(encoding="utf-8")
+
+    monkeypatch.setattr(JsonTranslationTranslationHandler, "STREAM_WINDOW", 7)
+    handler.stream_threshold = 0
+    handler.manifest = TranslationRunManifest(handler.manifest.cfg)
+    (tmp_path / "fr_messages.json").unlink()
+    handler.translate_file(src, tmp_path / "[source]_messages.json", output_path_tag="[source]")
+
+    assert (tmp_path / "fr_messages.json").read_text(encoding="utf-8") == extracted
+    assert not list(tmp_path.glob("*.partial"))
+
+
+def test_failed_streamed_translation_leaves_no_output(tmp_path, handler, translator):
+    translator.fail = True
+    handler.stream_threshold = 0
+    src = _write_source(tmp_path, {"a": "Hello"})
+
+    written = handler.translate_file(src, tmp_path / "[source]_messages.json", output_path_tag="[source]")
+
+    assert written == []
+    assert not list(tmp_path.glob("fr_messages.json*"))
+
+
+@pytest.mark.parametrize("text", ['{"a": "Hello", "b": ["World", "Again"', '{"a": "Hello", "b": "World" "c": 1}'])
+def test_invalid_streamed_source_leaves_no_partial_output(tmp_path, handler, monkeypatch, text):
+    monkeypatch.setattr(JsonTranslationTranslationHandler, "STREAM_WINDOW", 1)
+    handler.stream_threshold = 0
+    src = tmp_path / "messages.json"
+    src.write_text(text, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        handler.translate_file(src, tmp_path / "[source]_messages.json", output_path_tag="[source]")
+
+    assert not list(tmp_path.glob("*_messages.json*"))
+
+
+def test_streamed_hits_are_refreshed_window_by_window(tmp_path, handler, monkeypatch):
+    src = _write_source(tmp_path, {f"key_{i}": f"Label {i}" for i in range(30)})
+    handler.translate_file(src, tmp_path / "[source]_messages.json", output_path_tag="[source]")
+    with Session(handler.store.engine) as session:
+        session.execute(update(TM).values(last_used_at=0))
+        session.commit()
+
+    buffered = []
+    flush_touches = handler.store.flush_touches
+
+    def counting_flush(session):
+        buffered.append(flush_touches(session))
+        return buffered[-1]
+
+    monkeypatch.setattr(handler.store, "flush_touches", counting_flush)
+    monkeypatch.setattr(JsonTranslationTranslationHandler, "STREAM_WINDOW", 7)
+    handler.stream_threshold = 0
+    handler.manifest = TranslationRunManifest(handler.manifest.cfg)
+    (tmp_path / "fr_messages.json").unlink()
+    (tmp_path / "de_messages.json").unlink()
+    handler.translate_file(src, tmp_path / "[source]_messages.json", output_path_tag="[source]")
+
+    assert sum(buffered) == 60
+    assert max(buffered) <= 2 * 7
+    with Session(handler.store.engine) as session:
+        assert session.scalar(select(func.min(TM.last_used_at))) > 0
@@ -0,0 +1,48 @@
+from transctl.core.prune_scheduler import PruneScheduler
+from transctl.models.policies import PrunePolicy
+from transctl.models.tm_store import TM, TMStatKey, TMStore
+
+import pytest
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TMStore(db_path=str(tmp_path / "store.sqlite"))
+
+
+def _stats(store):
+    with Session(store.engine) as session:
+        return store.read_stats(session)
+
+
+def test_prunes_every_n_runs(store):
+    scheduler = PruneScheduler(store, PrunePolicy(every_n_runs=3))
+
+    assert [scheduler.run() for _ in range(7)] == [False, False, True, False, False, True, False]
+    assert _stats(store)[TMStatKey.RUNS_SINCE_PRUNE] == 1
+
+
+def test_prunes_when_cached_row_estimate_exceeds_max_rows(store):
+    scheduler = PruneScheduler(store, PrunePolicy(max_rows=5, every_n_runs=None))
+
+    with Session(store.engine) as session:
+        store.upsert_many(session, "fr", {f"h{i}": "t" for i in range(4)})
+        session.commit()
+    assert scheduler.run() is False
+
+    with Session(store.engine) as session:
+        store.upsert_many(session, "fr", {f"h{i}": "t" for i in range(4, 8)})
+        session.commit()
+    assert scheduler.run() is True
+
+    # The prune evicted the extra rows and made the estimate exact again.
+    assert _stats(store)[TMStatKey.ROW_ESTIMATE] == 5
+
+
+def test_row_estimate_is_seeded_from_existing_rows(store):
+    with Session(store.engine) as session:
+        session.add_all([TM(lang="fr", hash_=h, translation="t", created_at=0, last_used_at=0) for h in "abc"])
+        session.commit()
+
+    assert _stats(store)[TMStatKey.ROW_ESTIMATE] == 3
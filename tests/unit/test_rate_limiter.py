@@ -0,0 +1,168 @@
+import io
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from transctl.core.errors.translation_errors import RetryableTranslationError
+from transctl.core.translators.azure_translator import AzureTranslator
+from transctl.core.translators.deepl_translator import DeepLTranslator
+from transctl.core.translators.rate_limiter import RateLimiter, parse_retry_after
+from transctl.models.engine_config import AzureTranslateEngine, DeepLEngine
+from transctl.models.policies import RateLimitPolicy
+
+import pytest
+import requests
+import urllib3
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+def _limiter(clock, **policy):
+    return RateLimiter(RateLimitPolicy(**policy), clock=clock, sleep=clock.sleep, jitter=lambda: 1.0)
+
+
+def test_requests_are_paced_by_the_token_bucket():
+    clock = FakeClock()
+    limiter = _limiter(clock, requests_per_second=2, burst=2)
+
+    for _ in range(6):
+        limiter.acquire()
+
+    # Two requests from the burst, then one every half second.
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_unthrottled_requests_never_wait():
+    clock = FakeClock()
+    limiter = _limiter(clock)
+
+    for _ in range(100):
+        limiter.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_retry_after_is_honored_then_request_succeeds():
+    clock = FakeClock()
+    limiter = _limiter(clock)
+    responses = [RetryableTranslationError("429", retry_after=7, throttled=True), "ok"]
+
+    def request():
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    assert limiter.call(request) == "ok"
+    assert clock.now == pytest.approx(7)
+
+
+def test_retry_after_is_capped_at_the_maximum_backoff():
+    clock = FakeClock()
+    limiter = _limiter(clock, backoff_max_s=5)
+    far_future = format_datetime(datetime.now(timezone.utc) + timedelta(days=30), usegmt=True)
+    responses = [
+        RetryableTranslationError("429", retry_after=parse_retry_after(far_future), throttled=True),
+        RetryableTranslationError("429", retry_after=86_400, throttled=True),
+        "ok",
+    ]
+
+    def request():
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    assert limiter.call(request) == "ok"
+    assert clock.now == pytest.approx(10)
+
+
+def test_backoff_is_exponential_and_gives_up_after_max_retries():
+    clock = FakeClock()
+    limiter = _limiter(clock, max_retries=3, backoff_base_s=1, backoff_max_s=3)
+    calls = []
+
+    def request():
+        calls.append(clock.now)
+        raise RetryableTranslationError("503")
+
+    with pytest.raises(RetryableTranslationError):
+        limiter.call(request)
+
+    assert len(calls) == 4
+    assert clock.sleeps == [1, 2, 3]
+
+
+def test_other_errors_are_not_retried():
+    limiter = _limiter(FakeClock())
+
+    def request():
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        limiter.call(request)
+
+
+def test_throttling_halves_the_rate_which_then_recovers():
+    clock = FakeClock()
+    limiter = _limiter(clock, requests_per_second=10)
+    responses = [RetryableTranslationError("429", retry_after=1, throttled=True), "ok"]
+
+    def request():
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    limiter.call(request)
+    assert limiter.rate == pytest.approx(5.5)
+
+    for _ in range(20):
+        limiter.call(lambda: "ok")
+    assert limiter.rate == pytest.approx(10)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("12") == 12
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+
+@pytest.mark.parametrize("status", [429, 503])
+@pytest.mark.parametrize("make_translator", [
+    lambda: DeepLTranslator(DeepLEngine(api_key="test-key")),
+    lambda: AzureTranslator(AzureTranslateEngine(api_key="test-key", region="westeurope")),
+], ids=["deepl", "azure"])
+def test_failed_request_is_only_retried_by_the_limiter(monkeypatch, make_translator, status):
+    sent = []
+
+    def send(session, request, **kwargs):
+        sent.append(request.url)
+        response = requests.Response()
+        response.status_code = status
+        response.request = request
+        response.raw = urllib3.HTTPResponse(body=io.BytesIO(b"{}"), status=status, preload_content=False)
+        return response
+
+    monkeypatch.setattr(requests.Session, "send", send)
+    clock = FakeClock()
+    translator = make_translator()
+    translator.rate_limiter = _limiter(clock, max_retries=2)
+
+    with pytest.raises(RetryableTranslationError):
+        translator.translate("en", "fr", ["Hello"])
+
+    assert len(sent) == 3
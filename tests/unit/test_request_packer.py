@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+from transctl.core.glossary import Glossary
+from transctl.core.translators.azure_translator import AzureTranslator
+from transctl.core.translators.deepl_translator import DeepLTranslator
+from transctl.core.translators.request_packer import pack_requests
+from transctl.models.engine_config import AzureTranslateEngine
+
+
+def test_requests_are_filled_up_to_the_item_limit():
+    texts = [str(i) for i in range(2500)]
+
+    requests = pack_requests(texts, AzureTranslator.LIMITS)
+
+    assert [len(r) for r in requests] == [1000, 1000, 500]
+
+
+def test_requests_are_filled_up_to_the_size_limit():
+    texts = ["x" * 20_000] * 5
+
+    requests = pack_requests(texts, AzureTranslator.LIMITS)
+
+    assert [len(r) for r in requests] == [2, 2, 1]
+
+
+def test_oversized_text_is_sent_alone():
+    texts = ["a", "b" * 60_000, "c"]
+
+    requests = pack_requests(texts, AzureTranslator.LIMITS)
+
+    assert requests == [range(0, 1), range(1, 2), range(2, 3)]
+
+
+def test_deepl_payload_size_accounts_for_escaping():
+    # Non-ASCII characters are sent as \uXXXX escapes, six bytes each.
+    texts = ["é" * 10_000] * 4
+
+    requests = pack_requests(texts, DeepLTranslator.LIMITS)
+
+    assert all(sum(DeepLTranslator.LIMITS.measure(texts[i]) for i in r) <= 128 * 1024 for r in requests)
+    assert [len(r) for r in requests] == [2, 2]
+
+
+
+def test_azure_requests_are_measured_with_their_glossary_spans():
+    translator = AzureTranslator(AzureTranslateEngine(api_key="test-key", region="westeurope"))
+    glossary = Glossary.from_entries({"Save": "Enregistrer"})
+    texts = ["Save " * 500] * 3
+
+    assert translator.pack(texts) == [range(0, 3)]
+    assert translator.pack(texts, glossary) == [range(0, 2), range(2, 3)]
+
+
+def test_azure_sends_a_packed_list_in_a_single_request(monkeypatch):
+    translator = AzureTranslator(AzureTranslateEngine(api_key="test-key", region="westeurope"))
+    glossary = Glossary.from_entries({"Save": "Enregistrer"})
+    texts = ["Save " * 500] * 3
+    sent = []
+
+    def translate(body, **kwargs):
+        sent.append(body)
+        return [SimpleNamespace(translations=[SimpleNamespace(text=t.upper())]) for t in body]
+
+    monkeypatch.setattr(translator._client, "translate", translate)
+
+    result = []
+    for request in translator.pack(texts, glossary):
+        result.extend(translator.translate("en", "fr", texts[request.start:request.stop], glossary))
+
+    assert [len(body) for body in sent] == [2, 1]
+    assert all(sum(len(t) for t in body) <= AzureTranslator.LIMITS.max_size for body in sent)
+    assert len(result) == 3
@@ -0,0 +1,54 @@
+import pickle
+
+from transctl.core.segment_protector import SegmentProtector
+from transctl.models.engine_config import AzureTranslateEngine, DeepLEngine
+
+import pytest
+
+
+@pytest.fixture(params=["deepl", "azure"])
+def protector(request):
+    if request.param == "deepl":
+        return SegmentProtector(DeepLEngine(api_key="key"))
+    return SegmentProtector(AzureTranslateEngine(api_key="key", region="westeurope"))
+
+
+def test_deepl_protects_placeholders_emails_and_urls_in_one_pass():
+    engine = DeepLEngine(api_key="key")
+    text = "Hi {{name}}, write to Support@Example.com or see https://example.com/help."
+
+    protected = engine.protect_text(text, SegmentProtector.PROTECTED_RE)
+
+    assert protected == (
+        "Hi <keep>{{name}}</keep>, write to <keep>Support@Example.com</keep> "
+        "or see <keep>https://example.com/help.</keep>"
+    )
+    assert engine.unprotect_text(protected) == text
+
+
+def test_azure_protects_with_spans():
+    engine = AzureTranslateEngine(api_key="key", region="westeurope")
+
+    protected = engine.protect_text("Open {{link}} now", SegmentProtector.PROTECTED_RE)
+
+    assert protected == 'Open <span class="notranslate">{{link}}</span> now'
+    assert engine.unprotect_text(protected) == "Open {{link}} now"
+
+
+def test_url_holding_a_placeholder_is_protected_as_a_whole():
+    engine = DeepLEngine(api_key="key")
+
+    protected = engine.protect_text("Go to https://example.com/{{id}}/edit", SegmentProtector.PROTECTED_RE)
+
+    assert protected == "Go to <keep>https://example.com/{{id}}/edit</keep>"
+
+
+def test_placeholder_only_segments_are_kept_as_is(protector):
+    assert protector.prepare("{{count}}  https://example.com") is None
+    assert protector.prepare("{{count}} items") is not None
+
+
+def test_prepared_segments_survive_pickling(protector):
+    clone = pickle.loads(pickle.dumps(protector))
+
+    assert clone.prepare("Mail bob@example.com") == protector.prepare("Mail bob@example.com")
@@ -0,0 +1,30 @@
+from transctl.core.glossary import Glossary
+from transctl.core.segment_protector import SegmentProtector
+from transctl.core.segment_table import SegmentTable
+from transctl.models.engine_config import DeepLEngine
+
+import pytest
+
+
+@pytest.fixture
+def protector():
+    return SegmentProtector(DeepLEngine(api_key="key"))
+
+
+def test_distinct_segments_are_prepared_once(protector):
+    table = SegmentTable.build(["Save", "{{count}}", "Save", "Save  ", "Mail bob@example.com"], protector)
+
+    assert table.texts == ["Save", "{{count}}", "Save  ", "Mail bob@example.com"]
+    assert list(table.kept) == [0, 1, 0, 0]
+    assert table.keys[0] == table.keys[2] and table.keys[1] == ""
+    assert list(table.protected.values()) == ["Save", "Mail <keep>bob@example.com</keep>"]
+
+
+def test_only_keys_with_glossary_terms_are_signed(protector):
+    glossary = Glossary.from_entries({"cart": "panier"})
+
+    table = SegmentTable.build(["Add to cart", "Save"], protector, glossary)
+
+    assert list(table.signatures) == [table.keys[0]]
+    assert table.signatures[table.keys[0]] == glossary.signature("Add to cart")
+
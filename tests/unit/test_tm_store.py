@@ -0,0 +1,159 @@
+import sqlite3
+
+from transctl.models.policies import PrunePolicy
+from transctl.models.tm_store import MIGRATIONS, TM, TMStatKey, TMStore
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TMStore(db_path=str(tmp_path / "store.sqlite"))
+
+
+def test_lookup_many_resolves_hits_across_chunks(store, monkeypatch):
+    monkeypatch.setattr(TMStore, "LOOKUP_CHUNK_SIZE", 7)
+    entries = {f"h{i}": f"t{i}" for i in range(30)}
+
+    with Session(store.engine) as session:
+        store.upsert_many(session, "fr", entries)
+        session.commit()
+
+    with Session(store.engine) as session:
+        found = store.lookup_many(session, "fr", [f"h{i}" for i in range(0, 40, 2)])
+        other_lang = store.lookup_many(session, "de", entries.keys())
+
+    assert found == {f"h{i}": f"t{i}" for i in range(0, 30, 2)}
+    assert other_lang == {}
+
+
+def test_upsert_many_updates_existing_rows(store):
+    with Session(store.engine) as session:
+        store.upsert_many(session, "fr", {"a": "old", "b": "kept"})
+        session.commit()
+
+    with Session(store.engine) as session:
+        store.upsert_many(session, "fr", {"a": "new", "c": "added"})
+        session.commit()
+
+    with Session(store.engine) as session:
+        rows = dict(session.execute(select(TM.hash_, TM.translation).where(TM.lang == "fr")).all())
+
+    assert rows == {"a": "new", "b": "kept", "c": "added"}
+
+
+
+def test_upserting_existing_keys_does_not_grow_the_row_estimate(store, monkeypatch):
+    monkeypatch.setattr(TMStore, "LOOKUP_CHUNK_SIZE", 7)
+    with Session(store.engine) as session:
+        store.read_stats(session)
+        store.upsert_many(session, "fr", {f"h{i}": f"t{i}" for i in range(20)})
+        session.commit()
+
+    with Session(store.engine) as session:
+        store.upsert_many(session, "fr", {f"h{i}": f"new {i}" for i in range(20)}, signatures={"h1": "sig"})
+        store.upsert_many(session, "fr", {"h3": "again", "h20": "added"})
+        store.upsert_many(session, "de", {"h0": "other language"})
+        session.commit()
+
+    with Session(store.engine) as session:
+        assert store.read_stats(session)[TMStatKey.ROW_ESTIMATE] == 22
+
+
+def test_lookup_many_misses_rows_translated_with_other_glossary_terms(store):
+    with Session(store.engine) as session:
+        store.upsert_many(session, "fr", {"a": "x", "b": "y", "c": "z"}, {"a": "sig-a", "b": "sig-b"})
+        session.commit()
+
+    with Session(store.engine) as session:
+        found = store.lookup_many(session, "fr", ["a", "b", "c"], {"a": "sig-a", "b": "sig-b2", "c": ""})
+        unchecked = store.lookup_many(session, "fr", ["a", "b", "c"])
+
+    assert found == {"a": "x", "c": "z"}
+    assert unchecked == {"a": "x", "b": "y", "c": "z"}
+
+
+def test_lookup_many_defers_last_used_at_refresh_until_flush(tmp_path, monkeypatch):
+    store = TMStore(db_path=str(tmp_path / "store.sqlite"), touch_granularity=50)
+
+    monkeypatch.setattr(TMStore, "_now", staticmethod(lambda: 100))
+    with Session(store.engine) as session:
+        store.upsert_many(session, "fr", {"a": "x", "b": "y"})
+        session.commit()
+
+    monkeypatch.setattr(TMStore, "_now", staticmethod(lambda: 210))
+    with Session(store.engine) as session:
+        store.lookup_many(session, "fr", ["a"])
+        session.commit()
+        assert dict(session.execute(select(TM.hash_, TM.last_used_at)).all()) == {"a": 100, "b": 100}
+
+        assert store.flush_touches(session) == 1
+        session.commit()
+        # Coarsened to the start of the granularity period
+        assert dict(session.execute(select(TM.hash_, TM.last_used_at)).all()) == {"a": 200, "b": 100}
+
+
+def test_rows_touched_within_the_current_period_are_skipped(tmp_path, monkeypatch):
+    store = TMStore(db_path=str(tmp_path / "store.sqlite"), touch_granularity=50)
+
+    monkeypatch.setattr(TMStore, "_now", staticmethod(lambda: 205))
+    with Session(store.engine) as session:
+        store.upsert_many(session, "fr", {"a": "x"})
+        session.commit()
+
+    monkeypatch.setattr(TMStore, "_now", staticmethod(lambda: 240))
+    with Session(store.engine) as session:
+        store.lookup_many(session, "fr", ["a"])
+        assert store.flush_touches(session) == 0
+
+
+def test_prune_evicts_least_recently_used_rows(store, monkeypatch):
+    with Session(store.engine) as session:
+        for i in range(10):
+            monkeypatch.setattr(TMStore, "_now", staticmethod(lambda i=i: 1_000 + i))
+            store.upsert_many(session, "fr", {f"h{i}": "t"})
+        session.commit()
+
+    monkeypatch.setattr(TMStore, "_now", staticmethod(lambda: 2_000))
+    with Session(store.engine) as session:
+        store.prune(session, PrunePolicy(ttl_days=None, max_rows=4, vacuum=False))
+
+    with Session(store.engine) as session:
+        remaining = set(session.scalars(select(TM.hash_)).all())
+
+    assert remaining == {"h6", "h7", "h8", "h9"}
+
+
+def test_legacy_store_is_migrated_with_last_used_at_index(tmp_path):
+    db_path = tmp_path / "legacy.sqlite"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE tm (lang VARCHAR NOT NULL, hash_ VARCHAR NOT NULL, translation TEXT NOT NULL, "
+            "created_at INTEGER NOT NULL, last_used_at INTEGER NOT NULL, PRIMARY KEY (lang, hash_))"
+        )
+
+    TMStore(db_path=str(db_path))
+
+    with sqlite3.connect(db_path) as conn:
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(tm)")}
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(tm)")}
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+
+    assert "ix_tm_last_used_at" in indexes
+    assert "glossary_sig" in columns
+    assert version == len(MIGRATIONS)
+
+
+def test_prune_breaks_last_used_at_ties(store, monkeypatch):
+    monkeypatch.setattr(TMStore, "_now", staticmethod(lambda: 1_000))
+    with Session(store.engine) as session:
+        store.upsert_many(session, "fr", {f"h{i}": "t" for i in range(10)})
+        session.commit()
+
+    with Session(store.engine) as session:
+        store.prune(session, PrunePolicy(ttl_days=None, max_rows=4, vacuum=False))
+
+    with Session(store.engine) as session:
+        assert len(session.scalars(select(TM.hash_)).all()) == 4
@@ -0,0 +1,199 @@
+import json
+
+from transctl.core.extraction_pool import ExtractionPool
+from transctl.core.factory.translator_factory import TranslatorFactory
+from transctl.core.handlers.handle_json_translation import JsonTranslationTranslationHandler
+from transctl.core.translation_coordinator import TranslationCoordinator
+
+import pytest
+
+
+CONFIG = """
+[locale]
+source = "en"
+targets = ["fr", "de"]
+
+[engine]
+provider = "deepl"
+
+[resources.json]
+dirs = [{ path = "locales/[source]/*.json" }]
+
+[resources.html]
+dirs = [{ path = "templates/*.html" }]
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch, translator):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("DEEPL_API_KEY", "test-key")
+    (tmp_path / ".transctl.toml").write_text(CONFIG, encoding="utf-8")
+
+    src = tmp_path / "locales" / "en"
+    src.mkdir(parents=True)
+    for i in range(5):
+        content = {"save": "Save", "cancel": "Cancel", "title": f"Page {i}"}
+        (src / f"page_{i}.json").write_text(json.dumps(content), encoding="utf-8")
+
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "index.html").write_text("<p>Save</p>", encoding="utf-8")
+
+    translator.created = 0
+
+    def get_translator(engine, working_dir=None):
+        translator.created += 1
+        return translator
+
+    monkeypatch.setattr(TranslatorFactory, "get_translator", staticmethod(get_translator))
+    return tmp_path, translator
+
+
+def test_coalesced_run_deduplicates_segments_project_wide(project):
+    root, translator = project
+
+    written = TranslationCoordinator().translate_from_config(coalesce=True)
+
+    assert len(written) == 12
+    assert sorted(target for target, _ in translator.calls) == ["de", "fr"]
+    for _, texts in translator.calls:
+        assert sorted(texts) == sorted(["Save", "Cancel"] + [f"Page {i}" for i in range(5)])
+
+    out = json.loads((root / "locales" / "fr" / "page_3.json").read_text(encoding="utf-8"))
+    assert out == {"save": "fr:Save", "cancel": "fr:Cancel", "title": "fr:Page 3"}
+
+
+def test_coalesced_run_matches_per_file_run(project):
+    root, translator = project
+
+    TranslationCoordinator().translate_from_config(coalesce=True)
+    coalesced = {p.relative_to(root): p.read_text(encoding="utf-8") for p in root.glob("locales/[!e]*/*.json")}
+
+    for p in [*root.glob("locales/[!e]*/*.json"), *root.glob("templates/*_index.html")]:
+        p.unlink()
+    (root / ".transctl" / "store.sqlite").unlink()
+
+    TranslationCoordinator().translate_from_config()
+    per_file = {p.relative_to(root): p.read_text(encoding="utf-8") for p in root.glob("locales/[!e]*/*.json")}
+
+    assert coalesced == per_file
+
+
+def test_translator_is_created_once_per_run(project):
+    root, translator = project
+
+    TranslationCoordinator().translate_from_config()
+
+    assert translator.created == 1
+    assert (root / "templates" / "fr_index.html").read_text(encoding="utf-8") == "<p>fr:Save</p>"
+
+
+@pytest.mark.parametrize("coalesce", [False, True])
+def test_multi_process_run_matches_single_process_run(project, coalesce):
+    root, translator = project
+
+    written = TranslationCoordinator().translate_from_config(processes=2, coalesce=coalesce)
+    outputs = {p.relative_to(root): p.read_text(encoding="utf-8") for p in root.glob("**/*") if p.is_file() and p.parent.name != ".transctl"}
+
+    for p in [*root.glob("locales/[!e]*/*.json"), *root.glob("templates/*_index.html")]:
+        p.unlink()
+    (root / ".transctl" / "store.sqlite").unlink()
+
+    assert TranslationCoordinator().translate_from_config(coalesce=coalesce) == written
+    assert len(written) == 12
+    assert outputs == {p.relative_to(root): p.read_text(encoding="utf-8") for p in root.glob("**/*") if p.is_file() and p.parent.name != ".transctl"}
+
+
+def test_glossary_is_loaded_once_per_run(project):
+    root, translator = project
+    (root / "glossary.json").write_text(json.dumps({"Save": "Enregistrer"}), encoding="utf-8")
+
+    TranslationCoordinator().translate_from_config(glossary=str(root / "glossary.json"))
+
+    assert len(translator.glossaries) > 1
+    assert all(g is translator.glossaries[0] for g in translator.glossaries)
+    assert dict(translator.glossaries[0].entries) == {"Save": "Enregistrer"}
+
+
+def test_glossary_edit_only_retranslates_segments_with_changed_terms(project):
+    root, translator = project
+    glossary = root / "glossary.json"
+    glossary.write_text(json.dumps({"Save": "Enregistrer", "Cancel": "Annuler"}), encoding="utf-8")
+    TranslationCoordinator().translate_from_config(glossary=str(glossary))
+
+    glossary.write_text(json.dumps({"Save": "Sauvegarder", "Cancel": "Annuler", "Page": "Feuille"}), encoding="utf-8")
+    for p in [*root.glob("locales/[!e]*/*.json"), *root.glob("templates/*_index.html")]:
+        p.unlink()
+    translator.calls.clear()
+    TranslationCoordinator().translate_from_config(glossary=str(glossary))
+
+    sent = sorted({text for _, texts in translator.calls for text in texts})
+    assert sent == ["Page 0", "Page 1", "Page 2", "Page 3", "Page 4", "Save"]
+
+
+
+@pytest.mark.parametrize("options", [{}, {"coalesce": True}, {"processes": 2}])
+def test_glossary_edit_outdates_the_outputs_of_unchanged_sources(project, options):
+    root, translator = project
+    # Written HTML outputs match the template pattern and would be picked up as sources by the next run.
+    (root / "templates" / "index.html").unlink()
+    glossary = root / "glossary.json"
+    glossary.write_text(json.dumps({"Save": "Enregistrer", "Cancel": "Annuler"}), encoding="utf-8")
+    TranslationCoordinator().translate_from_config(glossary=str(glossary), **options)
+
+    translator.calls.clear()
+    TranslationCoordinator().translate_from_config(glossary=str(glossary), **options)
+    assert translator.calls == []
+
+    glossary.write_text(json.dumps({"Save": "Sauvegarder", "Cancel": "Annuler"}), encoding="utf-8")
+    written = TranslationCoordinator().translate_from_config(glossary=str(glossary), **options)
+
+    assert len(written) == 10
+    assert sorted(target for target, _ in translator.calls) == ["de", "fr"]
+    assert all(texts == ["Save"] for _, texts in translator.calls)
+
+    translator.calls.clear()
+    TranslationCoordinator().translate_from_config(**options)
+    assert sorted(target for target, _ in translator.calls) == ["de", "fr"]
+    assert all(sorted(texts) == ["Cancel", "Save"] for _, texts in translator.calls)
+
+@pytest.mark.parametrize("overrides", [{"jobs": 2}, {"processes": 2}])
+def test_command_line_overrides_keep_the_configured_stream_threshold(project, monkeypatch, overrides):
+    root, translator = project
+    with (root / ".transctl.toml").open("a", encoding="utf-8") as f:
+        f.write("\n[performance]\nstream_threshold_mb = 1\n")
+    big = {f"key_{i}": f"Label {i % 50}" for i in range(60_000)}
+    (root / "locales" / "en" / "big.json").write_text(json.dumps(big), encoding="utf-8")
+
+    streamed = []
+    translate_stream = JsonTranslationTranslationHandler.translate_stream
+
+    def spy(self, session, source, pending, glossary=None):
+        streamed.append(source.path.name)
+        return translate_stream(self, session, source, pending, glossary)
+
+    monkeypatch.setattr(JsonTranslationTranslationHandler, "translate_stream", spy)
+
+    TranslationCoordinator().translate_from_config(**overrides)
+
+    assert streamed == ["big.json"]
+    out = json.loads((root / "locales" / "fr" / "big.json").read_text(encoding="utf-8"))
+    assert out["key_51"] == "fr:Label 1"
+
+
+def test_multi_process_run_does_not_hold_the_content_of_outdated_sources(project, monkeypatch):
+    root, translator = project
+    held = []
+    map_ = ExtractionPool.map
+
+    def spy(self, jobs):
+        held.extend(name for _, source in jobs for name in ("data", "text") if name in source.__dict__)
+        return map_(self, jobs)
+
+    monkeypatch.setattr(ExtractionPool, "map", spy)
+
+    written = TranslationCoordinator().translate_from_config(processes=2)
+
+    assert len(written) == 12
+    assert held == []
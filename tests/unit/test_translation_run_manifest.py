@@ -0,0 +1,123 @@
+from pathlib import Path
+
+from transctl.core import source_file
+from transctl.core.configuration_manager import ConfigurationManager
+from transctl.core.source_file import SourceFile
+from transctl.core.translation_run_manifest import TranslationRunManifest
+
+import pytest
+
+
+CONFIG = """
+[locale]
+source = "en"
+targets = ["fr"]
+
+[engine]
+provider = "deepl"
+
+[resources.json]
+dirs = [{ path = "locales/[source]/*.json" }]
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("DEEPL_API_KEY", "test-key")
+    (tmp_path / ".transctl.toml").write_text(CONFIG, encoding="utf-8")
+
+    for lang in ("en", "fr"):
+        (tmp_path / "locales" / lang).mkdir(parents=True)
+        (tmp_path / "locales" / lang / "app.json").write_text(f'{{"title": "{lang}"}}', encoding="utf-8")
+
+    TranslationRunManifest(ConfigurationManager()).rebuild_from_config(force=True)
+    return tmp_path
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    calls = []
+    original_read_bytes = source_file.read_bytes
+    original_iter_text = source_file.iter_text
+
+    def counting_read_bytes(file):
+        calls.append(Path(file).name)
+        return original_read_bytes(file)
+
+    def counting_iter_text(file):
+        calls.append(Path(file).name)
+        return original_iter_text(file)
+
+    monkeypatch.setattr(source_file, "read_bytes", counting_read_bytes)
+    monkeypatch.setattr(source_file, "iter_text", counting_iter_text)
+    return calls
+
+
+def test_unchanged_files_are_not_reread(project, reads):
+    manifest = TranslationRunManifest(ConfigurationManager())
+
+    manifest.bind_source(Path("locales/en/app.json"))
+    assert manifest.is_output_valid(Path("locales/fr/app.json"))
+    assert reads == []
+
+
+def test_paranoid_rehashes_every_file(project, reads):
+    manifest = TranslationRunManifest(ConfigurationManager(), paranoid=True)
+
+    manifest.bind_source(Path("locales/en/app.json"))
+    assert manifest.is_output_valid(Path("locales/fr/app.json"))
+    assert reads == ["app.json", "app.json"]
+
+
+def test_edited_output_is_invalid(project):
+    (project / "locales" / "fr" / "app.json").write_text('{"title": "edited"}', encoding="utf-8")
+    manifest = TranslationRunManifest(ConfigurationManager())
+
+    manifest.bind_source(Path("locales/en/app.json"))
+    assert not manifest.is_output_valid(Path("locales/fr/app.json"))
+
+
+def test_incremental_rebuild_only_rehashes_touched_files(project, reads):
+    (project / "locales" / "en" / "other.json").write_text('{"a": "b"}', encoding="utf-8")
+    manifest = TranslationRunManifest(ConfigurationManager())
+    reads.clear()
+
+    manifest.bind_source(Path("locales/en/other.json"))
+    (project / "locales" / "fr" / "other.json").write_text('{"a": "fr"}', encoding="utf-8")
+    manifest.record_output(Path("locales/fr/other.json"))
+    manifest.update_required = True
+    manifest.rebuild_from_config()
+
+    assert sorted(reads) == ["other.json", "other.json"]
+
+    reloaded = TranslationRunManifest(ConfigurationManager())
+    for name in ("app.json", "other.json"):
+        reloaded.bind_source(Path("locales/en") / name)
+        assert reloaded.is_output_valid(Path("locales/fr") / name)
+
+
+def test_incremental_and_full_rebuilds_agree(project):
+    (project / "locales" / "en" / "app.json").write_text('{"title": "changed"}', encoding="utf-8")
+    (project / "locales" / "fr" / "app.json").write_text('{"title": "changé"}', encoding="utf-8")
+
+    manifest = TranslationRunManifest(ConfigurationManager())
+    manifest.bind_source(Path("locales/en/app.json"))
+    manifest.record_output(Path("locales/fr/app.json"))
+    manifest.update_required = True
+    manifest.rebuild_from_config()
+    incremental = (project / ".transctl" / "translation_manifest.json").read_text(encoding="utf-8")
+
+    TranslationRunManifest(ConfigurationManager(), paranoid=True).rebuild_from_config(force=True)
+    full = (project / ".transctl" / "translation_manifest.json").read_text(encoding="utf-8")
+
+    assert incremental == full
+
+
+def test_bound_source_shares_its_read(project, reads):
+    manifest = TranslationRunManifest(ConfigurationManager(), paranoid=True)
+    source = SourceFile(Path("locales/en/app.json"))
+
+    manifest.bind_source(source)
+    assert source.json == {"title": "en"}
+    assert reads == ["app.json"]